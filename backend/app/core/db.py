@@ -3,21 +3,37 @@ import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Any, Dict, Optional
 
 import asyncpg
 from asyncpg import Pool
+from fastapi import Depends, Request
+
+from app.core.pool_metrics import (
+    InstrumentedPool,
+    PoolMetrics,
+    get_acquire_timeout,
+    primary_pool_metrics,
+    replica_pool_metrics,
+)
+from app.core.query_budget import apply_query_budget
+from app.core.read_routing import read_routing
 
 logger = logging.getLogger(__name__)
 
 _pool: Optional[Pool] = None
+_read_pool: Optional[Pool] = None
+_ready = False
+_draining = False
+_init_lock = asyncio.Lock()
+_read_init_lock = asyncio.Lock()
 
 
 async def get_db_pool() -> Pool:
     """Get or create the database connection pool.
     
     Returns:
-        Pool: The database connection pool
+        Pool: The database connection pool (instrumented wrapper)
         
     Raises:
         ValueError: If DATABASE_URL is not set
@@ -28,25 +44,69 @@ async def get_db_pool() -> Pool:
     if _pool is not None:
         return _pool
     
+    if _draining:
+        raise RuntimeError("Database pool is shutting down")
+    
     database_url = os.getenv("DATABASE_URL")
     if not database_url:
         raise ValueError("DATABASE_URL environment variable is not set")
     
-    max_retries = 3
+    _pool = await _create_pool(database_url, primary_pool_metrics, max_retries=3)
+    return _pool
+
+
+def get_pool_settings() -> Dict[str, Any]:
+    """Build asyncpg.create_pool keyword arguments from the environment.
+    
+    DB_POOLER_MODE=pgbouncer targets a PgBouncer in transaction mode: a
+    server connection can change between transactions, so asyncpg's named
+    prepared statements are turned off (statement_cache_size=0) and queries
+    go out as unnamed statements. PgBouncer >= 1.21 with
+    max_prepared_statements can keep the cache by setting
+    DB_STATEMENT_CACHE_SIZE explicitly.
+    
+    Returns:
+        Keyword arguments for asyncpg.create_pool
+        
+    Raises:
+        ValueError: If the settings are inconsistent
+    """
+    pooler_mode = os.getenv("DB_POOLER_MODE", "direct").strip().lower()
+    if pooler_mode not in ("direct", "pgbouncer"):
+        raise ValueError(f"DB_POOLER_MODE must be 'direct' or 'pgbouncer', got {pooler_mode!r}")
+    
+    default_cache_size = "0" if pooler_mode == "pgbouncer" else "100"
+    settings: Dict[str, Any] = {
+        "min_size": int(os.getenv("DB_POOL_MIN", "5")),
+        "max_size": int(os.getenv("DB_POOL_MAX", "20")),
+        "command_timeout": float(os.getenv("DB_COMMAND_TIMEOUT_SECONDS", "60")),
+        "max_queries": int(os.getenv("DB_POOL_MAX_QUERIES", "50000")),
+        "max_inactive_connection_lifetime": float(os.getenv("DB_POOL_MAX_INACTIVE_LIFETIME_SECONDS", "300")),
+        "statement_cache_size": int(os.getenv("DB_STATEMENT_CACHE_SIZE", default_cache_size)),
+    }
+    
+    if settings["min_size"] > settings["max_size"]:
+        raise ValueError("DB_POOL_MIN must not exceed DB_POOL_MAX")
+    
+    return settings
+
+
+async def _create_pool(dsn: str, metrics: PoolMetrics, max_retries: int, **overrides: Any) -> Pool:
+    """Create an instrumented pool, retrying connection failures with backoff.
+    
+    Acquires are recorded in metrics (one PoolMetrics per pool). Keyword
+    overrides are passed to asyncpg.create_pool on top of get_pool_settings().
+    """
     retry_delay = 1.0
     
     for attempt in range(max_retries):
         try:
             logger.info(f"Creating database connection pool (attempt {attempt + 1}/{max_retries})")
-            _pool = await asyncpg.create_pool(
-                database_url,
-                min_size=5,
-                max_size=20,
-                command_timeout=60,
-                max_queries=50000,
-            )
+            raw_pool = await asyncpg.create_pool(dsn, **{**get_pool_settings(), **overrides})
+            # Every acquire() records wait/hold time per route (see pool_metrics)
+            pool = InstrumentedPool(raw_pool, metrics, get_acquire_timeout())
             logger.info("Database connection pool created successfully")
-            return _pool
+            return pool
         except asyncpg.PostgresConnectionError as e:
             logger.error(f"Failed to create connection pool: {e}")
             if attempt < max_retries - 1:
@@ -58,6 +118,142 @@ async def get_db_pool() -> Pool:
                 raise
 
 
+async def get_read_pool() -> Optional[Pool]:
+    """Get or create the read-replica pool.
+    
+    Returns:
+        Pool for DATABASE_READ_URL, or None if no replica is configured, it
+        is currently marked unavailable, or it cannot be reached (callers
+        then read from the primary)
+    """
+    global _read_pool
+    
+    # A replica marked down is skipped even once its pool exists
+    if _draining or not read_routing.replica_available():
+        return None
+    
+    if _read_pool is not None:
+        return _read_pool
+    
+    read_url = os.getenv("DATABASE_READ_URL")
+    if not read_url:
+        return None
+    
+    async with _read_init_lock:
+        # Concurrent first reads create the pool once
+        if _read_pool is not None:
+            return _read_pool
+        if not read_routing.replica_available():
+            return None
+        try:
+            # Single attempt with a short connect timeout: a missing replica
+            # must not delay reads
+            _read_pool = await _create_pool(
+                read_url,
+                replica_pool_metrics,
+                max_retries=1,
+                timeout=float(os.getenv("DB_READ_CONNECT_TIMEOUT_SECONDS", "2")),
+            )
+        except Exception as e:
+            logger.warning(f"Read replica unavailable, reading from primary: {e}")
+            read_routing.mark_replica_down()
+            return None
+    return _read_pool
+
+
+async def init_db_pool() -> Pool:
+    """Create the pool, pre-warm it to min_size and health-check it.
+    
+    Called from the application lifespan so the first requests after a
+    deploy or scale-out do not pay connection setup. The instance reports
+    ready only after this succeeds.
+    
+    Returns:
+        Pool: The warmed database connection pool
+        
+    Raises:
+        RuntimeError: If a warm-up health check fails
+    """
+    global _ready, _draining
+    
+    async with _init_lock:
+        _draining = False
+        pool = await get_db_pool()
+        
+        async def _ping() -> Any:
+            async with pool.acquire() as connection:
+                return await connection.fetchval("SELECT 1")
+        
+        # Hold min_size connections at once so every one of them is opened and checked
+        results = await asyncio.gather(*(_ping() for _ in range(max(1, pool.get_min_size()))))
+        if any(result != 1 for result in results):
+            raise RuntimeError("Database pool warm-up health check failed")
+        
+        _ready = True
+        logger.info(f"Database connection pool warmed ({len(results)} connections)")
+        
+        # Open the replica pool too if configured; failure only means reads use the primary
+        await get_read_pool()
+        return pool
+
+
+def is_db_ready() -> bool:
+    """Whether the pool is warmed and the instance accepts traffic."""
+    return _ready and not _draining and _pool is not None
+
+
+def is_db_draining() -> bool:
+    """Whether the pool is draining for shutdown."""
+    return _draining
+
+
+def pool_stats() -> Dict[str, Any]:
+    """Return acquire/hold metrics and live size counts per pool.
+    
+    Returns:
+        Dict with "primary" and "replica" entries (see PoolMetrics.stats)
+    """
+    return {
+        "primary": primary_pool_metrics.stats(_pool),
+        "replica": replica_pool_metrics.stats(_read_pool),
+    }
+
+
+async def drain_db_pool(timeout: Optional[float] = None) -> None:
+    """Stop taking new work, wait for in-flight queries, then close the pool.
+    
+    Readiness flips to false first so the load balancer stops routing here.
+    asyncpg's Pool.close() refuses new acquires and waits for checked-out
+    connections to be released; after ``timeout`` seconds the remaining
+    connections are terminated. The replica pool, if any, is drained the
+    same way.
+    
+    Args:
+        timeout: Seconds to wait for in-flight work (DB_POOL_DRAIN_TIMEOUT_SECONDS by default)
+    """
+    global _pool, _read_pool, _ready, _draining
+    
+    _ready = False
+    _draining = True
+    
+    if timeout is None:
+        timeout = float(os.getenv("DB_POOL_DRAIN_TIMEOUT_SECONDS", "30"))
+    
+    pools = [(name, pool) for name, pool in (("primary", _pool), ("replica", _read_pool)) if pool is not None]
+    
+    for name, pool in pools:
+        logger.info(f"Draining {name} database connection pool")
+        try:
+            await asyncio.wait_for(pool.close(), timeout=timeout)
+            logger.info(f"{name.capitalize()} database connection pool closed")
+        except asyncio.TimeoutError:
+            logger.warning(f"{name.capitalize()} pool drain exceeded {timeout}s; terminating remaining connections")
+            pool.terminate()
+    
+    _pool = None
+    _read_pool = None
+
+
 async def close_db_pool() -> None:
     """Close the database connection pool."""
     global _pool
@@ -101,4 +297,240 @@ async def get_db_connection():
     """
     pool = await get_db_pool()
     async with pool.acquire() as connection:
-        yield connection
\ No newline at end of file
+        yield connection
+
+class _LazyTransaction:
+    """``handle.transaction()`` that checks out the connection on enter."""
+    
+    def __init__(self, handle: "RequestConnection", kwargs: Dict[str, Any]) -> None:
+        self._handle = handle
+        self._kwargs = kwargs
+        self._inner: Any = None
+    
+    async def __aenter__(self):
+        connection = await self._handle._acquire()
+        self._inner = connection.transaction(**self._kwargs)
+        return await self._inner.__aenter__()
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return await self._inner.__aexit__(exc_type, exc, tb)
+
+
+class RequestConnection:
+    """Lazy request-scoped connection handle.
+    
+    Auth and the route handler share one pooled connection per request.
+    Nothing is checked out until the first query (or transaction) runs, so
+    requests answered from caches or rejected by rate limits and validation
+    never touch the pool. ``release()`` returns the connection when the
+    request ends.
+    
+    Usage:
+        async with handle as conn:
+            result = await conn.fetch("SELECT * FROM users")
+    """
+    
+    def __init__(self, source: Any) -> None:
+        """Initialize handle.
+        
+        Args:
+            source: Un-entered connection context manager (get_db_connection())
+        """
+        self._source = source
+        self._connection = None
+        self._entered = False
+    
+    @property
+    def acquired(self) -> bool:
+        """Whether a pooled connection is currently held."""
+        return self._entered
+    
+    async def _acquire(self) -> Any:
+        """Check out the request's connection on first use."""
+        if not self._entered:
+            # Queries on the handle run under the route's budget (see query_budget)
+            self._connection = apply_query_budget(await self._source.__aenter__())
+            self._entered = True
+        return self._connection
+    
+    async def fetch(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await (await self._acquire()).fetch(query, *args, **kwargs)
+    
+    async def fetchrow(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await (await self._acquire()).fetchrow(query, *args, **kwargs)
+    
+    async def fetchval(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await (await self._acquire()).fetchval(query, *args, **kwargs)
+    
+    async def execute(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await (await self._acquire()).execute(query, *args, **kwargs)
+    
+    async def executemany(self, command: str, args: Any, **kwargs: Any) -> Any:
+        return await (await self._acquire()).executemany(command, args, **kwargs)
+    
+    def transaction(self, **kwargs: Any) -> _LazyTransaction:
+        """Start a transaction on the request's connection (use with ``async with``)."""
+        return _LazyTransaction(self, kwargs)
+    
+    async def use_primary(self) -> None:
+        """Make later queries run on the primary (this handle always does)."""
+        return None
+    
+    async def __aenter__(self):
+        # Entering the handle does not check out a connection
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        # Released at the end of the request, not per block
+        return None
+    
+    async def release(self) -> None:
+        """Return the connection to the pool if one was checked out."""
+        if self._entered:
+            self._entered = False
+            self._connection = None
+            await self._source.__aexit__(None, None, None)
+
+
+# Errors meaning the connection itself is gone, not that the query failed
+REPLICA_CONNECTION_ERRORS = (
+    asyncpg.ConnectionDoesNotExistError,
+    asyncpg.InterfaceError,
+    asyncpg.PostgresConnectionError,
+    ConnectionError,
+)
+
+
+class ReadRequestConnection(RequestConnection):
+    """Lazy request-scoped handle for read-only routes.
+    
+    The first query checks out a replica connection when DATABASE_READ_URL
+    is configured and reachable, otherwise a primary one. ``role`` tells
+    which was used. A query whose replica connection breaks marks the
+    replica down and is retried once on the primary.
+    """
+    
+    def __init__(self, source: Any) -> None:
+        """Initialize handle.
+        
+        Args:
+            source: Un-entered primary connection context manager (get_db_connection())
+        """
+        super().__init__(source)
+        self._primary_source = source
+        self._force_primary = False
+        self.role: Optional[str] = None
+    
+    async def _acquire(self) -> Any:
+        if self._entered:
+            return self._connection
+        
+        if not self._force_primary:
+            pool = await get_read_pool()
+            if pool is not None:
+                replica = pool.acquire()
+                try:
+                    self._connection = apply_query_budget(await replica.__aenter__())
+                except Exception as e:
+                    logger.warning(f"Read replica acquire failed, reading from primary: {e}")
+                    read_routing.mark_replica_down()
+                else:
+                    self._source = replica
+                    self._entered = True
+                    self.role = "replica"
+                    read_routing.replica_reads += 1
+                    return self._connection
+        
+        self._source = self._primary_source
+        self.role = "primary"
+        read_routing.primary_reads += 1
+        return await super()._acquire()
+    
+    async def _run(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        connection = await self._acquire()
+        if self.role != "replica":
+            return await getattr(connection, method)(*args, **kwargs)
+        try:
+            return await getattr(connection, method)(*args, **kwargs)
+        except REPLICA_CONNECTION_ERRORS as e:
+            logger.warning(f"Read replica connection lost, retrying on primary: {e}")
+            read_routing.mark_replica_down()
+            self._force_primary = True
+            try:
+                await self.release()
+            except Exception as release_error:
+                logger.warning(f"Releasing broken replica connection failed: {release_error}")
+                self._entered = False
+                self._connection = None
+            self.role = None
+            return await getattr(await self._acquire(), method)(*args, **kwargs)
+    
+    async def fetch(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("fetch", query, *args, **kwargs)
+    
+    async def fetchrow(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("fetchrow", query, *args, **kwargs)
+    
+    async def fetchval(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("fetchval", query, *args, **kwargs)
+    
+    async def execute(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("execute", query, *args, **kwargs)
+    
+    async def executemany(self, command: str, args: Any, **kwargs: Any) -> Any:
+        return await self._run("executemany", command, args, **kwargs)
+    
+    async def use_primary_for(self, user_id: str) -> None:
+        """Switch to the primary if user_id wrote recently (read-your-writes).
+        
+        Called once the caller is known. A replica connection already
+        checked out for authentication is returned first.
+        """
+        if not read_routing.is_pinned(user_id):
+            return
+        read_routing.pinned_reads += 1
+        await self.use_primary()
+    
+    async def use_primary(self) -> None:
+        """Run later queries on the primary (e.g. before a write on a read route).
+        
+        A replica connection already checked out is returned first.
+        """
+        self._force_primary = True
+        if self.role == "replica":
+            await self.release()
+            self.role = None
+
+
+async def get_request_connection(request: Request, source: Any = Depends(get_db_connection)):
+    """FastAPI dependency yielding the request's shared connection handle.
+    
+    FastAPI caches dependencies per request, so auth and the handler receive
+    the same handle and therefore the same pooled connection. After a
+    successful write the caller is pinned to the primary for reads.
+    
+    Yields:
+        RequestConnection: Handle released when the request finishes
+    """
+    handle = RequestConnection(source)
+    try:
+        yield handle
+        if request.method not in ("GET", "HEAD", "OPTIONS"):
+            user_id = getattr(request.state, "user_id", None)
+            if user_id:
+                read_routing.pin(user_id)
+    finally:
+        await handle.release()
+
+
+async def get_read_connection(source: Any = Depends(get_db_connection)):
+    """FastAPI dependency yielding a replica-preferring connection handle.
+    
+    Yields:
+        ReadRequestConnection: Handle released when the request finishes
+    """
+    handle = ReadRequestConnection(source)
+    try:
+        yield handle
+    finally:
+        await handle.release()
@@ -0,0 +1,213 @@
+"""Connection pool instrumentation (acquire wait, hold time, saturation)."""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from app.util.request_context import get_request_id, get_route
+
+logger = logging.getLogger(__name__)
+
+# Histogram upper bounds in milliseconds (cumulative, Prometheus style)
+BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram in milliseconds."""
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        """Record one observation."""
+        for i, bound in enumerate(BUCKETS_MS):
+            if value_ms <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.sum_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return cumulative bucket counts and summary values."""
+        buckets: Dict[str, int] = {}
+        running = 0
+        for bound, count in zip(BUCKETS_MS, self.counts):
+            running += count
+            buckets[f"le_{bound}"] = running
+        buckets["le_inf"] = running + self.counts[-1]
+        return {
+            "count": self.count,
+            "sumMs": round(self.sum_ms, 3),
+            "maxMs": round(self.max_ms, 3),
+            "buckets": buckets,
+        }
+
+
+class PoolMetrics:
+    """Acquire/hold metrics per route plus pool-wide saturation counters."""
+
+    def __init__(self, slow_hold_ms: float = 500.0):
+        """Initialize pool metrics.
+
+        Args:
+            slow_hold_ms: Holds longer than this are logged with the request id
+        """
+        self.slow_hold_ms = slow_hold_ms
+        self.wait = Histogram()
+        self.hold = Histogram()
+        self.routes: Dict[str, Dict[str, Histogram]] = {}
+        self.acquires = 0
+        self.acquire_timeouts = 0
+        self.slow_holds = 0
+        self.in_use = 0
+
+    def _route(self, route: str) -> Dict[str, Histogram]:
+        entry = self.routes.get(route)
+        if entry is None:
+            entry = {"wait": Histogram(), "hold": Histogram()}
+            self.routes[route] = entry
+        return entry
+
+    def record_wait(self, route: str, wait_ms: float) -> None:
+        """Record a successful acquire."""
+        self.acquires += 1
+        self.in_use += 1
+        self.wait.observe(wait_ms)
+        self._route(route)["wait"].observe(wait_ms)
+
+    def record_timeout(self, route: str) -> None:
+        """Record an acquire that timed out."""
+        self.acquire_timeouts += 1
+        logger.warning(f"request_id={get_request_id()} route={route} pool_acquire_timeout")
+
+    def record_hold(self, route: str, hold_ms: float) -> None:
+        """Record a connection release."""
+        self.in_use = max(0, self.in_use - 1)
+        self.hold.observe(hold_ms)
+        self._route(route)["hold"].observe(hold_ms)
+        if hold_ms > self.slow_hold_ms:
+            self.slow_holds += 1
+            logger.warning(
+                f"request_id={get_request_id()} route={route} "
+                f"slow_pool_hold={hold_ms:.1f}ms threshold={self.slow_hold_ms:.0f}ms"
+            )
+
+    def stats(self, pool: Optional[Any] = None) -> Dict[str, Any]:
+        """Return metrics, including live size/idle counts if a pool is given."""
+        result: Dict[str, Any] = {
+            "acquires": self.acquires,
+            "acquireTimeouts": self.acquire_timeouts,
+            "slowHolds": self.slow_holds,
+            "slowHoldThresholdMs": self.slow_hold_ms,
+            "inUse": self.in_use,
+            "wait": self.wait.snapshot(),
+            "hold": self.hold.snapshot(),
+            "routes": {
+                route: {"wait": entry["wait"].snapshot(), "hold": entry["hold"].snapshot()}
+                for route, entry in sorted(self.routes.items())
+            },
+        }
+        if pool is not None:
+            try:
+                size = pool.get_size()
+                idle = pool.get_idle_size()
+                result.update({
+                    "size": size,
+                    "idle": idle,
+                    "minSize": pool.get_min_size(),
+                    "maxSize": pool.get_max_size(),
+                })
+            except Exception:
+                pass
+        return result
+
+    def reset(self) -> None:
+        """Reset all counters (for testing)."""
+        self.wait = Histogram()
+        self.hold = Histogram()
+        self.routes = {}
+        self.acquires = 0
+        self.acquire_timeouts = 0
+        self.slow_holds = 0
+        self.in_use = 0
+
+
+class _InstrumentedAcquire:
+    """Async context manager around Pool.acquire() that records timings."""
+
+    def __init__(self, pool: "InstrumentedPool", timeout: Optional[float]) -> None:
+        self._pool = pool
+        self._timeout = timeout
+        self._inner: Any = None
+        self._route = ""
+        self._acquired_at = 0.0
+
+    async def __aenter__(self):
+        metrics = self._pool.metrics
+        self._route = get_route()
+        started = time.perf_counter()
+        self._inner = self._pool.raw_pool.acquire(timeout=self._timeout)
+        try:
+            connection = await self._inner.__aenter__()
+        except asyncio.TimeoutError:
+            metrics.record_timeout(self._route)
+            raise
+        self._acquired_at = time.perf_counter()
+        metrics.record_wait(self._route, (self._acquired_at - started) * 1000)
+        return connection
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            return await self._inner.__aexit__(exc_type, exc, tb)
+        finally:
+            hold_ms = (time.perf_counter() - self._acquired_at) * 1000
+            self._pool.metrics.record_hold(self._route, hold_ms)
+
+
+class InstrumentedPool:
+    """asyncpg Pool wrapper whose acquire() feeds PoolMetrics.
+
+    Everything other than acquire() is delegated to the wrapped pool.
+    """
+
+    def __init__(self, raw_pool: Any, metrics: PoolMetrics, acquire_timeout: Optional[float] = None):
+        """Initialize wrapper.
+
+        Args:
+            raw_pool: asyncpg Pool
+            metrics: Metrics sink
+            acquire_timeout: Seconds to wait for a free connection (None waits forever)
+        """
+        self.raw_pool = raw_pool
+        self.metrics = metrics
+        self.acquire_timeout = acquire_timeout
+
+    def acquire(self, *, timeout: Optional[float] = None) -> _InstrumentedAcquire:
+        """Check out a connection (use with ``async with``)."""
+        return _InstrumentedAcquire(self, timeout if timeout is not None else self.acquire_timeout)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.raw_pool, name)
+
+
+def get_acquire_timeout() -> Optional[float]:
+    """Return DB_POOL_ACQUIRE_TIMEOUT_SECONDS (0 disables the timeout)."""
+    value = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT_SECONDS", "10"))
+    return value if value > 0 else None
+
+
+# Global metrics, one per pool created in app.core.db
+primary_pool_metrics = PoolMetrics(
+    slow_hold_ms=float(os.getenv("DB_POOL_SLOW_HOLD_MS", "500")),
+)
+replica_pool_metrics = PoolMetrics(
+    slow_hold_ms=float(os.getenv("DB_POOL_SLOW_HOLD_MS", "500")),
+)
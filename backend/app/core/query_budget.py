@@ -0,0 +1,151 @@
+"""Per-route query budgets enforced as asyncpg per-call timeouts.
+
+Budgets default to the p95 targets of the SLO table (docs/08 1.2), so a
+single pathological statement is cancelled at the route's budget instead
+of holding a connection for the pool-wide command_timeout. A cancelled
+statement surfaces as 503 with Retry-After.
+
+Per-call timeouts are used rather than ``SET LOCAL statement_timeout``
+because most repository calls run outside an explicit transaction and
+must stay safe behind a transaction-mode pooler.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+
+import asyncpg
+
+from app.util.errors import ServiceUnavailableException
+from app.util.request_context import get_request_id, route_var
+
+logger = logging.getLogger(__name__)
+
+# Route template -> budget in milliseconds (docs/08 1.2 p95 targets)
+DEFAULT_ROUTE_BUDGETS_MS: Dict[str, int] = {
+    "GET /api/v1/threads": 400,
+    "GET /api/v1/threads/{thread_id}": 300,
+    "GET /api/v1/threads/{thread_id}/comments": 350,
+    "POST /api/v1/threads": 500,
+    "POST /api/v1/threads/{thread_id}/comments": 450,
+    "POST /api/v1/threads/{thread_id}/reactions": 200,
+    "POST /api/v1/comments/{comment_id}/reactions": 200,
+}
+
+
+class QueryBudgets:
+    """Route budget lookup plus per-route timeout counters."""
+
+    def __init__(
+        self,
+        budgets_ms: Optional[Dict[str, int]] = None,
+        default_ms: int = 2000,
+        enabled: bool = True,
+    ):
+        """Initialize budgets.
+
+        Args:
+            budgets_ms: Route template -> budget in ms
+            default_ms: Budget for routes not listed (0 means no budget)
+            enabled: When False, no budgets are applied
+        """
+        self.budgets_ms = dict(DEFAULT_ROUTE_BUDGETS_MS if budgets_ms is None else budgets_ms)
+        self.default_ms = default_ms
+        self.enabled = enabled
+        self.timeouts: Dict[str, int] = {}
+
+    def budget_for(self, route: Optional[str]) -> Optional[float]:
+        """Return the per-call timeout in seconds for route, or None."""
+        if not self.enabled or route is None:
+            return None
+        budget_ms = self.budgets_ms.get(route, self.default_ms)
+        return budget_ms / 1000 if budget_ms > 0 else None
+
+    def record_timeout(self, route: str, budget: float) -> None:
+        """Count a statement cancelled by its route budget."""
+        self.timeouts[route] = self.timeouts.get(route, 0) + 1
+        logger.warning(
+            f"request_id={get_request_id()} route={route} "
+            f"query_budget_exceeded budget={budget * 1000:.0f}ms"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Return budgets and timeout counters for metrics."""
+        return {
+            "enabled": self.enabled,
+            "defaultMs": self.default_ms,
+            "budgetsMs": dict(sorted(self.budgets_ms.items())),
+            "timeouts": dict(sorted(self.timeouts.items())),
+            "totalTimeouts": sum(self.timeouts.values()),
+        }
+
+    def reset(self) -> None:
+        """Reset counters (for testing)."""
+        self.timeouts = {}
+
+
+class BudgetedConnection:
+    """Connection proxy that applies a timeout to every query call.
+
+    Calls that pass their own ``timeout`` keep it. Everything else
+    (transaction(), etc.) is delegated to the wrapped connection.
+    """
+
+    def __init__(self, connection: Any, budgets: QueryBudgets, route: str, timeout: float) -> None:
+        self.raw_connection = connection
+        self._budgets = budgets
+        self._route = route
+        self._timeout = timeout
+
+    async def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        kwargs.setdefault("timeout", self._timeout)
+        try:
+            return await getattr(self.raw_connection, method)(*args, **kwargs)
+        except (asyncio.TimeoutError, asyncpg.QueryCanceledError):
+            self._budgets.record_timeout(self._route, kwargs["timeout"])
+            raise ServiceUnavailableException("Request took too long, please retry", retry_after=1)
+
+    async def fetch(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._call("fetch", query, *args, **kwargs)
+
+    async def fetchrow(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._call("fetchrow", query, *args, **kwargs)
+
+    async def fetchval(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._call("fetchval", query, *args, **kwargs)
+
+    async def execute(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._call("execute", query, *args, **kwargs)
+
+    async def executemany(self, command: str, args: Any, **kwargs: Any) -> Any:
+        return await self._call("executemany", command, args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.raw_connection, name)
+
+
+def apply_query_budget(connection: Any) -> Any:
+    """Wrap connection with the current route's budget, if it has one."""
+    route = route_var.get()
+    timeout = query_budgets.budget_for(route)
+    if timeout is None:
+        return connection
+    return BudgetedConnection(connection, query_budgets, route, timeout)
+
+
+def _budgets_from_env() -> Dict[str, int]:
+    budgets = dict(DEFAULT_ROUTE_BUDGETS_MS)
+    overrides = os.getenv("DB_ROUTE_BUDGETS_MS")
+    if overrides:
+        budgets.update({route: int(ms) for route, ms in json.loads(overrides).items()})
+    return budgets
+
+
+# Global budgets applied by app.core.db request connections
+query_budgets = QueryBudgets(
+    budgets_ms=_budgets_from_env(),
+    default_ms=int(os.getenv("DB_DEFAULT_QUERY_BUDGET_MS", "2000")),
+    enabled=os.getenv("DB_QUERY_BUDGETS_ENABLED", "true").strip().lower() not in ("0", "false", "no", "off"),
+)
@@ -0,0 +1,94 @@
+"""Read-replica routing state: read-your-writes pins and replica health."""
+
+import os
+import time
+from typing import Any, Dict
+
+
+class ReadRouting:
+    """Decides whether a read may go to the replica.
+
+    A user who just wrote is pinned to the primary for ``pin_seconds`` so
+    they see their own write despite replica lag. A replica that failed to
+    connect is skipped for ``replica_retry_seconds`` instead of paying the
+    connect timeout on every read.
+
+    Pins live in this process only; with several instances, a follow-up read
+    served by another instance can still hit the replica inside the window.
+    """
+
+    def __init__(self, pin_seconds: float = 5.0, replica_retry_seconds: float = 30.0, max_pins: int = 10000):
+        """Initialize routing state.
+
+        Args:
+            pin_seconds: How long a writer's reads stay on the primary
+            replica_retry_seconds: How long an unavailable replica is skipped
+            max_pins: Upper bound on tracked writers (expired pins are pruned first)
+        """
+        self.pin_seconds = pin_seconds
+        self.replica_retry_seconds = replica_retry_seconds
+        self.max_pins = max_pins
+        # Store: user_id -> pinned_until (monotonic)
+        self._pins: Dict[str, float] = {}
+        self._replica_down_until = 0.0
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self.pinned_reads = 0
+        self.fallbacks = 0
+
+    def pin(self, user_id: str) -> None:
+        """Pin user_id's reads to the primary for the configured window."""
+        if self.pin_seconds <= 0:
+            return
+        now = time.monotonic()
+        if len(self._pins) >= self.max_pins:
+            self._pins = {uid: until for uid, until in self._pins.items() if until > now}
+            if len(self._pins) >= self.max_pins:
+                self._pins.pop(next(iter(self._pins)))
+        self._pins[user_id] = now + self.pin_seconds
+
+    def is_pinned(self, user_id: str) -> bool:
+        """Whether user_id wrote recently enough to need the primary."""
+        until = self._pins.get(user_id)
+        if until is None:
+            return False
+        if until <= time.monotonic():
+            del self._pins[user_id]
+            return False
+        return True
+
+    def mark_replica_down(self) -> None:
+        """Skip the replica for replica_retry_seconds."""
+        self.fallbacks += 1
+        self._replica_down_until = time.monotonic() + self.replica_retry_seconds
+
+    def replica_available(self) -> bool:
+        """Whether the replica may be tried."""
+        return time.monotonic() >= self._replica_down_until
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters for metrics."""
+        return {
+            "replicaReads": self.replica_reads,
+            "primaryReads": self.primary_reads,
+            "pinnedReads": self.pinned_reads,
+            "fallbacks": self.fallbacks,
+            "pinnedUsers": len(self._pins),
+            "replicaAvailable": self.replica_available(),
+        }
+
+    def reset(self) -> None:
+        """Reset all state (for testing)."""
+        self._pins.clear()
+        self._replica_down_until = 0.0
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self.pinned_reads = 0
+        self.fallbacks = 0
+
+
+# Global routing state used by app.core.db
+read_routing = ReadRouting(
+    pin_seconds=float(os.getenv("DB_READ_PRIMARY_PIN_SECONDS", "5")),
+    replica_retry_seconds=float(os.getenv("DB_READ_REPLICA_RETRY_SECONDS", "30")),
+)
@@ -0,0 +1,184 @@
+"""Background reconciler for the denormalized reply stats on threads.
+
+comment_count and last_reply_at are maintained by comment create/delete in
+the same transaction as the comment write; this job repairs any drift
+(rows created before the columns existed, manual fixes). It can also be
+run once by hand after adding the columns:
+    cd backend && uv run python -m app.jobs.comment_stats
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+from app.core import db
+from app.repositories.threads_repo import ThreadRepository
+from app.util.env import env_flag
+
+logger = logging.getLogger(__name__)
+
+
+class CommentStatsReconciler:
+    """Walks threads in id order, recomputing reply stats batch by batch.
+
+    Each batch is one statement on a freshly acquired connection followed
+    by a pause. A run checks at most max_batches_per_run batches and the
+    next run resumes where it stopped, wrapping around at the end, so the
+    whole table is covered over successive runs at a bounded rate.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = 3600.0,
+        batch_size: int = 500,
+        batch_pause_seconds: float = 0.1,
+        max_batches_per_run: int = 100,
+        enabled: bool = True,
+    ):
+        """Initialize reconciler.
+
+        Args:
+            interval_seconds: Time between reconcile runs
+            batch_size: Threads checked per statement
+            batch_pause_seconds: Pause between batches within a run
+            max_batches_per_run: Upper bound on batches per run
+            enabled: When False, start() does nothing
+        """
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.batch_pause_seconds = batch_pause_seconds
+        self.max_batches_per_run = max_batches_per_run
+        self.enabled = enabled
+        self._task: Optional[asyncio.Task] = None
+        # Keyset position carried across runs (None = start of table)
+        self.position: Optional[str] = None
+        self.runs = 0
+        self.sweeps_completed = 0
+        self.rows_repaired = 0
+        self.last_run_rows = 0
+        self.last_run_seconds = 0.0
+        self.last_error: Optional[str] = None
+
+    async def _reconcile_batch(self) -> int:
+        pool = await db.get_db_pool()
+        async with pool.acquire() as conn:
+            last_id, repaired = await ThreadRepository(conn).reconcile_comment_stats(
+                after_id=self.position, limit=self.batch_size
+            )
+        self.position = last_id
+        return repaired
+
+    async def run_once(self, *, max_batches: Optional[int] = None) -> int:
+        """Run a single reconcile pass.
+
+        Args:
+            max_batches: Override for max_batches_per_run
+
+        Returns:
+            Number of threads repaired in this run
+        """
+        started = time.monotonic()
+        repaired = 0
+        limit = max_batches if max_batches is not None else self.max_batches_per_run
+
+        try:
+            for _ in range(limit):
+                repaired += await self._reconcile_batch()
+                if self.position is None:
+                    # Past the last thread; next run starts over
+                    self.sweeps_completed += 1
+                    break
+                if self.batch_pause_seconds > 0:
+                    await asyncio.sleep(self.batch_pause_seconds)
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+            logger.error(f"Comment stats reconcile failed after {repaired} rows: {e}")
+
+        elapsed = time.monotonic() - started
+        self.runs += 1
+        self.rows_repaired += repaired
+        self.last_run_rows = repaired
+        self.last_run_seconds = elapsed
+
+        if repaired:
+            logger.info(f"comment_stats repaired={repaired} duration={elapsed:.3f}s")
+        return repaired
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.run_once()
+
+    def start(self) -> None:
+        """Start the periodic reconcile task (no-op if disabled or running)."""
+        if not self.enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Cancel the periodic reconcile task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return reconciler counters for metrics."""
+        return {
+            "enabled": self.enabled,
+            "running": self._task is not None,
+            "runs": self.runs,
+            "sweepsCompleted": self.sweeps_completed,
+            "rowsRepaired": self.rows_repaired,
+            "lastRunRows": self.last_run_rows,
+            "lastRunSeconds": round(self.last_run_seconds, 3),
+            "lastError": self.last_error,
+        }
+
+    def reset(self) -> None:
+        """Reset position and counters (for testing)."""
+        self.position = None
+        self.runs = 0
+        self.sweeps_completed = 0
+        self.rows_repaired = 0
+        self.last_run_rows = 0
+        self.last_run_seconds = 0.0
+        self.last_error = None
+
+
+# Global reconciler started from the application lifespan
+comment_stats_reconciler = CommentStatsReconciler(
+    interval_seconds=float(os.getenv("COMMENT_STATS_RECONCILE_INTERVAL_SECONDS", "3600")),
+    batch_size=int(os.getenv("COMMENT_STATS_RECONCILE_BATCH_SIZE", "500")),
+    batch_pause_seconds=float(os.getenv("COMMENT_STATS_RECONCILE_BATCH_PAUSE_SECONDS", "0.1")),
+    max_batches_per_run=int(os.getenv("COMMENT_STATS_RECONCILE_MAX_BATCHES", "100")),
+    enabled=env_flag("COMMENT_STATS_RECONCILE_ENABLED", "true"),
+)
+
+
+async def main() -> None:
+    """Reconcile every thread once (after adding the columns)."""
+    reconciler = CommentStatsReconciler(
+        batch_size=comment_stats_reconciler.batch_size,
+        batch_pause_seconds=comment_stats_reconciler.batch_pause_seconds,
+    )
+    try:
+        while True:
+            await reconciler.run_once(max_batches=1000)
+            if reconciler.last_error or reconciler.position is None:
+                break
+        logger.info(f"comment_stats done {reconciler.stats()}")
+    finally:
+        await db.close_db_pool()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
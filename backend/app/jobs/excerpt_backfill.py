@@ -0,0 +1,101 @@
+"""One-off backfill of threads.excerpt for rows created before the column.
+
+Run once after adding the column:
+    cd backend && uv run python -m app.jobs.excerpt_backfill
+
+Until a row is backfilled, the timeline falls back to computing its excerpt
+from body, so the job can run while the API is serving traffic.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+from app.core import db
+from app.repositories.threads_repo import ThreadRepository
+from app.schemas.threads import create_excerpt
+
+logger = logging.getLogger(__name__)
+
+
+class ExcerptBackfill:
+    """Fills missing thread excerpts in keyset-paginated batches.
+
+    Each batch reads (id, body) for up to batch_size rows and writes the
+    excerpts back on a freshly acquired connection, then pauses, so the
+    job never holds a pool slot or row locks for long.
+    """
+
+    def __init__(self, batch_size: int = 500, batch_pause_seconds: float = 0.1):
+        """Initialize backfill.
+
+        Args:
+            batch_size: Rows read and updated per batch
+            batch_pause_seconds: Pause between batches
+        """
+        self.batch_size = batch_size
+        self.batch_pause_seconds = batch_pause_seconds
+        self.rows_updated = 0
+        self.batches = 0
+        self.seconds_spent = 0.0
+
+    async def _run_batch(self, after_id: Optional[str]) -> Optional[str]:
+        pool = await db.get_db_pool()
+        async with pool.acquire() as conn:
+            repo = ThreadRepository(conn)
+            rows = await repo.list_missing_excerpts(after_id=after_id, limit=self.batch_size)
+            if not rows:
+                return None
+            await repo.set_excerpts(
+                excerpts=[(row["id"], create_excerpt(row["body"] or "", 120)) for row in rows]
+            )
+        self.batches += 1
+        self.rows_updated += len(rows)
+        return rows[-1]["id"] if len(rows) == self.batch_size else None
+
+    async def run(self) -> int:
+        """Backfill every thread that has no excerpt.
+
+        Returns:
+            Number of rows updated
+        """
+        started = time.monotonic()
+        after_id: Optional[str] = None
+
+        while True:
+            after_id = await self._run_batch(after_id)
+            if after_id is None:
+                break
+            logger.info(f"excerpt_backfill rows={self.rows_updated} last_id={after_id}")
+            if self.batch_pause_seconds > 0:
+                await asyncio.sleep(self.batch_pause_seconds)
+
+        self.seconds_spent = time.monotonic() - started
+        logger.info(f"excerpt_backfill done rows={self.rows_updated} duration={self.seconds_spent:.3f}s")
+        return self.rows_updated
+
+    def stats(self) -> Dict[str, Any]:
+        """Return backfill counters."""
+        return {
+            "rowsUpdated": self.rows_updated,
+            "batches": self.batches,
+            "secondsSpent": round(self.seconds_spent, 3),
+        }
+
+
+async def main() -> None:
+    backfill = ExcerptBackfill(
+        batch_size=int(os.getenv("EXCERPT_BACKFILL_BATCH_SIZE", "500")),
+        batch_pause_seconds=float(os.getenv("EXCERPT_BACKFILL_BATCH_PAUSE_SECONDS", "0.1")),
+    )
+    try:
+        await backfill.run()
+    finally:
+        await db.close_db_pool()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
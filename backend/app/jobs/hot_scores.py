@@ -0,0 +1,116 @@
+"""Background refresher for the commenter term of the hot score."""
+
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from app.core import db
+from app.repositories.threads_repo import ThreadRepository
+from app.util.env import env_flag
+
+logger = logging.getLogger(__name__)
+
+
+class HotScoreRefresher:
+    """Periodically recomputes uniq_commenters_3h into threads.hot_rank.
+
+    up_count changes update hot_rank in the reaction statement itself; only
+    the sliding 3h commenter window needs this refresh. Time decay needs no
+    refresh at all (see app.services.hot), so each run touches only threads
+    with recent comments or a count that is about to drop.
+    """
+
+    def __init__(self, interval_seconds: float = 60.0, enabled: bool = True):
+        """Initialize refresher.
+
+        Args:
+            interval_seconds: Time between refresh runs
+            enabled: When False, start() does nothing
+        """
+        self.interval_seconds = interval_seconds
+        self.enabled = enabled
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.rows_updated = 0
+        self.last_run_rows = 0
+        self.last_run_seconds = 0.0
+        self.last_error: Optional[str] = None
+
+    async def run_once(self) -> int:
+        """Run a single refresh.
+
+        Returns:
+            Number of threads whose ranking changed
+        """
+        started = time.monotonic()
+        updated = 0
+
+        try:
+            pool = await db.get_db_pool()
+            async with pool.acquire() as conn:
+                updated = await ThreadRepository(conn).refresh_hot_commenters(
+                    now=datetime.now(timezone.utc)
+                )
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+            logger.error(f"Hot score refresh failed: {e}")
+
+        elapsed = time.monotonic() - started
+        self.runs += 1
+        self.rows_updated += updated
+        self.last_run_rows = updated
+        self.last_run_seconds = elapsed
+        return updated
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.run_once()
+
+    def start(self) -> None:
+        """Start the periodic refresh task (no-op if disabled or running)."""
+        if not self.enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Cancel the periodic refresh task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return refresher counters for metrics."""
+        return {
+            "enabled": self.enabled,
+            "running": self._task is not None,
+            "runs": self.runs,
+            "rowsUpdated": self.rows_updated,
+            "lastRunRows": self.last_run_rows,
+            "lastRunSeconds": round(self.last_run_seconds, 3),
+            "lastError": self.last_error,
+        }
+
+    def reset(self) -> None:
+        """Reset counters (for testing)."""
+        self.runs = 0
+        self.rows_updated = 0
+        self.last_run_rows = 0
+        self.last_run_seconds = 0.0
+        self.last_error = None
+
+
+# Global refresher started from the application lifespan
+hot_score_refresher = HotScoreRefresher(
+    interval_seconds=float(os.getenv("HOT_SCORE_REFRESH_INTERVAL_SECONDS", "60")),
+    enabled=env_flag("HOT_SCORE_REFRESH_ENABLED", "true"),
+)
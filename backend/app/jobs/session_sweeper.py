@@ -0,0 +1,148 @@
+"""Background sweeper that deletes expired sessions."""
+
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from app.core import db
+from app.repositories.sessions_repo import SessionRepository
+from app.util.env import env_flag
+
+logger = logging.getLogger(__name__)
+
+
+class SessionSweeper:
+    """Periodically deletes expired sessions in small batches.
+
+    Every batch is its own short statement on a freshly acquired connection,
+    followed by a pause, so the sweeper never holds locks or a pool slot for
+    long and its delete rate is bounded by batch_size / batch_pause_seconds.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = 300.0,
+        batch_size: int = 500,
+        batch_pause_seconds: float = 0.1,
+        max_batches_per_run: int = 100,
+        enabled: bool = True,
+    ):
+        """Initialize session sweeper.
+
+        Args:
+            interval_seconds: Time between sweep runs
+            batch_size: Maximum rows deleted per statement
+            batch_pause_seconds: Pause between batches within a run
+            max_batches_per_run: Upper bound on batches per run
+            enabled: When False, start() does nothing
+        """
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.batch_pause_seconds = batch_pause_seconds
+        self.max_batches_per_run = max_batches_per_run
+        self.enabled = enabled
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.rows_deleted = 0
+        self.seconds_spent = 0.0
+        self.last_run_rows = 0
+        self.last_run_seconds = 0.0
+        self.last_error: Optional[str] = None
+
+    async def _delete_batch(self, now: datetime) -> int:
+        pool = await db.get_db_pool()
+        async with pool.acquire() as conn:
+            return await SessionRepository(conn).delete_expired_batch(
+                now=now, batch_size=self.batch_size
+            )
+
+    async def run_once(self) -> int:
+        """Run a single sweep.
+
+        Returns:
+            Number of sessions deleted in this run
+        """
+        started = time.monotonic()
+        now = datetime.now(timezone.utc)
+        deleted = 0
+
+        try:
+            for _ in range(self.max_batches_per_run):
+                count = await self._delete_batch(now)
+                deleted += count
+                if count < self.batch_size:
+                    break
+                if self.batch_pause_seconds > 0:
+                    await asyncio.sleep(self.batch_pause_seconds)
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+            logger.error(f"Session sweep failed after {deleted} rows: {e}")
+
+        elapsed = time.monotonic() - started
+        self.runs += 1
+        self.rows_deleted += deleted
+        self.seconds_spent += elapsed
+        self.last_run_rows = deleted
+        self.last_run_seconds = elapsed
+
+        if deleted:
+            logger.info(f"session_sweep deleted={deleted} duration={elapsed:.3f}s")
+        return deleted
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.run_once()
+
+    def start(self) -> None:
+        """Start the periodic sweep task (no-op if disabled or running)."""
+        if not self.enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Cancel the periodic sweep task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return sweeper counters for metrics."""
+        return {
+            "enabled": self.enabled,
+            "running": self._task is not None,
+            "runs": self.runs,
+            "rowsDeleted": self.rows_deleted,
+            "secondsSpent": round(self.seconds_spent, 3),
+            "lastRunRows": self.last_run_rows,
+            "lastRunSeconds": round(self.last_run_seconds, 3),
+            "lastError": self.last_error,
+        }
+
+    def reset(self) -> None:
+        """Reset counters (for testing)."""
+        self.runs = 0
+        self.rows_deleted = 0
+        self.seconds_spent = 0.0
+        self.last_run_rows = 0
+        self.last_run_seconds = 0.0
+        self.last_error = None
+
+
+# Global sweeper started from the application lifespan
+session_sweeper = SessionSweeper(
+    interval_seconds=float(os.getenv("SESSION_SWEEP_INTERVAL_SECONDS", "300")),
+    batch_size=int(os.getenv("SESSION_SWEEP_BATCH_SIZE", "500")),
+    batch_pause_seconds=float(os.getenv("SESSION_SWEEP_BATCH_PAUSE_SECONDS", "0.1")),
+    max_batches_per_run=int(os.getenv("SESSION_SWEEP_MAX_BATCHES", "100")),
+    enabled=env_flag("SESSION_SWEEP_ENABLED", "true"),
+)
@@ -2,15 +2,21 @@ import os
 import uuid
 import time
 import logging
+from contextlib import asynccontextmanager
 from typing import Callable
-from fastapi import FastAPI, Request, Response, HTTPException
+from fastapi import Depends, FastAPI, Request, Response, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from app.core import db
+from app.jobs.comment_stats import comment_stats_reconciler
+from app.jobs.hot_scores import hot_score_refresher
+from app.jobs.session_sweeper import session_sweeper
 from app.routers import auth, health, threads, profile, comments, reactions, solve
+from app.util.request_context import bind_route, request_id_var
 from app.util.errors import (
     BaseAPIException,
     api_exception_handler,
@@ -24,11 +30,35 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the DB pool and start background jobs; drain both on shutdown."""
+    try:
+        await db.init_db_pool()
+    except Exception as e:
+        # Stay up but not ready; /health/ready retries the warm-up
+        logger.error(f"Database pool warm-up failed: {e}")
+    
+    session_sweeper.start()
+    hot_score_refresher.start()
+    comment_stats_reconciler.start()
+    try:
+        yield
+    finally:
+        await comment_stats_reconciler.stop()
+        await hot_score_refresher.stop()
+        await session_sweeper.stop()
+        await db.drain_db_pool()
+
+
 app = FastAPI(
     title="Kyudai Campus SNS API",
     version="1.0.0",
     docs_url="/api/v1/docs",
-    openapi_url="/api/v1/openapi.json"
+    openapi_url="/api/v1/openapi.json",
+    lifespan=lifespan,
+    dependencies=[Depends(bind_route)]
 )
 
 
@@ -39,6 +69,7 @@ class RequestIdMiddleware(BaseHTTPMiddleware):
             request_id = str(uuid.uuid4())
         
         request.state.request_id = request_id
+        request_id_var.set(request_id)
         response = await call_next(request)
         response.headers["X-Request-Id"] = request_id
         return response
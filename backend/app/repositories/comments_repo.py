@@ -52,36 +52,39 @@ class CommentRepository:
             now_utc = self._now_utc()
             
             try:
-                # Insert comment into database with RETURNING
-                insert_query = """
-                    INSERT INTO comments (
-                        id, thread_id, author_id, body, created_at
+                # Insert comment and bump the thread's reply counters atomically
+                async with self._db.transaction():
+                    insert_query = """
+                        INSERT INTO comments (
+                            id, thread_id, author_id, body, created_at
+                        )
+                        VALUES ($1, $2, $3, $4, $5::timestamptz)
+                        RETURNING id, created_at
+                    """
+
+                    result = await self._db.fetchrow(
+                        insert_query,
+                        comment_id,     # $1
+                        thread_id,      # $2
+                        author_id,      # $3
+                        body,          # $4
+                        now_utc        # $5
+                    )
+
+                    # Update thread's last_activity_at and denormalized reply stats
+                    update_query = """
+                        UPDATE threads
+                        SET last_activity_at = $2::timestamptz,
+                            comment_count = comment_count + 1,
+                            last_reply_at = GREATEST(last_reply_at, $2::timestamptz)
+                        WHERE id = $1
+                    """
+
+                    await self._db.execute(
+                        update_query,
+                        thread_id,     # $1
+                        now_utc        # $2
                     )
-                    VALUES ($1, $2, $3, $4, $5::timestamptz)
-                    RETURNING id, created_at
-                """
-                
-                result = await self._db.fetchrow(
-                    insert_query,
-                    comment_id,     # $1
-                    thread_id,      # $2
-                    author_id,      # $3
-                    body,          # $4
-                    now_utc        # $5
-                )
-                
-                # Update thread's last_activity_at
-                update_query = """
-                    UPDATE threads 
-                    SET last_activity_at = $2::timestamptz
-                    WHERE id = $1
-                """
-                
-                await self._db.execute(
-                    update_query,
-                    thread_id,     # $1
-                    now_utc        # $2
-                )
                 
                 # Return the created comment ID
                 return result["id"]
@@ -174,6 +177,40 @@ class CommentRepository:
             # Re-raise database exceptions for proper error handling upstream
             raise
 
+    async def get_thread_comment(
+        self,
+        *,
+        thread_id: str,
+        comment_id: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Get one live comment of a thread, shaped like list_comments_by_thread rows.
+        
+        Args:
+            thread_id: ID of the parent thread
+            comment_id: ID of the comment
+            
+        Returns:
+            Comment record as dictionary, or None if not found, deleted or
+            not on this thread
+        """
+        query = """
+            SELECT
+                c.id,
+                c.body,
+                c.up_count,
+                c.created_at,
+                CASE WHEN u.faculty_public AND u.faculty IS NOT NULL THEN u.faculty END AS author_faculty,
+                CASE WHEN u.year_public AND u.year IS NOT NULL THEN u.year END AS author_year
+            FROM comments c
+            JOIN users u ON u.id = c.author_id
+            WHERE c.id = $1
+            AND c.thread_id = $2
+            AND c.deleted_at IS NULL
+        """
+        
+        row = await self._db.fetchrow(query, comment_id, thread_id)
+        return dict(row) if row else None
+
     async def soft_delete_comment(
         self,
         *,
@@ -199,20 +236,36 @@ class CommentRepository:
             WHERE id = $2 
             AND author_id = $3 
             AND deleted_at IS NULL
-            RETURNING id
+            RETURNING id, thread_id
+        """
+
+        # Recount from the remaining live comments (index backward scan on
+        # idx_comments_alive_thread_created) rather than trusting the deleted row
+        thread_query = """
+            UPDATE threads
+            SET comment_count = GREATEST(comment_count - 1, 0),
+                last_reply_at = (
+                    SELECT MAX(created_at) FROM comments
+                    WHERE thread_id = $1 AND deleted_at IS NULL
+                )
+            WHERE id = $1
         """
         
         try:
-            # Execute update and check if any row was affected
-            result = await self._db.fetchrow(
-                query,
-                now_utc,      # $1 - deleted_at timestamp
-                comment_id,   # $2 - comment ID
-                author_id     # $3 - author ID (ownership check)
-            )
-            
-            # Return True if a row was updated, False otherwise
-            return result is not None
+            async with self._db.transaction():
+                # Execute update and check if any row was affected
+                result = await self._db.fetchrow(
+                    query,
+                    now_utc,      # $1 - deleted_at timestamp
+                    comment_id,   # $2 - comment ID
+                    author_id     # $3 - author ID (ownership check)
+                )
+
+                if result is None:
+                    return False
+
+                await self._db.execute(thread_query, result["thread_id"])
+                return True
             
         except Exception as e:
             # Re-raise database exceptions for proper error handling upstream
@@ -0,0 +1,49 @@
+"""Ranking snapshot repository (frozen ordered ID lists for hot/search paging)."""
+
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+
+
+class RankingSnapshotRepository:
+    """Repository for ranking snapshots (ranking_snapshots table)."""
+
+    def __init__(self, db: Any) -> None:
+        """Initialize with database connection."""
+        self._db = db
+
+    async def get(self, *, ranking: str, snapshot_at: datetime) -> Optional[List[str]]:
+        """Return the frozen ID list for (ranking, snapshot_at), or None."""
+        query = """
+            SELECT thread_ids FROM ranking_snapshots
+            WHERE ranking = $1 AND snapshot_at = $2
+        """
+        ids = await self._db.fetchval(query, ranking, snapshot_at)
+        return list(ids) if ids is not None else None
+
+    async def save(self, *, ranking: str, snapshot_at: datetime, ids: Sequence[str]) -> List[str]:
+        """Store a snapshot unless one exists; return the stored ID list.
+
+        When several instances build the same snapshot concurrently, the
+        first insert wins and every caller gets the winner's order. The
+        winner's row is read in a separate statement: a SELECT in the same
+        statement as the INSERT uses its snapshot, which predates a
+        concurrent winner's commit.
+        """
+        query = """
+            INSERT INTO ranking_snapshots (ranking, snapshot_at, thread_ids)
+            VALUES ($1, $2, $3)
+            ON CONFLICT (ranking, snapshot_at) DO NOTHING
+            RETURNING thread_ids
+        """
+        stored = await self._db.fetchval(query, ranking, snapshot_at, list(ids))
+        if stored is None:
+            stored = await self.get(ranking=ranking, snapshot_at=snapshot_at)
+        return list(stored) if stored is not None else list(ids)
+
+    async def delete_older_than(self, *, before: datetime) -> None:
+        """Delete snapshots taken before the given time."""
+        query = """
+            DELETE FROM ranking_snapshots
+            WHERE snapshot_at < $1
+        """
+        await self._db.execute(query, before)
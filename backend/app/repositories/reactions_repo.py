@@ -4,6 +4,7 @@ from __future__ import annotations
 import datetime
 from typing import Any, Dict, List, Optional, Literal
 
+from app.services.hot import hot_rank_sql
 from app.util.idgen import generate_id
 
 
@@ -77,9 +78,11 @@ class ReactionRepository:
             if rows_affected > 0:
                 # Increment up_count in the appropriate table
                 if target_type == 'thread':
-                    update_query = """
+                    # Keep the stored hot ranking key in step with up_count
+                    update_query = f"""
                         UPDATE threads 
-                        SET up_count = up_count + 1 
+                        SET up_count = up_count + 1,
+                            hot_rank = {hot_rank_sql("up_count + 1", "hot_uniq3h", "created_at")}
                         WHERE id = $1
                     """
                 else:  # target_type == 'comment'
@@ -0,0 +1,153 @@
+"""Session repository for bootstrap writes and session housekeeping."""
+
+from datetime import datetime
+from typing import Any, Optional
+
+
+class SessionRepository:
+    """Repository for session persistence (sessions table)."""
+
+    def __init__(self, db: Any) -> None:
+        """Initialize with database connection."""
+        self._db = db
+
+    async def delete_expired_batch(self, *, now: datetime, batch_size: int) -> int:
+        """Delete one batch of expired sessions, oldest first.
+
+        Rows are picked in (expires_at, id) order via idx_sessions_expires_at
+        and locked with SKIP LOCKED, so a batch never waits on rows another
+        transaction holds. Each call is a single short statement.
+
+        Args:
+            now: Sessions with expires_at before this are deleted
+            batch_size: Maximum number of rows to delete
+
+        Returns:
+            Number of rows deleted
+        """
+        query = """
+            WITH doomed AS (
+                SELECT id FROM sessions
+                WHERE expires_at < $1
+                ORDER BY expires_at, id
+                LIMIT $2
+                FOR UPDATE SKIP LOCKED
+            )
+            DELETE FROM sessions s
+            USING doomed
+            WHERE s.id = doomed.id
+        """
+
+        status = await self._db.execute(query, now, batch_size)
+        # asyncpg returns the command tag, e.g. "DELETE 500"
+        try:
+            return int(status.split()[-1])
+        except (AttributeError, IndexError, ValueError):
+            return 0
+
+    async def create_user_with_session(
+        self,
+        *,
+        user_id: str,
+        session_id: str,
+        token_hash: str,
+        expires_at: datetime,
+        now: datetime,
+    ) -> None:
+        """Create a new user and its first session in one statement."""
+        query = """
+            WITH new_user AS (
+                INSERT INTO users (id, role, created_at)
+                VALUES ($1, 'student', $5)
+                RETURNING id
+            )
+            INSERT INTO sessions (id, user_id, token_hash, expires_at, created_at)
+            SELECT $2, id, $3, $4, $5 FROM new_user
+        """
+        await self._db.execute(query, user_id, session_id, token_hash, expires_at, now)
+
+    async def bootstrap_device(
+        self,
+        *,
+        device_subject: str,
+        new_user_id: str,
+        credential_id: str,
+        now: datetime,
+        session_id: Optional[str] = None,
+        token_hash: Optional[str] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> str:
+        """Resolve (or create) the user for a device and optionally open a session.
+
+        The credential lookup uses the credentials (provider, subject) unique
+        index. A known device reuses its user and bumps last_used_at; an
+        unknown device gets a new user and credential. When session values
+        are given, the session row is inserted by the same statement.
+
+        Concurrent first bootstraps of one device converge on the same user
+        via ON CONFLICT; the loser's freshly inserted user row is left unused.
+
+        Args:
+            device_subject: Stable hash of the device secret
+            new_user_id: User ID to use if the device is unknown
+            credential_id: Credential ID to use if the device is unknown
+            now: Current timestamp
+            session_id: Session ID (optional)
+            token_hash: Session token hash (optional)
+            expires_at: Session expiry (optional)
+
+        Returns:
+            User ID owning the device
+        """
+        resolve = """
+            WITH existing AS (
+                SELECT user_id FROM credentials
+                WHERE provider = 'device' AND subject = $1
+            ),
+            new_user AS (
+                INSERT INTO users (id, role, created_at)
+                SELECT $2, 'student', $4
+                WHERE NOT EXISTS (SELECT 1 FROM existing)
+                RETURNING id
+            ),
+            cred AS (
+                INSERT INTO credentials (id, user_id, provider, subject, is_primary, created_at, last_used_at)
+                SELECT $3,
+                       COALESCE((SELECT user_id FROM existing), (SELECT id FROM new_user)),
+                       'device', $1, true, $4, $4
+                ON CONFLICT (provider, subject) DO UPDATE SET last_used_at = EXCLUDED.last_used_at
+                RETURNING user_id
+            )
+        """
+
+        if session_id is None:
+            query = resolve + "SELECT user_id FROM cred"
+            return await self._db.fetchval(query, device_subject, new_user_id, credential_id, now)
+
+        query = resolve + """,
+            new_session AS (
+                INSERT INTO sessions (id, user_id, token_hash, expires_at, created_at)
+                SELECT $5, user_id, $6, $7, $4 FROM cred
+                RETURNING user_id
+            )
+            SELECT user_id FROM new_session
+        """
+        return await self._db.fetchval(
+            query, device_subject, new_user_id, credential_id, now, session_id, token_hash, expires_at
+        )
+
+    async def create_session(
+        self,
+        *,
+        session_id: str,
+        user_id: str,
+        token_hash: str,
+        expires_at: datetime,
+        now: datetime,
+    ) -> None:
+        """Insert a session for an existing user."""
+        query = """
+            INSERT INTO sessions (id, user_id, token_hash, expires_at, created_at)
+            VALUES ($1, $2, $3, $4, $5)
+        """
+        await self._db.execute(query, session_id, user_id, token_hash, expires_at, now)
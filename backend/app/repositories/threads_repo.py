@@ -1,11 +1,46 @@
 from __future__ import annotations
 
+import datetime as _dt
 import re
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from app.schemas.threads import create_excerpt
 from app.services.cursor import encode, decode, CursorDecodeError
+from app.services.hot import UNIQ_WINDOW_HOURS, hot_rank_sql
 from app.util.idgen import generate_id
 
+# Columns a ThreadCard needs. body is only returned for rows whose excerpt
+# has not been backfilled yet, so timeline pages do not ship full bodies.
+THREAD_CARD_COLUMNS = """
+    id, author_id, title, excerpt,
+    CASE WHEN excerpt IS NULL THEN body END AS body,
+    up_count, save_count, solved_comment_id, heat,
+    comment_count, last_reply_at,
+    created_at, last_activity_at
+"""
+
+# Author affiliation, filtered by the author's privacy flags (users alias u)
+AUTHOR_AFFILIATION_COLUMNS = """
+    CASE WHEN u.faculty_public AND u.faculty IS NOT NULL THEN u.faculty END AS author_faculty,
+    CASE WHEN u.year_public AND u.year IS NOT NULL THEN u.year END AS author_year
+"""
+
+
+def _with_author(page_query: str, order_by: Optional[str] = None) -> str:
+    """Join author affiliation onto an already filtered and limited threads query.
+
+    The threads query runs as-is (keeping its keyset index plan and LIMIT),
+    so users is probed by primary key once per returned row only.
+    """
+    query = f"""
+        SELECT page.*, {AUTHOR_AFFILIATION_COLUMNS}
+        FROM ({page_query}) AS page
+        JOIN users u ON u.id = page.author_id
+    """
+    if order_by:
+        query += f"ORDER BY {order_by}\n"
+    return query
+
 
 class ThreadRepository:
     """Repository for thread persistence (DDL: threads table).
@@ -34,47 +69,40 @@ class ThreadRepository:
         author_id: str,
         title: str,
         body: str,
-        tags: Optional[Sequence[str]] = None,
+        tags: Optional[Sequence[Any]] = None,
         image_key: Optional[str] = None,
     ) -> str:
-        """Create a new thread and return the new thread id."""
+        """Create a new thread and return the new thread id.
+
+        The card excerpt is computed here once and stored with the row.
+        Tags (objects with key/value) are inserted in one multi-row
+        statement in the same transaction as the thread.
+        """
         max_retries = 3
+        excerpt = create_excerpt(body, 120)
+        # 種別 is denormalized into threads.kind for the type-filtered timelines
+        kind = next((tag.value for tag in tags or [] if tag.key == "種別"), None)
         
         for attempt in range(max_retries):
             # Generate new ID and timestamps
             thread_id = self._generate_thread_id()
             now = self._now_utc()
             
-            # Prepare INSERT query
-            query = """
-                INSERT INTO threads (
-                    id, author_id, title, body,
-                    created_at, last_activity_at, heat,
-                    up_count, save_count, solved_comment_id, deleted_at
-                )
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
-                RETURNING *
-            """
-            
             try:
-                # Execute insert
-                result = await self._db.fetchrow(
-                    query,
-                    thread_id,       # $1
-                    author_id,       # $2
-                    title,           # $3
-                    body,            # $4
-                    now,             # $5 - created_at
-                    now,             # $6 - last_activity_at
-                    0.0,             # $7 - heat (initial)
-                    0,               # $8 - up_count
-                    0,               # $9 - save_count
-                    None,            # $10 - solved_comment_id
-                    None             # $11 - deleted_at
-                )
+                if tags:
+                    async with self._db.transaction():
+                        result = await self._insert_thread_row(
+                            thread_id, author_id, title, body, now, excerpt, kind
+                        )
+                        await self._insert_tags(thread_id=thread_id, tags=tags)
+                else:
+                    # A single INSERT needs no explicit transaction
+                    result = await self._insert_thread_row(
+                        thread_id, author_id, title, body, now, excerpt, kind
+                    )
                 
-                # Note: tags and image_key will be handled in separate tables
-                # in later phases (thread_tags, attachments)
+                # Note: image_key will be handled in a separate table
+                # in later phases (attachments)
                 
                 return result["id"]
                 
@@ -95,11 +123,86 @@ class ThreadRepository:
         # Should not reach here, but just in case
         raise Exception("Failed to create thread after max retries")
 
-    async def get_thread_by_id(self, *, thread_id: str) -> Optional[dict]:
+    async def _insert_thread_row(
+        self,
+        thread_id: str,
+        author_id: str,
+        title: str,
+        body: str,
+        now: str,
+        excerpt: str,
+        kind: Optional[str],
+    ) -> Any:
+        query = """
+            INSERT INTO threads (
+                id, author_id, title, body,
+                created_at, last_activity_at, heat,
+                up_count, save_count, solved_comment_id, deleted_at,
+                excerpt, kind
+            )
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)
+            RETURNING *
+        """
+        return await self._db.fetchrow(
+            query,
+            thread_id,       # $1
+            author_id,       # $2
+            title,           # $3
+            body,            # $4
+            now,             # $5 - created_at
+            now,             # $6 - last_activity_at
+            0.0,             # $7 - heat (initial)
+            0,               # $8 - up_count
+            0,               # $9 - save_count
+            None,            # $10 - solved_comment_id
+            None,            # $11 - deleted_at
+            excerpt,         # $12 - excerpt
+            kind             # $13 - kind (種別 tag value)
+        )
+
+    async def _insert_tags(self, *, thread_id: str, tags: Sequence[Any]) -> None:
+        """Insert all tags of a thread in one statement."""
+        query = """
+            INSERT INTO tags (thread_id, key, value)
+            SELECT $1, t.key, t.value
+            FROM unnest($2::text[], $3::text[]) AS t(key, value)
+        """
+        await self._db.execute(
+            query,
+            thread_id,
+            [tag.key for tag in tags],
+            [tag.value for tag in tags],
+        )
+
+    async def get_tags_by_thread_ids(self, *, thread_ids: Sequence[str]) -> Dict[str, List[Dict[str, str]]]:
+        """Return tags for many threads in one query, grouped by thread id.
+        
+        Threads without tags are absent from the result. Tags keep the
+        fixed key order (種別, 場所, 締切, 授業コード).
+        """
+        if not thread_ids:
+            return {}
+        query = """
+            SELECT thread_id, key, value FROM tags
+            WHERE thread_id = ANY($1::text[])
+            ORDER BY thread_id, array_position(ARRAY['種別','場所','締切','授業コード'], key)
+        """
+        rows = await self._db.fetch(query, list(thread_ids))
+        tags_by_thread: Dict[str, List[Dict[str, str]]] = {}
+        for row in rows:
+            tags_by_thread.setdefault(row["thread_id"], []).append(
+                {"key": row["key"], "value": row["value"]}
+            )
+        return tags_by_thread
+
+    async def get_thread_by_id(self, *, thread_id: str, viewer_id: Optional[str] = None) -> Optional[dict]:
         """Return thread row (dict) or None if not found/soft-deleted.
         
         Args:
             thread_id: Thread ID in format thr_ULID
+            viewer_id: When given, the row also carries viewer_up/viewer_save,
+                whether that user has up/save reactions on the thread (probes
+                of the reactions unique key in the same statement)
             
         Returns:
             Thread data as dict if found and not deleted, None otherwise
@@ -109,14 +212,50 @@ class ThreadRepository:
             return None
         
         # Query for thread excluding soft-deleted ones
-        query = """
-            SELECT * FROM threads
-            WHERE id = $1 AND deleted_at IS NULL
+        if viewer_id is None:
+            query = _with_author("""
+                SELECT * FROM threads
+                WHERE id = $1 AND deleted_at IS NULL
+            """)
+            result = await self._db.fetchrow(query, thread_id)
+        else:
+            query = _with_author("""
+                SELECT t.*,
+                    EXISTS (
+                        SELECT 1 FROM reactions r
+                        WHERE r.user_id = $2 AND r.target_type = 'thread'
+                        AND r.target_id = t.id AND r.kind = 'up'
+                    ) AS viewer_up,
+                    EXISTS (
+                        SELECT 1 FROM reactions r
+                        WHERE r.user_id = $2 AND r.target_type = 'thread'
+                        AND r.target_id = t.id AND r.kind = 'save'
+                    ) AS viewer_save
+                FROM threads t
+                WHERE t.id = $1 AND t.deleted_at IS NULL
+            """)
+            result = await self._db.fetchrow(query, thread_id, viewer_id)
+        
+        # Convert to dict if found, otherwise return None
+        return dict(result) if result else None
+    
+    async def get_thread_version(self, *, thread_id: str) -> Optional[dict]:
+        """Return the columns that determine a thread's detail ETag, or None.
+        
+        A primary-key probe that skips body/title/tags, used to answer
+        If-None-Match without building the detail.
         """
+        if not self._is_valid_thread_id(thread_id):
+            return None
         
-        result = await self._db.fetchrow(query, thread_id)
+        query = _with_author("""
+            SELECT id, author_id, up_count, save_count,
+                   last_activity_at, solved_comment_id
+            FROM threads
+            WHERE id = $1 AND deleted_at IS NULL
+        """)
         
-        # Convert to dict if found, otherwise return None
+        result = await self._db.fetchrow(query, thread_id)
         return dict(result) if result else None
     
     def _is_valid_thread_id(self, thread_id: str) -> bool:
@@ -146,12 +285,18 @@ class ThreadRepository:
         *,
         cursor: Optional[str] = None,
         limit: int = 20,
+        kind: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Return items and nextCursor for timeline 'new'.
         
+        With kind, rows come from idx_threads_alive_kind_created in the same
+        (created_at DESC, id DESC) keyset order and the cursor records the
+        filter as "type".
+        
         Args:
             cursor: Optional cursor string for pagination
             limit: Number of items to return (default 20, max 200)
+            kind: Optional 種別 filter (question/notice/recruit/chat)
             
         Returns:
             Dict with 'items' list and optional 'nextCursor'
@@ -181,25 +326,29 @@ class ThreadRepository:
         # Build query
         if anchor_created_at and anchor_id:
             # With cursor: get threads before the anchor
-            query = """
-                SELECT * FROM threads
-                WHERE deleted_at IS NULL
+            kind_filter = "AND kind = $4" if kind else ""
+            query = _with_author(f"""
+                SELECT {THREAD_CARD_COLUMNS} FROM threads
+                WHERE deleted_at IS NULL {kind_filter}
                   AND (created_at, id) < ($1, $2)
                 ORDER BY created_at DESC, id DESC
                 LIMIT $3
-            """
+            """, "page.created_at DESC, page.id DESC")
             # Fetch limit+1 to check if there are more
-            rows = await self._db.fetch(query, anchor_created_at, anchor_id, limit + 1)
+            params = [anchor_created_at, anchor_id, limit + 1] + ([kind] if kind else [])
+            rows = await self._db.fetch(query, *params)
         else:
             # Without cursor: get latest threads
-            query = """
-                SELECT * FROM threads
-                WHERE deleted_at IS NULL
+            kind_filter = "AND kind = $2" if kind else ""
+            query = _with_author(f"""
+                SELECT {THREAD_CARD_COLUMNS} FROM threads
+                WHERE deleted_at IS NULL {kind_filter}
                 ORDER BY created_at DESC, id DESC
                 LIMIT $1
-            """
+            """, "page.created_at DESC, page.id DESC")
             # Fetch limit+1 to check if there are more
-            rows = await self._db.fetch(query, limit + 1)
+            params = [limit + 1] + ([kind] if kind else [])
+            rows = await self._db.fetch(query, *params)
         
         # Convert rows to list of dicts
         items = [dict(row) for row in rows]
@@ -219,6 +368,78 @@ class ThreadRepository:
                 "createdAt": last_item["created_at"].isoformat().replace("+00:00", "Z"),
                 "id": last_item["id"]
             }
+            if kind:
+                cursor_obj["type"] = kind
+            next_cursor = encode(cursor_obj)
+        
+        return {
+            "items": items,
+            "nextCursor": next_cursor
+        }
+
+    async def list_threads_hot(
+        self,
+        *,
+        anchor: Optional[Dict[str, Any]] = None,
+        limit: int = 20,
+        kind: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Return items and nextCursor for timeline 'hot'.
+        
+        Rows are read in (hot_rank DESC, created_at DESC, id DESC) order from
+        idx_threads_alive_hot (idx_threads_alive_kind_hot with kind);
+        hot_rank is maintained by reactions and the hot score refresher
+        (see app.services.hot).
+        
+        Args:
+            anchor: Validated cursor anchor with score, createdAt and id
+            limit: Number of items to return (default 20, max 200)
+            kind: Optional 種別 filter (question/notice/recruit/chat)
+            
+        Returns:
+            Dict with 'items' list and optional 'nextCursor'
+        """
+        if limit > 200:
+            limit = 200
+        
+        if anchor:
+            kind_filter = "AND kind = $5" if kind else ""
+            query = _with_author(f"""
+                SELECT {THREAD_CARD_COLUMNS}, hot_rank FROM threads
+                WHERE deleted_at IS NULL {kind_filter}
+                  AND (hot_rank, created_at, id) < ($1, $2, $3)
+                ORDER BY hot_rank DESC, created_at DESC, id DESC
+                LIMIT $4
+            """, "page.hot_rank DESC, page.created_at DESC, page.id DESC")
+            anchor_created_at = _dt.datetime.fromisoformat(anchor["createdAt"].replace("Z", "+00:00"))
+            params = [float(anchor["score"]), anchor_created_at, anchor["id"], limit + 1]
+            rows = await self._db.fetch(query, *params, *([kind] if kind else []))
+        else:
+            kind_filter = "AND kind = $2" if kind else ""
+            query = _with_author(f"""
+                SELECT {THREAD_CARD_COLUMNS}, hot_rank FROM threads
+                WHERE deleted_at IS NULL {kind_filter}
+                ORDER BY hot_rank DESC, created_at DESC, id DESC
+                LIMIT $1
+            """, "page.hot_rank DESC, page.created_at DESC, page.id DESC")
+            rows = await self._db.fetch(query, limit + 1, *([kind] if kind else []))
+        
+        items = [dict(row) for row in rows]
+        has_more = len(items) > limit
+        if has_more:
+            items = items[:limit]
+        
+        next_cursor = None
+        if has_more and items:
+            last_item = items[-1]
+            cursor_obj = {
+                "v": 1,
+                "score": last_item["hot_rank"],
+                "createdAt": last_item["created_at"].isoformat().replace("+00:00", "Z"),
+                "id": last_item["id"]
+            }
+            if kind:
+                cursor_obj["type"] = kind
             next_cursor = encode(cursor_obj)
         
         return {
@@ -226,6 +447,143 @@ class ThreadRepository:
             "nextCursor": next_cursor
         }
 
+    async def list_hot_ids(self, *, limit: int = 200, kind: Optional[str] = None) -> List[str]:
+        """Return the IDs of the top threads in hot order (for snapshots)."""
+        kind_filter = "AND kind = $2" if kind else ""
+        query = f"""
+            SELECT id FROM threads
+            WHERE deleted_at IS NULL {kind_filter}
+            ORDER BY hot_rank DESC, created_at DESC, id DESC
+            LIMIT $1
+        """
+        rows = await self._db.fetch(query, limit, *([kind] if kind else []))
+        return [row["id"] for row in rows]
+
+    async def list_saved_threads(
+        self,
+        *,
+        user_id: str,
+        anchor_saved_at: Optional[_dt.datetime] = None,
+        anchor_id: Optional[str] = None,
+        limit: int = 20,
+    ) -> Dict[str, Any]:
+        """Return the user's saved threads, most recently saved first.
+
+        Saves are read in (created_at DESC, id DESC) keyset order from the
+        partial index idx_reactions_user_saves; each one probes threads by
+        primary key, so soft-deleted threads are dropped per row rather than
+        found by scanning threads. Rows carry saved_at and save_id.
+
+        Args:
+            user_id: Owner of the saves
+            anchor_saved_at: Cursor anchor save time
+            anchor_id: Cursor anchor reaction ID
+            limit: Number of items to return (default 20, max 200)
+
+        Returns:
+            Dict with 'items' list and optional 'nextCursor'
+            ({v, savedAt, id} of the last save)
+        """
+        if limit > 200:
+            limit = 200
+
+        keyset = ""
+        params: List[Any] = [user_id, limit + 1]
+        if anchor_saved_at is not None and anchor_id is not None:
+            keyset = "AND (s.created_at, s.id) < ($3, $4)"
+            params.extend([anchor_saved_at, anchor_id])
+
+        query = _with_author(f"""
+            SELECT t.*, s.created_at AS saved_at, s.id AS save_id
+            FROM reactions s
+            CROSS JOIN LATERAL (
+                SELECT {THREAD_CARD_COLUMNS} FROM threads
+                WHERE id = s.target_id AND deleted_at IS NULL
+            ) t
+            WHERE s.user_id = $1 AND s.target_type = 'thread' AND s.kind = 'save'
+              {keyset}
+            ORDER BY s.created_at DESC, s.id DESC
+            LIMIT $2
+        """, "page.saved_at DESC, page.save_id DESC")
+        rows = await self._db.fetch(query, *params)
+
+        items = [dict(row) for row in rows]
+        has_more = len(items) > limit
+        items = items[:limit]
+
+        next_cursor = None
+        if has_more and items:
+            last_item = items[-1]
+            next_cursor = encode({
+                "v": 1,
+                "savedAt": last_item["saved_at"].isoformat().replace("+00:00", "Z"),
+                "id": last_item["save_id"]
+            })
+
+        return {
+            "items": items,
+            "nextCursor": next_cursor
+        }
+
+    async def get_thread_cards_by_ids(self, *, ids: Sequence[str]) -> List[Dict[str, Any]]:
+        """Return card rows for ids in the given order, skipping deleted threads."""
+        if not ids:
+            return []
+        query = _with_author(f"""
+            SELECT {THREAD_CARD_COLUMNS}, hot_rank FROM threads
+            WHERE id = ANY($1::text[]) AND deleted_at IS NULL
+        """)
+        rows = await self._db.fetch(query, list(ids))
+        by_id = {row["id"]: dict(row) for row in rows}
+        return [by_id[thread_id] for thread_id in ids if thread_id in by_id]
+
+    async def refresh_hot_commenters(self, *, now: _dt.datetime) -> int:
+        """Recompute uniq_commenters_3h and hot_rank where they changed.
+        
+        Candidates are threads with comments inside the window (via
+        idx_comments_alive_created) plus threads whose stored count is still
+        non-zero (via idx_threads_hot_commenters), so the statement never
+        scans the whole table.
+        
+        Args:
+            now: End of the commenter window
+            
+        Returns:
+            Number of threads updated
+        """
+        query = f"""
+            WITH recent AS (
+                SELECT thread_id, COUNT(DISTINCT author_id) AS cnt
+                FROM comments
+                WHERE deleted_at IS NULL
+                  AND created_at > $1 - interval '{UNIQ_WINDOW_HOURS} hours'
+                GROUP BY thread_id
+            ),
+            candidates AS (
+                SELECT thread_id AS id FROM recent
+                UNION
+                SELECT id FROM threads WHERE hot_uniq3h > 0
+            ),
+            changed AS (
+                SELECT c.id, COALESCE(r.cnt, 0) AS cnt
+                FROM candidates c
+                JOIN threads t ON t.id = c.id
+                LEFT JOIN recent r ON r.thread_id = c.id
+                WHERE t.hot_uniq3h <> COALESCE(r.cnt, 0)
+            )
+            UPDATE threads t
+            SET hot_uniq3h = changed.cnt,
+                hot_rank = {hot_rank_sql("t.up_count", "changed.cnt", "t.created_at")}
+            FROM changed
+            WHERE t.id = changed.id
+        """
+        status = await self._db.execute(query, now)
+        # asyncpg returns the command tag, e.g. "UPDATE 12"
+        try:
+            return int(status.split()[-1])
+        except (AttributeError, IndexError, ValueError):
+            return 0
+
     async def soft_delete_thread(self, *, thread_id: str, author_id: str) -> bool:
         """Soft delete the thread (set deleted_at).
         
@@ -261,3 +619,95 @@ class ThreadRepository:
         # If a row was updated, result will contain the id
         return result is not None
 
+    async def list_missing_excerpts(
+        self,
+        *,
+        after_id: Optional[str] = None,
+        limit: int = 500,
+    ) -> List[Dict[str, Any]]:
+        """Return (id, body) of threads without a stored excerpt, in id order.
+
+        Args:
+            after_id: Keyset anchor; only ids greater than this are returned
+            limit: Maximum rows to return
+        """
+        query = """
+            SELECT id, body FROM threads
+            WHERE excerpt IS NULL
+              AND id > $1
+            ORDER BY id
+            LIMIT $2
+        """
+        rows = await self._db.fetch(query, after_id or "", limit)
+        return [dict(row) for row in rows]
+
+    async def reconcile_comment_stats(
+        self,
+        *,
+        after_id: Optional[str] = None,
+        limit: int = 500,
+    ) -> Tuple[Optional[str], int]:
+        """Recompute comment_count/last_reply_at for one batch of threads.
+
+        Repairs drift in the denormalized reply stats (e.g. rows written
+        before the columns existed). Only rows whose values differ are
+        updated.
+
+        The batch is locked first (FOR UPDATE also blocks the FK key-share
+        lock a comment insert takes) and recounted in a second statement,
+        so the count snapshot is taken after every in-flight comment write
+        on those threads has committed. Counting and updating in one
+        statement would write back a stale count for a comment committed
+        in between.
+
+        Args:
+            after_id: Keyset anchor; only thread ids greater than this are checked
+            limit: Maximum threads checked
+
+        Returns:
+            Tuple of (last thread id checked or None when past the end, rows repaired)
+        """
+        lock_query = """
+            SELECT id FROM threads
+            WHERE id > $1
+            ORDER BY id
+            LIMIT $2
+            FOR UPDATE
+        """
+        repair_query = """
+            UPDATE threads t
+            SET comment_count = a.comment_count,
+                last_reply_at = a.last_reply_at
+            FROM (
+                SELECT b.id,
+                       COUNT(c.id)::int AS comment_count,
+                       MAX(c.created_at) AS last_reply_at
+                FROM unnest($1::text[]) AS b(id)
+                LEFT JOIN comments c
+                  ON c.thread_id = b.id AND c.deleted_at IS NULL
+                GROUP BY b.id
+            ) a
+            WHERE t.id = a.id
+              AND (t.comment_count <> a.comment_count
+                   OR t.last_reply_at IS DISTINCT FROM a.last_reply_at)
+        """
+        async with self._db.transaction():
+            rows = await self._db.fetch(lock_query, after_id or "", limit)
+            if not rows:
+                return None, 0
+            ids = [row["id"] for row in rows]
+            # "UPDATE <n>"
+            result = await self._db.execute(repair_query, ids)
+        return ids[-1], int(result.split()[-1]) if result else 0
+
+    async def set_excerpts(self, *, excerpts: Sequence[Tuple[str, str]]) -> None:
+        """Store computed excerpts as (thread_id, excerpt) pairs.
+
+        Rows that got an excerpt in the meantime (e.g. a concurrent write)
+        are left untouched.
+        """
+        query = """
+            UPDATE threads SET excerpt = $2
+            WHERE id = $1 AND excerpt IS NULL
+        """
+        await self._db.executemany(query, list(excerpts))
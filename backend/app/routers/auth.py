@@ -1,17 +1,31 @@
 """Authentication router."""
 import hashlib
+import logging
 import os
 import secrets
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 
 from app.core import db
+from app.repositories.sessions_repo import SessionRepository
 from app.util.errors import UnauthorizedException
 from app.util.idgen import generate_id
+from app.util.session_cache import negative_token_cache, session_cache
+from app.util.signed_token import (
+    decode_signed_token,
+    encode_signed_token,
+    get_token_mode,
+    get_token_secret,
+    is_signed_token,
+    signed_session_checks,
+    token_revocation_list,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 security = HTTPBearer()
@@ -34,8 +48,31 @@ class SessionResponse(BaseModel):
     userId: str
 
 
-def generate_token() -> str:
-    """Generate a secure random token."""
+def generate_token(
+    *,
+    user_id: Optional[str] = None,
+    session_id: Optional[str] = None,
+    expires_at: Optional[datetime] = None
+) -> str:
+    """Generate a session token.
+    
+    With AUTH_TOKEN_MODE=signed, SESSION_TOKEN_SECRET set and the session
+    claims given, returns an HMAC-signed token that get_current_user can
+    verify without a DB lookup. Otherwise returns an opaque random token.
+    
+    Args:
+        user_id: Owner of the session (signed mode)
+        session_id: Session ID (signed mode)
+        expires_at: Session expiry (signed mode)
+        
+    Returns:
+        Token string
+    """
+    if get_token_mode() == "signed" and user_id and session_id and expires_at:
+        secret = get_token_secret()
+        if secret is not None:
+            return encode_signed_token(user_id, session_id, expires_at, secret)
+        logger.warning("AUTH_TOKEN_MODE=signed but SESSION_TOKEN_SECRET is not set; issuing opaque token")
     return secrets.token_urlsafe(32)
 
 
@@ -44,11 +81,38 @@ def hash_token(token: str) -> str:
     return hashlib.sha256(token.encode()).hexdigest()
 
 
-async def get_current_user(authorization: str) -> str:
+async def _lookup_session(conn: Any, token_hash: str) -> Optional[Any]:
+    """Fetch the session row for token_hash on the given connection."""
+    query = """
+        SELECT user_id, expires_at
+        FROM sessions
+        WHERE token_hash = $1
+    """
+    return await conn.fetchrow(query, token_hash)
+
+
+async def _lookup_session_on_primary(token_hash: str) -> Optional[Any]:
+    """Fetch the session row for token_hash on a primary pool connection."""
+    pool = await db.get_db_pool()
+    async with pool.acquire() as conn:
+        return await _lookup_session(conn, token_hash)
+
+
+async def get_current_user(
+    authorization: str,
+    request_db: Optional[Any] = None,
+    request: Optional[Request] = None,
+) -> str:
     """Get current user from Bearer token.
     
     Args:
         authorization: Authorization header value
+        request_db: Request-scoped connection handle (RequestConnection). When given,
+            the session lookup runs on the connection the handler will use
+            instead of checking out a second pool connection.
+        request: Current request. When given, the user is recorded as
+            request.state.user_id (read by get_request_connection to pin
+            writers to the primary).
         
     Returns:
         User ID
@@ -56,6 +120,14 @@ async def get_current_user(authorization: str) -> str:
     Raises:
         HTTPException: If token is invalid or expired
     """
+    user_id = await _authenticate(authorization, request_db)
+    if request is not None:
+        request.state.user_id = user_id
+    return user_id
+
+
+async def _authenticate(authorization: str, request_db: Optional[Any]) -> str:
+    """Resolve the bearer token to a user ID (see get_current_user)."""
     # Check Bearer prefix
     if not authorization.startswith("Bearer "):
         raise HTTPException(
@@ -65,81 +137,149 @@ async def get_current_user(authorization: str) -> str:
     
     # Extract token
     token = authorization[7:]  # Remove "Bearer " prefix
+    
+    # Signed tokens are verified with the HMAC key alone (no DB hit) while
+    # their session row was confirmed recently, so a logout on another
+    # instance takes effect within SIGNED_TOKEN_RECHECK_SECONDS. Otherwise
+    # (no key, stale confirmation, or revocation list missing entries) they
+    # fall through to the sessions table like opaque tokens. With
+    # SIGNED_TOKEN_DB_RECHECK=false there is no re-check at all, and a logout
+    # on another instance is not honored until the token expires.
+    claims = None
+    if is_signed_token(token):
+        secret = get_token_secret()
+        if secret is not None:
+            claims = decode_signed_token(token, secret)
+            if claims is None or token_revocation_list.is_revoked(claims.session_id):
+                raise HTTPException(
+                    status_code=401,
+                    detail="Invalid or expired session"
+                )
+            if token_revocation_list.complete and signed_session_checks.is_fresh(claims.session_id):
+                return claims.user_id
+    
     token_hash = hash_token(token)
     
+    # Serve from the in-process session cache when possible
+    cached_user_id = session_cache.get(token_hash)
+    if cached_user_id is not None:
+        return cached_user_id
+    
+    # Shed recently rejected tokens without touching the database
+    if negative_token_cache.contains(token_hash):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or expired session"
+        )
+    
     # Query database for session
-    pool = await db.get_db_pool()
-    async with pool.acquire() as conn:
-        query = """
-            SELECT user_id, expires_at
-            FROM sessions
-            WHERE token_hash = $1
-        """
-        session = await conn.fetchrow(query, token_hash)
-        
-        if not session:
-            raise HTTPException(
-                status_code=401,
-                detail="Invalid or expired session"
-            )
-        
-        # Check if session is expired
-        if session["expires_at"] < datetime.now(timezone.utc):
-            raise HTTPException(
-                status_code=401,
-                detail="Invalid or expired session"
-            )
-        
-        return session["user_id"]
+    if request_db is not None:
+        async with request_db as conn:
+            session = await _lookup_session(conn, token_hash)
+        if not session and getattr(request_db, "role", None) == "replica":
+            # A fresh session may not have replicated yet; the primary decides
+            session = await _lookup_session_on_primary(token_hash)
+    else:
+        session = await _lookup_session_on_primary(token_hash)
+    
+    if not session:
+        negative_token_cache.add(token_hash)
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or expired session"
+        )
+    
+    # Check if session is expired
+    if session["expires_at"] < datetime.now(timezone.utc):
+        negative_token_cache.add(token_hash)
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or expired session"
+        )
+    
+    session_cache.set(token_hash, session["user_id"], session["expires_at"])
+    if claims is not None:
+        signed_session_checks.confirm(claims.session_id)
+    return session["user_id"]
 
 
 @router.post("/bootstrap", response_model=BootstrapResponse)
 async def bootstrap(request: BootstrapRequest) -> BootstrapResponse:
     """Bootstrap authentication for a user.
     
-    Creates a new user or retrieves existing user based on device_secret.
-    Always creates a new session.
+    A known device_secret reuses the user bound to its device credential;
+    otherwise a new user is created. Always creates a new session. The
+    credential/user/session writes go out as a single statement.
     """
+    now = datetime.now(timezone.utc)
+    
+    # Get TTL from environment or default to 7 days
+    ttl_hours = int(os.getenv("SESSION_TTL_HOURS", "168"))  # 7 days = 168 hours
+    expires_at = now + timedelta(hours=ttl_hours)
+    
+    new_user_id = generate_id("usr")
+    session_id = generate_id("ses")
+    
     pool = await db.get_db_pool()
     
     async with pool.acquire() as conn:
+        repo = SessionRepository(conn)
+        
         async with conn.transaction():
-            # Phase 1: Always create new user for simplicity
-            # In Phase 2+, we'll implement proper device_secret handling
-            user_id = generate_id("usr")
-            query = """
-                INSERT INTO users (id, role, created_at)
-                VALUES ($1, 'student', $2)
-            """
-            await conn.execute(query, user_id, datetime.now(timezone.utc))
-            
-            # Create new session
-            session_id = generate_id("ses")
-            token = generate_token()
-            token_hash = hash_token(token)
-            
-            # Get TTL from environment or default to 7 days
-            ttl_hours = int(os.getenv("SESSION_TTL_HOURS", "168"))  # 7 days = 168 hours
-            expires_at = datetime.now(timezone.utc) + timedelta(hours=ttl_hours)
-            
-            query = """
-                INSERT INTO sessions (id, user_id, token_hash, expires_at, created_at)
-                VALUES ($1, $2, $3, $4, $5)
-            """
-            await conn.execute(
-                query,
-                session_id,
-                user_id,
-                token_hash,
-                expires_at,
-                datetime.now(timezone.utc)
-            )
-            
-            return BootstrapResponse(
-                userId=user_id,
-                token=token,
-                expiresAt=expires_at.isoformat().replace("+00:00", "Z")
-            )
+            if request.device_secret:
+                # Only a hash of the device secret is stored as the credential subject
+                device_subject = hash_token(request.device_secret)
+                credential_id = generate_id("cre")
+                
+                if get_token_mode() == "signed":
+                    # Signed tokens embed user_id, known only once the device is resolved
+                    user_id = await repo.bootstrap_device(
+                        device_subject=device_subject,
+                        new_user_id=new_user_id,
+                        credential_id=credential_id,
+                        now=now
+                    )
+                    token = generate_token(user_id=user_id, session_id=session_id, expires_at=expires_at)
+                    token_hash = hash_token(token)
+                    await repo.create_session(
+                        session_id=session_id,
+                        user_id=user_id,
+                        token_hash=token_hash,
+                        expires_at=expires_at,
+                        now=now
+                    )
+                else:
+                    token = generate_token()
+                    token_hash = hash_token(token)
+                    user_id = await repo.bootstrap_device(
+                        device_subject=device_subject,
+                        new_user_id=new_user_id,
+                        credential_id=credential_id,
+                        now=now,
+                        session_id=session_id,
+                        token_hash=token_hash,
+                        expires_at=expires_at
+                    )
+            else:
+                user_id = new_user_id
+                token = generate_token(user_id=user_id, session_id=session_id, expires_at=expires_at)
+                token_hash = hash_token(token)
+                await repo.create_user_with_session(
+                    user_id=user_id,
+                    session_id=session_id,
+                    token_hash=token_hash,
+                    expires_at=expires_at,
+                    now=now
+                )
+    
+    # Prime the cache so the first authenticated request skips the DB
+    session_cache.set(token_hash, user_id, expires_at)
+    
+    return BootstrapResponse(
+        userId=user_id,
+        token=token,
+        expiresAt=expires_at.isoformat().replace("+00:00", "Z")
+    )
 
 
 async def get_authorization_header(request: Request) -> str:
@@ -160,4 +300,39 @@ async def get_session(authorization: str = Depends(get_authorization_header)) ->
         HTTPException: If authentication fails
     """
     user_id = await get_current_user(authorization)
-    return SessionResponse(userId=user_id)
\ No newline at end of file
+    return SessionResponse(userId=user_id)
+
+
+@router.post("/logout", status_code=204)
+async def logout(authorization: str = Depends(get_authorization_header)) -> Response:
+    """Revoke the current session.
+    
+    Deletes the session row and drops it from the session cache. Signed
+    tokens are also added to this instance's revocation list so they stop
+    working here at once; other instances reject them at their next
+    re-check of the session row (SIGNED_TOKEN_RECHECK_SECONDS).
+    
+    Raises:
+        HTTPException: If authentication fails
+    """
+    user_id = await get_current_user(authorization)
+    token = authorization[7:]
+    token_hash = hash_token(token)
+    
+    secret = get_token_secret()
+    if is_signed_token(token) and secret is not None:
+        claims = decode_signed_token(token, secret)
+        if claims is not None:
+            token_revocation_list.revoke(claims.session_id, claims.expires_at)
+            signed_session_checks.forget(claims.session_id)
+    
+    pool = await db.get_db_pool()
+    async with pool.acquire() as conn:
+        await conn.execute(
+            "DELETE FROM sessions WHERE token_hash = $1 AND user_id = $2",
+            token_hash,
+            user_id
+        )
+    
+    session_cache.invalidate(token_hash)
+    return Response(status_code=204)
@@ -2,11 +2,11 @@
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, Header, status
+from fastapi import APIRouter, Depends, Header, Request, status
 from fastapi.responses import JSONResponse
 
 from app.routers.auth import get_current_user
-from app.core.db import get_db_connection
+from app.core.db import get_request_connection
 from app.services.comments_service import CommentService
 from app.util.errors import NotFoundException
 
@@ -19,15 +19,17 @@ router = APIRouter(
 @router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_comment(
     comment_id: str,
+    request: Request,
     authorization: str = Header(...),
-    db = Depends(get_db_connection)
+    db = Depends(get_request_connection)
 ) -> None:
     """Delete a comment by ID.
     
     Args:
         comment_id: ID of the comment to delete
+        request: FastAPI request object
         authorization: Authorization header
-        db: Database connection
+        db: Request-scoped database connection
         
     Returns:
         204 No Content on success
@@ -37,7 +39,7 @@ async def delete_comment(
         404: Comment not found or not authorized to delete
     """
     # Get current user ID from token
-    user_id = await get_current_user(authorization)
+    user_id = await get_current_user(authorization, request_db=db, request=request)
     
     async with db as conn:
         service = CommentService(db=conn)
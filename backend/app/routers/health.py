@@ -1,8 +1,28 @@
-"""Health check endpoint."""
+"""Health check endpoints."""
 
-from fastapi import APIRouter
+import hmac
+import logging
+import os
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
+from app.core import db
+from app.core.query_budget import query_budgets
+from app.core.read_routing import read_routing
+from app.jobs.comment_stats import comment_stats_reconciler
+from app.jobs.hot_scores import hot_score_refresher
+from app.jobs.session_sweeper import session_sweeper
+from app.services.ranking_snapshots import ranking_snapshots
+from app.services.timeline_cache import timeline_cache
+from app.util.errors import NotFoundException, UnauthorizedException
+from app.util.session_cache import negative_token_cache, session_cache
+from app.util.signed_token import signed_session_checks, token_revocation_list
+
+logger = logging.getLogger(__name__)
+
 router = APIRouter(
     prefix="",
     tags=["System"],
@@ -36,4 +56,98 @@ async def health_check() -> HealthResponse:
     Returns:
         HealthResponse: Health status
     """
-    return HealthResponse(status="healthy")
\ No newline at end of file
+    return HealthResponse(status="healthy")
+
+class ReadinessResponse(BaseModel):
+    """Readiness check response model."""
+    status: str
+
+
+@router.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    summary="Readiness Check",
+    description="Check if the instance has a warmed database pool and accepts traffic",
+    responses={
+        200: {
+            "description": "Instance is ready",
+            "content": {
+                "application/json": {
+                    "example": {"status": "ready"}
+                }
+            }
+        },
+        503: {
+            "description": "Pool not warmed yet or draining for shutdown",
+            "content": {
+                "application/json": {
+                    "example": {"status": "not_ready"}
+                }
+            }
+        }
+    }
+)
+async def readiness_check() -> Any:
+    """Readiness check endpoint.
+    
+    If startup warm-up failed, the warm-up is retried here so the instance
+    can become ready without a restart. A draining instance is never ready.
+    
+    Returns:
+        ReadinessResponse, or 503 when not ready
+    """
+    if not db.is_db_ready() and not db.is_db_draining():
+        try:
+            await db.init_db_pool()
+        except Exception as e:
+            logger.warning(f"Database pool warm-up retry failed: {e}")
+    
+    if db.is_db_ready():
+        return ReadinessResponse(status="ready")
+    return JSONResponse(status_code=503, content={"status": "not_ready"})
+
+
+def require_metrics_token(x_metrics_token: Optional[str] = Header(None)) -> None:
+    """Allow internal callers presenting METRICS_TOKEN as X-Metrics-Token.
+    
+    Without METRICS_TOKEN configured the endpoint is not exposed at all.
+    
+    Raises:
+        NotFoundException: If METRICS_TOKEN is not set
+        UnauthorizedException: If the header is missing or wrong
+    """
+    expected = os.getenv("METRICS_TOKEN")
+    if not expected:
+        raise NotFoundException("Not found")
+    if not x_metrics_token or not hmac.compare_digest(x_metrics_token.encode(), expected.encode()):
+        raise UnauthorizedException("Valid X-Metrics-Token required")
+
+
+@router.get(
+    "/health/metrics",
+    summary="Runtime Metrics",
+    description="DB pool saturation/latency and in-process cache counters (JSON, internal only)",
+    dependencies=[Depends(require_metrics_token)],
+)
+async def metrics() -> Dict[str, Any]:
+    """Runtime metrics endpoint (requires X-Metrics-Token).
+    
+    Returns:
+        Pool acquire/hold histograms per route and pool (primary, replica), pool size/idle counts,
+        per-route query budget timeouts, replica routing counters, ranking
+        snapshot and timeline cache hit rates and counters of the session caches and background jobs
+    """
+    return {
+        "dbPool": db.pool_stats(),
+        "readRouting": read_routing.stats(),
+        "queryBudgets": query_budgets.stats(),
+        "sessionCache": session_cache.stats(),
+        "negativeTokenCache": negative_token_cache.stats(),
+        "tokenRevocations": token_revocation_list.stats(),
+        "signedSessionChecks": signed_session_checks.stats(),
+        "sessionSweeper": session_sweeper.stats(),
+        "hotScoreRefresher": hot_score_refresher.stats(),
+        "commentStatsReconciler": comment_stats_reconciler.stats(),
+        "rankingSnapshots": ranking_snapshots.stats(),
+        "timelineCache": timeline_cache.stats(),
+    }
@@ -1,12 +1,17 @@
 """Profile router."""
 
-from fastapi import APIRouter, Depends, Header, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
 
 from app.routers.auth import get_current_user
-from app.core.db import get_db_connection
+from app.core.db import get_read_connection, get_request_connection
 from app.schemas.profile import MyProfile, UpdateProfileRequest
+from app.schemas.threads import PaginatedThreadCards
 from app.services.profile_service import ProfileService
+from app.services.threads_service import ThreadService, PAGE_SIZE, MAX_NEW_PAGE_SIZE
 from app.repositories.profile_repo import ProfileRepository
+from app.util.pagination import set_next_link, validate_limit
 
 router = APIRouter(
     prefix="/auth/me",
@@ -16,14 +21,16 @@ router = APIRouter(
 
 @router.get("/profile", response_model=MyProfile)
 async def get_my_profile(
+    request: Request,
     authorization: str = Header(...),
-    db = Depends(get_db_connection)
+    db = Depends(get_request_connection)
 ) -> MyProfile:
     """Get my profile with all fields visible.
     
     Args:
+        request: FastAPI request object
         authorization: Authorization header (required)
-        db: Database connection
+        db: Request-scoped database connection
         
     Returns:
         MyProfile with all fields
@@ -32,7 +39,7 @@ async def get_my_profile(
         HTTPException: If authentication fails
     """
     # Get current user ID (authentication required)
-    user_id = await get_current_user(authorization)
+    user_id = await get_current_user(authorization, request_db=db, request=request)
     
     async with db as conn:
         profile_repo = ProfileRepository(conn)
@@ -43,15 +50,17 @@ async def get_my_profile(
 @router.patch("/profile", status_code=status.HTTP_204_NO_CONTENT)
 async def update_my_profile(
     profile_data: UpdateProfileRequest,
+    request: Request,
     authorization: str = Header(...),
-    db = Depends(get_db_connection)
+    db = Depends(get_request_connection)
 ) -> None:
     """Update my profile.
     
     Args:
         profile_data: Profile update data
+        request: FastAPI request object
         authorization: Authorization header (required) 
-        db: Database connection
+        db: Request-scoped database connection
         
     Returns:
         None (204 No Content)
@@ -61,9 +70,54 @@ async def update_my_profile(
         ValidationError: If profile data is invalid
     """
     # Get current user ID (authentication required)
-    user_id = await get_current_user(authorization)
+    user_id = await get_current_user(authorization, request_db=db, request=request)
     
     async with db as conn:
         profile_repo = ProfileRepository(conn)
         service = ProfileService(profile_repo)
-        await service.update_my_profile(user_id, profile_data)
\ No newline at end of file
+        await service.update_my_profile(user_id, profile_data)
+
+
+@router.get("/saved", response_model=PaginatedThreadCards)
+async def list_my_saved_threads(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = Query(None, description="Pagination cursor"),
+    limit: int = Query(PAGE_SIZE, description="Page size (1..100)"),
+    authorization: str = Header(...),
+    db = Depends(get_read_connection)
+) -> PaginatedThreadCards:
+    """List the threads I saved, most recently saved first.
+    
+    Args:
+        request: FastAPI request object
+        response: Response (Link is set when there is a next page)
+        cursor: Pagination cursor
+        limit: Page size
+        authorization: Authorization header (required)
+        db: Request-scoped read connection (replica when configured)
+        
+    Returns:
+        Paginated thread cards (deleted threads are left out)
+        
+    Raises:
+        HTTPException: If authentication fails
+        ValidationException: If limit or cursor is invalid
+    """
+    validate_limit(limit, MAX_NEW_PAGE_SIZE)
+    
+    # Get current user ID (authentication required)
+    user_id = await get_current_user(authorization, request_db=db, request=request)
+    # A save just made must show up, so recent writers read the primary
+    await db.use_primary_for(user_id)
+    
+    async with db as conn:
+        service = ThreadService(db=conn)
+        page = await service.list_saved_threads(
+            user_id=user_id,
+            cursor=cursor,
+            limit=limit
+        )
+    
+    set_next_link(request, response, page.nextCursor)
+    return page
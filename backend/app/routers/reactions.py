@@ -1,10 +1,10 @@
 """Reactions router."""
 
-from fastapi import APIRouter, Depends, Header, status
+from fastapi import APIRouter, Depends, Header, Request, status
 from fastapi.responses import Response
 
 from app.routers.auth import get_current_user, get_authorization_header
-from app.core.db import get_db_connection
+from app.core.db import get_request_connection
 from app.schemas.reactions import ReactionRequestComment, ReactionRequestThread
 from app.services.reactions_service import ReactionService
 from app.util.errors import ValidationException, ConflictException
@@ -19,16 +19,18 @@ router = APIRouter(
 async def post_comment_reaction(
     comment_id: str,
     reaction_request: ReactionRequestComment,
+    request: Request,
     authorization: str = Depends(get_authorization_header),
-    db = Depends(get_db_connection)
+    db = Depends(get_request_connection)
 ) -> Response:
     """React to a comment with 'up' reaction.
     
     Args:
         comment_id: ID of the comment to react to
         reaction_request: Reaction request data with 'kind' field
+        request: FastAPI request object
         authorization: Authorization header
-        db: Database connection
+        db: Request-scoped database connection
         
     Returns:
         Empty response with 204 No Content status
@@ -39,7 +41,7 @@ async def post_comment_reaction(
         HTTPException: If authentication fails
     """
     # Get current user ID
-    user_id = await get_current_user(authorization)
+    user_id = await get_current_user(authorization, request_db=db, request=request)
     
     # Create service instance
     async with db as conn:
@@ -64,16 +66,18 @@ async def post_comment_reaction(
 async def post_thread_reaction(
     thread_id: str,
     reaction_request: ReactionRequestThread,
+    request: Request,
     authorization: str = Depends(get_authorization_header),
-    db = Depends(get_db_connection)
+    db = Depends(get_request_connection)
 ) -> Response:
     """React to a thread with 'up' or 'save' reaction.
     
     Args:
         thread_id: ID of the thread to react to
         reaction_request: Reaction request data with 'kind' field
+        request: FastAPI request object
         authorization: Authorization header
-        db: Database connection
+        db: Request-scoped database connection
         
     Returns:
         Empty response with 204 No Content status
@@ -84,7 +88,7 @@ async def post_thread_reaction(
         HTTPException: If authentication fails
     """
     # Get current user ID
-    user_id = await get_current_user(authorization)
+    user_id = await get_current_user(authorization, request_db=db, request=request)
     
     # Create service instance
     async with db as conn:
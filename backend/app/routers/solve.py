@@ -2,11 +2,11 @@
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, Header, status
+from fastapi import APIRouter, Depends, Header, Request, status
 from fastapi.responses import Response
 
 from app.routers.auth import get_current_user
-from app.core.db import get_db_connection
+from app.core.db import get_request_connection
 from app.schemas.comments import SolveRequest
 from app.services.solve_service import SolveService
 
@@ -20,16 +20,18 @@ router = APIRouter(
 async def solve_thread(
     thread_id: str,
     solve_request: SolveRequest,
+    request: Request,
     authorization: str = Header(...),
-    db = Depends(get_db_connection)
+    db = Depends(get_request_connection)
 ) -> None:
     """Set or clear solved comment on a thread.
     
     Args:
         thread_id: ID of the thread to solve/unsolve
         solve_request: Request with optional comment ID
+        request: FastAPI request object
         authorization: Authorization header (required)
-        db: Database connection
+        db: Request-scoped database connection
         
     Returns:
         204 No Content on success
@@ -41,7 +43,7 @@ async def solve_thread(
         ValidationException: If thread is not a question type or validation fails
     """
     # Get current user ID (authentication required)
-    user_id = await get_current_user(authorization)
+    user_id = await get_current_user(authorization, request_db=db, request=request)
     
     async with db as conn:
         service = SolveService(db=conn)
@@ -2,16 +2,17 @@
 
 from typing import Dict, Any, Optional
 
-from fastapi import APIRouter, Depends, Header, Query, Request, status
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
 from fastapi.responses import JSONResponse
 
 from app.routers.auth import get_current_user
-from app.core.db import get_db_connection
-from app.schemas.threads import CreateThreadRequest, PaginatedThreadCards, ThreadDetail
+from app.core.db import get_read_connection, get_request_connection
+from app.schemas.threads import CreateThreadRequest, PaginatedThreadCards, ThreadCardBatch, ThreadDetail, ThreadView, VALID_KIND_VALUES
 from app.schemas.comments import CreateCommentRequest, CreatedResponse, PaginatedComments
-from app.services.threads_service import ThreadService
-from app.services.comments_service import CommentService
-from app.util.errors import ValidationException
+from app.services.threads_service import ThreadService, thread_detail_etag, PAGE_SIZE, MAX_NEW_PAGE_SIZE, MAX_HOT_PAGE_SIZE
+from app.services.comments_service import CommentService, MAX_PAGE_SIZE as MAX_COMMENT_PAGE_SIZE
+from app.util.errors import NotFoundException, ValidationException
+from app.util.pagination import set_next_link, validate_limit
 from app.util.rate_limit import rate_limiter, create_rate_limit_response, comment_rate_limiter, create_comment_rate_limit_response
 
 router = APIRouter(
@@ -20,24 +21,47 @@ router = APIRouter(
 )
 
 
+async def _get_optional_user(request: Request, db: Any) -> Optional[str]:
+    """Resolve the caller for optional-auth routes on the request's connection.
+    
+    Authentication is optional for reads, so failures resolve to None.
+    The result is exposed as request.state.user_id. A caller who wrote
+    recently is moved to the primary so they read their own writes.
+    """
+    current_user_id = None
+    auth_header = request.headers.get("authorization", "")
+    if auth_header.startswith("Bearer "):
+        try:
+            current_user_id = await get_current_user(auth_header, request_db=db, request=request)
+        except Exception:
+            pass
+    
+    if current_user_id:
+        await db.use_primary_for(current_user_id)
+    
+    return current_user_id
+
+
 @router.post("", status_code=status.HTTP_201_CREATED)
 async def create_thread(
     thread_create: CreateThreadRequest,
+    request: Request,
     authorization: str = Header(...),
-    db = Depends(get_db_connection)
+    db = Depends(get_request_connection)
 ) -> Dict[str, Any]:
     """Create a new thread.
     
     Args:
         thread_create: Thread creation request
+        request: FastAPI request object
         authorization: Authorization header
-        db: Database connection
+        db: Request-scoped database connection
         
     Returns:
         Created response with thread ID and timestamp
     """
-    # Get current user ID
-    user_id = await get_current_user(authorization)
+    # Get current user ID on the request's connection
+    user_id = await get_current_user(authorization, request_db=db, request=request)
     
     # Check rate limit (1 thread per minute per user)
     is_allowed, retry_after = rate_limiter.check_rate_limit(user_id)
@@ -63,95 +87,216 @@ async def create_thread(
 @router.get("", response_model=PaginatedThreadCards)
 async def list_threads(
     request: Request,
+    response: Response,
     sort: str = Query("new", description="Sort order: 'new' or 'hot'"),
-    type: Optional[str] = Query(None, description="Thread type filter"),
+    type: Optional[str] = Query(None, description="種別 filter: question, notice, recruit or chat"),
     cursor: Optional[str] = Query(None, description="Pagination cursor"),
-    db = Depends(get_db_connection)
+    limit: int = Query(PAGE_SIZE, description="Page size (new: 1..100, hot: 1..50)"),
+    db = Depends(get_read_connection)
 ) -> PaginatedThreadCards:
     """List threads with pagination.
     
     Args:
         request: FastAPI request object
-        sort: Sort order ('new' for phase 1, 'hot' not implemented)
-        type: Thread type filter (not implemented in phase 1)
+        response: Response (X-Snapshot-At is set for sort=hot, Link when there is a next page)
+        sort: Sort order ('new' or 'hot')
+        type: 種別 filter (question/notice/recruit/chat)
         cursor: Pagination cursor
-        db: Database connection
+        limit: Page size
+        db: Request-scoped read connection (replica when configured)
         
     Returns:
         Paginated list of thread cards
     """
-    # Phase 1: Only support 'new' sort
-    if sort != "new":
-        raise ValidationException("Only 'new' sort is supported in Phase 1")
+    if sort not in ("new", "hot"):
+        raise ValidationException("sort must be 'new' or 'hot'")
+    if type is not None and type not in VALID_KIND_VALUES:
+        raise ValidationException("type must be one of question, notice, recruit, chat")
+    validate_limit(limit, MAX_HOT_PAGE_SIZE if sort == "hot" else MAX_NEW_PAGE_SIZE)
     
-    # Try to get current user from authorization header
-    current_user_id = None
-    auth_header = request.headers.get("authorization", "")
-    if auth_header.startswith("Bearer "):
-        try:
-            current_user_id = await get_current_user(auth_header)
-        except Exception:
-            # Authentication is optional for listing threads
-            pass
+    # Authentication is optional; resolved on the request's connection
+    current_user_id = await _get_optional_user(request, db)
     
     async with db as conn:
         service = ThreadService(db=conn)
-        return await service.list_threads_new(
-            current_user_id=current_user_id,
-            cursor=cursor
+        if sort == "hot":
+            page, snapshot_at = await service.list_threads_hot(
+                current_user_id=current_user_id,
+                cursor=cursor,
+                kind=type,
+                limit=limit
+            )
+            response.headers["X-Snapshot-At"] = snapshot_at
+        else:
+            page = await service.list_threads_new(
+                current_user_id=current_user_id,
+                cursor=cursor,
+                kind=type,
+                limit=limit
+            )
+    
+    set_next_link(request, response, page.nextCursor)
+    return page
+
+
+@router.get(":batch", response_model=ThreadCardBatch)
+async def get_threads_batch(
+    request: Request,
+    ids: str = Query(..., description="Comma-separated thread IDs (max 100)"),
+    db = Depends(get_read_connection)
+) -> ThreadCardBatch:
+    """Get thread cards for up to 100 IDs in one request.
+    
+    For restoring saved lists, notification targets or search hits
+    without one GET /threads/{id} per thread.
+    
+    Args:
+        request: FastAPI request object
+        ids: Comma-separated thread IDs
+        db: Request-scoped read connection (replica when configured)
+        
+    Returns:
+        Cards in request order, and the IDs not found or deleted
+        
+    Raises:
+        ValidationException: If ids is empty, too long or has malformed IDs
+    """
+    thread_ids = [thread_id.strip() for thread_id in ids.split(",") if thread_id.strip()]
+    
+    # Authentication is optional; resolved on the request's connection
+    current_user_id = await _get_optional_user(request, db)
+    
+    async with db as conn:
+        service = ThreadService(db=conn)
+        return await service.get_thread_cards(
+            thread_ids=thread_ids,
+            current_user_id=current_user_id
         )
 
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check If-None-Match (weak comparison, RFC 9110 13.1.2) against an ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
 @router.get("/{thread_id}", response_model=ThreadDetail)
 async def get_thread_detail(
     thread_id: str,
     request: Request,
-    db = Depends(get_db_connection)
-) -> ThreadDetail:
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db = Depends(get_read_connection)
+) -> Any:
     """Get thread detail by ID.
     
+    The response carries an ETag. A request whose If-None-Match matches
+    the current version gets 304 after a primary-key version probe,
+    without loading or serializing the detail.
+    
     Args:
         thread_id: Thread ID
         request: FastAPI request object
-        db: Database connection
+        response: Response (ETag is set)
+        if_none_match: Optional If-None-Match header
+        db: Request-scoped read connection (replica when configured)
         
     Returns:
-        Thread detail
+        Thread detail, or an empty 304 response
         
     Raises:
         NotFoundException: If thread doesn't exist or is deleted
         ValidationException: If thread ID format is invalid
     """
-    # Try to get current user from authorization header
-    current_user_id = None
-    auth_header = request.headers.get("authorization", "")
-    if auth_header.startswith("Bearer "):
-        try:
-            current_user_id = await get_current_user(auth_header)
-        except Exception:
-            # Authentication is optional for getting thread detail
-            pass
+    # Authentication is optional; resolved on the request's connection
+    current_user_id = await _get_optional_user(request, db)
+    
+    # The body depends on isMine, so shared caches must not store it
+    cache_headers = {"Cache-Control": "private, no-cache", "Vary": "Authorization"}
     
     async with db as conn:
         service = ThreadService(db=conn)
-        return await service.get_thread(
+        if if_none_match:
+            etag = await service.get_thread_etag(
+                thread_id=thread_id,
+                current_user_id=current_user_id
+            )
+            if etag and _etag_matches(if_none_match, etag):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers={"ETag": etag, **cache_headers}
+                )
+        
+        detail = await service.get_thread(
             thread_id=thread_id,
             current_user_id=current_user_id
         )
+        if detail is not None:
+            response.headers["ETag"] = thread_detail_etag(detail)
+            response.headers.update(cache_headers)
+        return detail
+
+
+@router.get("/{thread_id}/view", response_model=ThreadView)
+async def get_thread_view(
+    thread_id: str,
+    request: Request,
+    response: Response,
+    db = Depends(get_read_connection)
+) -> ThreadView:
+    """Get what the thread page renders first in one request.
+    
+    Replaces GET /threads/{id} + GET /threads/{id}/comments + reaction
+    lookups on page open: one auth check and one connection checkout.
+    
+    Args:
+        thread_id: Thread ID
+        request: FastAPI request object
+        response: Response (cache headers are set)
+        db: Request-scoped read connection (replica when configured)
+        
+    Returns:
+        ThreadView (detail, first comment page, pinned solved comment, my reactions)
+        
+    Raises:
+        NotFoundException: If thread doesn't exist or is deleted
+        ValidationException: If thread ID format is invalid
+    """
+    # Authentication is optional; resolved on the request's connection
+    current_user_id = await _get_optional_user(request, db)
+    
+    async with db as conn:
+        service = ThreadService(db=conn)
+        view = await service.get_thread_view(
+            thread_id=thread_id,
+            current_user_id=current_user_id
+        )
+    
+    if view is None:
+        raise NotFoundException("Thread not found")
+    
+    # The body depends on the caller (isMine, myReactions)
+    response.headers["Cache-Control"] = "private, no-cache"
+    response.headers["Vary"] = "Authorization"
+    return view
 
 
 @router.delete("/{thread_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_thread(
     thread_id: str,
+    request: Request,
     authorization: str = Header(...),
-    db = Depends(get_db_connection)
+    db = Depends(get_request_connection)
 ) -> None:
     """Delete a thread (soft delete).
     
     Args:
         thread_id: Thread ID to delete
+        request: FastAPI request object
         authorization: Authorization header (required)
-        db: Database connection
+        db: Request-scoped database connection
         
     Returns:
         None (204 No Content)
@@ -163,7 +308,7 @@ async def delete_thread(
         ValidationException: If thread ID format is invalid
     """
     # Get current user ID (authentication required)
-    current_user_id = await get_current_user(authorization)
+    current_user_id = await get_current_user(authorization, request_db=db, request=request)
     
     async with db as conn:
         service = ThreadService(db=conn)
@@ -177,16 +322,18 @@ async def delete_thread(
 async def create_comment(
     thread_id: str,
     comment_create: CreateCommentRequest,
+    request: Request,
     authorization: str = Header(...),
-    db = Depends(get_db_connection)
+    db = Depends(get_request_connection)
 ) -> CreatedResponse:
     """Create a new comment on a thread.
     
     Args:
         thread_id: ID of the thread to comment on
         comment_create: Comment creation request
+        request: FastAPI request object
         authorization: Authorization header (required)
-        db: Database connection
+        db: Request-scoped database connection
         
     Returns:
         CreatedResponse with comment ID and timestamp
@@ -198,7 +345,7 @@ async def create_comment(
         RateLimitException: If rate limit exceeded
     """
     # Get current user ID (authentication required)
-    user_id = await get_current_user(authorization)
+    user_id = await get_current_user(authorization, request_db=db, request=request)
     
     # Check comment rate limit (1 comment per 10 seconds per user)
     is_allowed, retry_after = comment_rate_limiter.check_rate_limit(user_id)
@@ -220,16 +367,20 @@ async def create_comment(
 async def list_comments(
     thread_id: str,
     request: Request,
+    response: Response,
     cursor: Optional[str] = Query(None, description="Pagination cursor"),
-    db = Depends(get_db_connection)
+    limit: int = Query(PAGE_SIZE, description="Page size (1..100)"),
+    db = Depends(get_read_connection)
 ) -> PaginatedComments:
     """List comments for a thread in ASC order.
     
     Args:
         thread_id: ID of the thread to get comments for
         request: FastAPI request object
+        response: Response (Link is set when there is a next page)
         cursor: Pagination cursor
-        db: Database connection
+        limit: Page size
+        db: Request-scoped read connection (replica when configured)
         
     Returns:
         PaginatedComments with list of comment DTOs
@@ -238,20 +389,19 @@ async def list_comments(
         NotFoundException: If thread doesn't exist
         ValidationException: If cursor is invalid
     """
-    # Try to get current user from authorization header (optional for reading)
-    current_user_id = None
-    auth_header = request.headers.get("authorization", "")
-    if auth_header.startswith("Bearer "):
-        try:
-            current_user_id = await get_current_user(auth_header)
-        except Exception:
-            # Authentication is optional for listing comments
-            pass
+    validate_limit(limit, MAX_COMMENT_PAGE_SIZE)
+    
+    # Authentication is optional; resolved on the request's connection
+    current_user_id = await _get_optional_user(request, db)
     
     async with db as conn:
         service = CommentService(db=conn)
-        return await service.list_comments(
+        page = await service.list_comments(
             thread_id=thread_id,
             current_user_id=current_user_id,
-            cursor=cursor
-        )
\ No newline at end of file
+            cursor=cursor,
+            limit=limit
+        )
+    
+    set_next_link(request, response, page.nextCursor)
+    return page
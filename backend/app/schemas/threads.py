@@ -5,6 +5,8 @@ from typing import Optional, List
 from pydantic import BaseModel, Field, field_validator, model_validator
 from typing import Any
 
+from app.schemas import comments as comment_schemas
+
 
 # ID pattern as per spec
 ID_PATTERN = re.compile(r'^(usr|cre|ses|thr|cmt|att|rcn)_[0-9A-HJKMNP-TV-Z]{26}$')
@@ -233,6 +235,31 @@ class PaginatedComments(BaseModel):
     nextCursor: Optional[str] = None
 
 
+class ThreadCardBatch(BaseModel):
+    """Batch lookup response: cards in request order, plus the IDs not found (or deleted)."""
+    items: List[ThreadCard]
+    missing: List[str]
+
+
+class ViewerReactions(BaseModel):
+    """The caller's own reactions on a thread."""
+    up: bool = False
+    save: bool = False
+
+
+class ThreadView(BaseModel):
+    """Everything the thread page renders first, in one response.
+    
+    comments is the first page of GET /threads/{id}/comments (continue with
+    its nextCursor there). pinnedComment is the solved comment, whether or
+    not it is on that page. myReactions is null for anonymous callers.
+    """
+    thread: ThreadDetail
+    comments: comment_schemas.PaginatedComments
+    pinnedComment: Optional[comment_schemas.Comment] = None
+    myReactions: Optional[ViewerReactions] = None
+
+
 class ThreadInDB(BaseModel):
     """Thread database model (internal)."""
     id: str
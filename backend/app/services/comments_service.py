@@ -1,6 +1,6 @@
 """Comment service layer for business logic."""
 
-from typing import Any
+from typing import Any, Optional
 import re
 from datetime import datetime, timezone
 
@@ -8,6 +8,10 @@ from app.repositories.comments_repo import CommentRepository
 from app.schemas.comments import CreateCommentRequest, CreatedResponse, Comment, AuthorAffiliation, PaginatedComments
 from app.util.errors import ValidationException, NotFoundException
 
+# Default page size of the comment list, and the cap on ?limit
+PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
 
 class CommentService:
     """Service layer for comment operations."""
@@ -85,7 +89,8 @@ class CommentService:
         *,
         thread_id: str,
         current_user_id: str,
-        cursor: str = None
+        cursor: str = None,
+        limit: int = PAGE_SIZE
     ) -> PaginatedComments:
         """List comments for a thread in ASC order.
         
@@ -93,6 +98,7 @@ class CommentService:
             thread_id: ID of the parent thread
             current_user_id: ID of the current user
             cursor: Pagination cursor
+            limit: Page size (1..MAX_PAGE_SIZE, validated by the router)
             
         Returns:
             PaginatedComments with list of comment DTOs
@@ -118,13 +124,15 @@ class CommentService:
             except Exception:
                 raise ValidationException("Invalid cursor format")
         
-        # Get comments from repository
+        # Get comments from repository (limit+1 to check if there are more)
         comment_data_list = await self._repo.list_comments_by_thread(
             thread_id=thread_id,
             anchor_created_at=anchor_created_at,
             anchor_id=anchor_id,
-            limit=20
+            limit=limit + 1
         )
+        has_more = len(comment_data_list) > limit
+        comment_data_list = comment_data_list[:limit]
         
         # Convert to Comment DTOs
         comment_dtos = []
@@ -134,7 +142,7 @@ class CommentService:
         
         # Generate next cursor if we have more results
         next_cursor = None
-        if len(comment_dtos) == 20:  # Full page indicates more results may exist
+        if has_more:
             last_comment = comment_data_list[-1]
             # Create cursor for next page
             try:
@@ -154,6 +162,27 @@ class CommentService:
             nextCursor=next_cursor
         )
     
+    async def get_comment(
+        self,
+        *,
+        thread_id: str,
+        comment_id: str
+    ) -> Optional[Comment]:
+        """Get one live comment of a thread.
+        
+        Args:
+            thread_id: ID of the parent thread
+            comment_id: ID of the comment
+            
+        Returns:
+            Comment DTO, or None if not found, deleted or not on this thread
+        """
+        comment_data = await self._repo.get_thread_comment(
+            thread_id=thread_id,
+            comment_id=comment_id
+        )
+        return self._to_comment_dto(comment_data) if comment_data else None
+    
     async def delete_comment(
         self,
         *,
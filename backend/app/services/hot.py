@@ -0,0 +1,60 @@
+"""Hot ranking (docs/05 5): (up_count + 0.5*uniq_commenters_3h) * exp(-hours/12).
+
+The decay factor exp(-(now - created_at)/12h) is the same multiplier
+exp(-now/12h) for every thread times exp(created_at/12h), so ordering by
+score at any instant equals ordering by the time-invariant key
+
+    hot_rank = ln(up_count + 0.5*uniq3h) + epoch_hours(created_at) / 12
+
+(log space keeps it finite). threads.hot_rank stores this key: it only
+changes when up_count or uniq3h change, never just because time passes,
+so a B-tree index on it serves sort=hot without rescoring the table.
+"""
+
+import math
+from datetime import datetime, timezone
+from typing import Optional
+
+DECAY_HOURS = 12
+UNIQ_WINDOW_HOURS = 3
+COMMENTER_WEIGHT = 0.5
+
+# Rank of threads whose score is 0 (no ups, no recent commenters). Below any
+# positive rank: ln(0.5) + epoch_hours/12 is far above this for any date.
+ZERO_SCORE_RANK = -1.0e9
+
+
+def hot_score(up_count: int, uniq3h: int, hours_since_created: float) -> float:
+    """Return the spec'd hot score."""
+    return (up_count + COMMENTER_WEIGHT * uniq3h) * math.exp(-hours_since_created / DECAY_HOURS)
+
+
+def hot_rank(up_count: int, uniq3h: int, created_at: datetime) -> float:
+    """Return the time-invariant ordering key stored in threads.hot_rank."""
+    base = up_count + COMMENTER_WEIGHT * uniq3h
+    if base <= 0:
+        return ZERO_SCORE_RANK
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return math.log(base) + created_at.timestamp() / 3600 / DECAY_HOURS
+
+
+def score_at(rank: float, at: Optional[datetime] = None) -> float:
+    """Convert a stored hot_rank back to the hot score at time at (default now)."""
+    if rank <= ZERO_SCORE_RANK:
+        return 0.0
+    if at is None:
+        at = datetime.now(timezone.utc)
+    elif at.tzinfo is None:
+        at = at.replace(tzinfo=timezone.utc)
+    return math.exp(rank - at.timestamp() / 3600 / DECAY_HOURS)
+
+
+def hot_rank_sql(up_count: str, uniq3h: str, created_at: str) -> str:
+    """Return the SQL expression computing hot_rank from the given column expressions."""
+    base = f"({up_count} + {COMMENTER_WEIGHT} * {uniq3h})"
+    return (
+        f"CASE WHEN {base} > 0 "
+        f"THEN ln({base}) + extract(epoch FROM {created_at}) / {3600 * DECAY_HOURS} "
+        f"ELSE {ZERO_SCORE_RANK} END"
+    )
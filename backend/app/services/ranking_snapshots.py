@@ -0,0 +1,217 @@
+"""Ranking snapshots: ordered ID lists frozen per ranking and time bucket.
+
+The first page of a ranked listing (hot, search) freezes the top IDs once
+per bucket; later pages slice that list by offset, so paging is O(page)
+and stable even while scores move. Snapshots expire after 24 hours
+(docs/04b 6) and are held in a bounded LRU, optionally mirrored to the
+ranking_snapshots table so every instance serves the same order.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.repositories.ranking_snapshots_repo import RankingSnapshotRepository
+from app.services.cursor import is_snapshot_expired
+from app.util.env import env_flag
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on IDs frozen per snapshot (docs/04b 6: max 200 items per listing)
+SNAPSHOT_SIZE = 200
+
+SnapshotKey = Tuple[str, datetime]
+
+
+class RankingSnapshotStore:
+    """Bounded in-memory snapshot store with optional Postgres mirror."""
+
+    def __init__(
+        self,
+        max_snapshots: int = 512,
+        bucket_seconds: int = 60,
+        persist: bool = False,
+        prune_interval_seconds: float = 3600.0,
+    ):
+        """Initialize snapshot store.
+
+        Args:
+            max_snapshots: Maximum snapshots kept in memory (LRU eviction)
+            bucket_seconds: First pages within one bucket share a snapshot
+            persist: Mirror snapshots to the ranking_snapshots table
+            prune_interval_seconds: Minimum time between deletions of expired
+                mirrored snapshots (per process)
+        """
+        self.max_snapshots = max_snapshots
+        self.bucket_seconds = bucket_seconds
+        self.persist = persist
+        self.prune_interval_seconds = prune_interval_seconds
+        # Monotonic time of the last expired-snapshot deletion (None: never)
+        self._last_prune: Optional[float] = None
+        self._snapshots: "OrderedDict[SnapshotKey, List[str]]" = OrderedDict()
+        self._building: Dict[SnapshotKey, "asyncio.Future[List[str]]"] = {}
+        self.hits = 0
+        self.misses = 0
+        self.db_hits = 0
+        self.db_errors = 0
+        self.builds = 0
+        self.evictions = 0
+
+    def bucket(self, now: Optional[datetime] = None) -> datetime:
+        """Return the snapshot time for a first page requested at now."""
+        if now is None:
+            now = datetime.now(timezone.utc)
+        epoch = int(now.timestamp())
+        return datetime.fromtimestamp(epoch - epoch % self.bucket_seconds, tz=timezone.utc)
+
+    def _remember(self, key: SnapshotKey, ids: List[str]) -> None:
+        now = datetime.now(timezone.utc)
+        for stale in [k for k in self._snapshots if is_snapshot_expired(k[1], now)]:
+            del self._snapshots[stale]
+            self.evictions += 1
+        self._snapshots[key] = ids
+        self._snapshots.move_to_end(key)
+        while len(self._snapshots) > self.max_snapshots:
+            self._snapshots.popitem(last=False)
+            self.evictions += 1
+
+    async def _load(self, key: SnapshotKey, db: Any) -> Optional[List[str]]:
+        try:
+            return await RankingSnapshotRepository(db).get(ranking=key[0], snapshot_at=key[1])
+        except Exception as e:
+            self.db_errors += 1
+            logger.warning(f"Ranking snapshot load failed: {e}")
+            return None
+
+    async def _save(self, key: SnapshotKey, ids: List[str], db: Any) -> List[str]:
+        try:
+            # Read routes hand in a replica-preferring handle; writes need the primary
+            await db.use_primary()
+            repo = RankingSnapshotRepository(db)
+            stored = await repo.save(ranking=key[0], snapshot_at=key[1], ids=ids)
+            now = time.monotonic()
+            if self._last_prune is None or now - self._last_prune >= self.prune_interval_seconds:
+                self._last_prune = now
+                await repo.delete_older_than(before=key[1] - timedelta(hours=24))
+            return stored
+        except Exception as e:
+            self.db_errors += 1
+            logger.warning(f"Ranking snapshot save failed: {e}")
+            return ids
+
+    async def get(self, ranking: str, snapshot_at: datetime, db: Any = None) -> Optional[List[str]]:
+        """Return the frozen IDs for (ranking, snapshot_at), or None if unknown or expired.
+
+        Args:
+            ranking: Ranking name (e.g. "hot", "hot:question")
+            snapshot_at: Snapshot time
+            db: The request's connection handle (RequestConnection), used for
+                the Postgres mirror so no second pool connection is checked
+                out (mirror skipped if None). Saving moves it to the primary.
+        """
+        key = (ranking, snapshot_at)
+        if is_snapshot_expired(snapshot_at, datetime.now(timezone.utc)):
+            if self._snapshots.pop(key, None) is not None:
+                self.evictions += 1
+            self.misses += 1
+            return None
+
+        ids = self._snapshots.get(key)
+        if ids is not None:
+            self._snapshots.move_to_end(key)
+            self.hits += 1
+            return ids
+
+        if self.persist and db is not None:
+            ids = await self._load(key, db)
+            if ids is not None:
+                self.db_hits += 1
+                self._remember(key, ids)
+                return ids
+
+        self.misses += 1
+        return None
+
+    async def get_or_build(
+        self,
+        ranking: str,
+        snapshot_at: datetime,
+        build: Callable[[], Awaitable[List[str]]],
+        db: Any = None,
+    ) -> List[str]:
+        """Return the snapshot, building it once if missing.
+
+        Concurrent first pages for the same snapshot share one build.
+        db is the request's connection handle, as for get().
+        """
+        ids = await self.get(ranking, snapshot_at, db)
+        if ids is not None:
+            return ids
+
+        key = (ranking, snapshot_at)
+        pending = self._building.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: "asyncio.Future[List[str]]" = asyncio.get_running_loop().create_future()
+        self._building[key] = future
+        try:
+            ids = list(await build())[:SNAPSHOT_SIZE]
+            self.builds += 1
+            if self.persist and db is not None:
+                ids = await self._save(key, ids, db)
+            self._remember(key, ids)
+            future.set_result(ids)
+            return ids
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not reported twice
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            self._building.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return snapshot store counters for metrics."""
+        lookups = self.hits + self.db_hits + self.misses
+        return {
+            "snapshots": len(self._snapshots),
+            "maxSnapshots": self.max_snapshots,
+            "bucketSeconds": self.bucket_seconds,
+            "persist": self.persist,
+            "hits": self.hits,
+            "dbHits": self.db_hits,
+            "misses": self.misses,
+            "hitRate": round((self.hits + self.db_hits) / lookups, 4) if lookups else 0.0,
+            "builds": self.builds,
+            "evictions": self.evictions,
+            "dbErrors": self.db_errors,
+        }
+
+    def reset(self) -> None:
+        """Clear snapshots and counters (for testing)."""
+        self._snapshots.clear()
+        self._building.clear()
+        self.hits = 0
+        self.misses = 0
+        self.db_hits = 0
+        self.db_errors = 0
+        self.builds = 0
+        self.evictions = 0
+        self._last_prune = None
+
+
+# Global snapshot store used by ranked listings
+ranking_snapshots = RankingSnapshotStore(
+    max_snapshots=int(os.getenv("RANKING_SNAPSHOT_MAX_ENTRIES", "512")),
+    bucket_seconds=int(os.getenv("RANKING_SNAPSHOT_BUCKET_SECONDS", "60")),
+    persist=env_flag("RANKING_SNAPSHOT_PERSIST", "false"),
+    prune_interval_seconds=float(os.getenv("RANKING_SNAPSHOT_PRUNE_SECONDS", "3600")),
+)
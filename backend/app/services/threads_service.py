@@ -1,12 +1,67 @@
 """Thread service layer for business logic."""
 
-from typing import Any, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import hashlib
 import re
 
 from app.repositories.threads_repo import ThreadRepository
-from app.schemas.threads import CreateThreadRequest, ThreadCard, ThreadDetail, Tag, AuthorAffiliation, PaginatedThreadCards, create_excerpt
+from app.services.comments_service import CommentService
+from app.services.cursor import is_snapshot_expired
+from app.services.ranking_snapshots import SNAPSHOT_SIZE, ranking_snapshots
+from app.services.timeline_cache import timeline_cache
+from app.schemas.threads import CreateThreadRequest, ThreadCard, ThreadCardBatch, ThreadDetail, ThreadView, ViewerReactions, Tag, AuthorAffiliation, PaginatedThreadCards, create_excerpt
+from app.util.cursor import encode_cursor
 from app.util.errors import ValidationException
 
+# Default page size of the thread timelines, and the per-timeline caps on ?limit
+PAGE_SIZE = 20
+MAX_NEW_PAGE_SIZE = 100
+# Hot pages slice a snapshot of SNAPSHOT_SIZE ids
+MAX_HOT_PAGE_SIZE = 50
+# Upper bound on ids per GET /threads:batch
+MAX_BATCH_IDS = 100
+
+
+def _detail_etag(
+    thread_id: str,
+    up_count: int,
+    save_count: int,
+    last_activity_at: str,
+    solved_comment_id: Optional[str],
+    affiliation: Optional[AuthorAffiliation],
+    is_mine: bool,
+) -> str:
+    """Strong ETag over the detail fields that can change after creation.
+    
+    Title, body and tags are immutable; comments bump last_activity_at.
+    isMine is included because the body differs per caller.
+    """
+    version = (
+        thread_id,
+        up_count,
+        save_count,
+        last_activity_at,
+        solved_comment_id,
+        affiliation.faculty if affiliation else None,
+        affiliation.year if affiliation else None,
+        bool(is_mine),
+    )
+    return '"' + hashlib.blake2b(repr(version).encode(), digest_size=12).hexdigest() + '"'
+
+
+def thread_detail_etag(detail: ThreadDetail) -> str:
+    """Return the ETag of a built ThreadDetail."""
+    return _detail_etag(
+        detail.id,
+        detail.upCount,
+        detail.saveCount,
+        detail.lastActivityAt,
+        detail.solvedCommentId,
+        detail.authorAffiliation,
+        detail.isMine,
+    )
+
 
 class ThreadService:
     """Service layer for thread operations."""
@@ -73,6 +128,9 @@ class ThreadService:
             # Propagate repository errors
             raise e
         
+        # The new thread heads the 'new' timeline
+        timeline_cache.invalidate()
+        
         # Get the created thread to return as ThreadCard
         thread_data = await repo.get_thread_by_id(thread_id=thread_id)
         
@@ -115,24 +173,169 @@ class ThreadService:
         if not thread_data:
             return None
         
-        # TODO: Get tags from database in later phase
-        # For now, use empty list
-        tags = []
+        tags_by_thread = await self._load_tags(repo, [thread_id])
+        tags = tags_by_thread.get(thread_id, [])
         
         # Convert to ThreadDetail DTO
         return self._to_thread_detail(thread_data, current_user_id, tags)
     
+    async def get_thread_cards(
+        self,
+        *,
+        thread_ids: Sequence[str],
+        current_user_id: Optional[str]
+    ) -> ThreadCardBatch:
+        """Look up thread cards for a list of IDs in one query.
+        
+        Args:
+            thread_ids: Thread IDs in the order the caller wants them back
+                (duplicates are returned once)
+            current_user_id: ID of the current user
+            
+        Returns:
+            ThreadCardBatch with the live threads in request order and the
+            IDs that do not exist or are deleted
+            
+        Raises:
+            ValidationException: If no IDs, more than MAX_BATCH_IDS, or any
+                ID is malformed (all malformed IDs are listed in details)
+        """
+        ids = list(dict.fromkeys(thread_ids))
+        if not ids:
+            raise ValidationException("ids is required")
+        if len(ids) > MAX_BATCH_IDS:
+            raise ValidationException(f"ids must contain at most {MAX_BATCH_IDS} thread IDs")
+        details = [
+            {"field": f"ids[{index}]", "reason": "INVALID_FORMAT"}
+            for index, thread_id in enumerate(thread_ids)
+            if not self._is_valid_thread_id(thread_id)
+        ]
+        if details:
+            raise ValidationException("Invalid thread ID", details=details)
+        
+        repo = ThreadRepository(self._db)
+        rows = await repo.get_thread_cards_by_ids(ids=ids)
+        tags_by_thread = await self._load_tags(repo, [row["id"] for row in rows])
+        
+        found = {row["id"] for row in rows}
+        return ThreadCardBatch(
+            items=[
+                self._to_thread_card(thread_data, current_user_id, tags_by_thread.get(thread_data["id"], []))
+                for thread_data in rows
+            ],
+            missing=[thread_id for thread_id in ids if thread_id not in found]
+        )
+    
+    async def get_thread_view(
+        self,
+        *,
+        thread_id: str,
+        current_user_id: Optional[str]
+    ) -> Optional[ThreadView]:
+        """Get the detail, first comment page and caller's reactions in one pass.
+        
+        Runs on this service's connection: the thread row (with the caller's
+        up/save flags in the same statement), its tags and the first comment
+        page, plus the solved comment only when it is not on that page.
+        
+        Args:
+            thread_id: ID of the thread to retrieve
+            current_user_id: ID of the current user (None for anonymous)
+            
+        Returns:
+            ThreadView if thread exists and not deleted, None otherwise
+            
+        Raises:
+            ValidationException: If thread ID format is invalid
+        """
+        if not self._is_valid_thread_id(thread_id):
+            raise ValidationException("Invalid thread ID")
+        
+        repo = ThreadRepository(self._db)
+        thread_data = await repo.get_thread_by_id(thread_id=thread_id, viewer_id=current_user_id)
+        if not thread_data:
+            return None
+        
+        tags_by_thread = await self._load_tags(repo, [thread_id])
+        detail = self._to_thread_detail(thread_data, current_user_id, tags_by_thread.get(thread_id, []))
+        
+        comment_service = CommentService(self._db)
+        comments = await comment_service.list_comments(
+            thread_id=thread_id,
+            current_user_id=current_user_id
+        )
+        
+        pinned = None
+        solved_comment_id = thread_data.get("solved_comment_id")
+        if solved_comment_id:
+            pinned = next((comment for comment in comments.items if comment.id == solved_comment_id), None)
+            if pinned is None:
+                pinned = await comment_service.get_comment(thread_id=thread_id, comment_id=solved_comment_id)
+        
+        my_reactions = None
+        if current_user_id:
+            my_reactions = ViewerReactions(
+                up=bool(thread_data.get("viewer_up")),
+                save=bool(thread_data.get("viewer_save"))
+            )
+        
+        return ThreadView(
+            thread=detail,
+            comments=comments,
+            pinnedComment=pinned,
+            myReactions=my_reactions
+        )
+    
+    async def get_thread_etag(
+        self,
+        *,
+        thread_id: str,
+        current_user_id: Optional[str]
+    ) -> Optional[str]:
+        """Get the current detail ETag from a version probe, without loading the body.
+        
+        Args:
+            thread_id: ID of the thread
+            current_user_id: ID of the current user
+            
+        Returns:
+            The ETag thread_detail_etag() would give the detail, or None if
+            the thread does not exist (the caller falls back to the full read)
+        """
+        repo = ThreadRepository(self._db)
+        version = await repo.get_thread_version(thread_id=thread_id)
+        if not version:
+            return None
+        
+        last_activity_at = version.get("last_activity_at")
+        if hasattr(last_activity_at, "isoformat"):
+            last_activity_at = last_activity_at.isoformat().replace("+00:00", "Z")
+        
+        return _detail_etag(
+            version["id"],
+            version.get("up_count", 0),
+            version.get("save_count", 0),
+            str(last_activity_at),
+            version.get("solved_comment_id"),
+            self._author_affiliation(version),
+            version.get("author_id") == current_user_id,
+        )
+    
     async def list_threads_new(
         self,
         *,
         cursor: Optional[str] = None,
-        current_user_id: str
+        current_user_id: str,
+        kind: Optional[str] = None,
+        limit: int = PAGE_SIZE
     ) -> PaginatedThreadCards:
         """List threads in newest order.
         
         Args:
             cursor: Pagination cursor
             current_user_id: ID of the current user
+            kind: Optional 種別 filter; cursors are only valid for the filter they were issued for
+            limit: Page size (1..MAX_NEW_PAGE_SIZE, validated by the router)
             
         Returns:
             PaginatedThreadCards with list of threads
@@ -140,6 +343,13 @@ class ThreadService:
         Raises:
             ValidationException: If cursor is invalid
         """
+        # Leading default-size pages are served from the in-process cache (isMine applied per caller)
+        cacheable = limit == PAGE_SIZE
+        generation = timeline_cache.generation
+        cached = timeline_cache.get(cursor, current_user_id, kind) if cacheable else None
+        if cached is not None:
+            return cached
+        
         # Validate cursor if provided
         if cursor:
             try:
@@ -148,6 +358,8 @@ class ThreadService:
                 anchor, errors = validate_threads_cursor(cursor_data)
                 if errors:
                     raise ValidationException("Invalid cursor format")
+                if anchor.get("type") != kind:
+                    raise ValidationException("Cursor does not match the type filter")
             except ValidationException:
                 raise
             except Exception:
@@ -157,24 +369,189 @@ class ThreadService:
         repo = ThreadRepository(self._db)
         
         # Get threads from repository
-        result = await repo.list_threads_new(cursor=cursor, limit=20)
+        result = await repo.list_threads_new(cursor=cursor, limit=limit, kind=kind)
         
-        # Convert threads to ThreadCards
+        # Convert threads to ThreadCards (tags for the whole page in one query)
+        tags_by_thread = await self._load_tags(repo, [row["id"] for row in result["items"]])
         thread_cards = []
         for thread_data in result["items"]:
-            # TODO: Get tags from database in later phase
-            tags = []
+            tags = tags_by_thread.get(thread_data["id"], [])
             thread_card = self._to_thread_card(thread_data, current_user_id, tags)
             thread_cards.append(thread_card)
         
         # Use nextCursor directly from repository
         next_cursor = result.get("nextCursor", None)
         
+        if cacheable:
+            timeline_cache.put(
+                cursor,
+                [card.model_copy(update={"isMine": None}) for card in thread_cards],
+                [thread_data.get("author_id") for thread_data in result["items"]],
+                next_cursor,
+                generation,
+                kind,
+                from_replica=getattr(self._db, "role", None) == "replica",
+            )
+        
         return PaginatedThreadCards(
             items=thread_cards,
             nextCursor=next_cursor
         )
     
+    async def list_threads_hot(
+        self,
+        *,
+        cursor: Optional[str] = None,
+        current_user_id: str,
+        kind: Optional[str] = None,
+        limit: int = PAGE_SIZE
+    ) -> Tuple[PaginatedThreadCards, str]:
+        """List threads in hot order from a ranking snapshot.
+        
+        The first page freezes the top IDs for the current snapshot bucket;
+        later pages slice the same list by offset. If the snapshot is no
+        longer held (e.g. evicted), paging continues on the live ranking
+        from the cursor's (score, createdAt, id).
+        
+        Args:
+            cursor: Pagination cursor ({score, createdAt, id, snapshotAt, offset[, type]})
+            current_user_id: ID of the current user
+            kind: Optional 種別 filter (snapshotted separately per filter)
+            limit: Page size (1..MAX_HOT_PAGE_SIZE, validated by the router);
+                the offset cursor lets it change from page to page
+            
+        Returns:
+            Tuple of PaginatedThreadCards and the snapshotAt (ISO8601 UTC)
+            
+        Raises:
+            ValidationException: If cursor is invalid or its snapshot is older than 24h
+        """
+        now = datetime.now(timezone.utc)
+        anchor = None
+        offset = 0
+        if cursor:
+            try:
+                from app.util.cursor import decode_cursor, validate_threads_cursor
+                cursor_data = decode_cursor(cursor)
+                anchor, errors = validate_threads_cursor(cursor_data)
+                if errors or "score" not in anchor:
+                    raise ValidationException("Invalid cursor format")
+                if anchor.get("type") != kind:
+                    raise ValidationException("Cursor does not match the type filter")
+                snapshot_at = datetime.fromisoformat(cursor_data["snapshotAt"].replace("Z", "+00:00"))
+                offset = cursor_data["offset"]
+                if not isinstance(offset, int) or offset < 0:
+                    raise ValidationException("Invalid cursor format")
+            except ValidationException:
+                raise
+            except Exception:
+                raise ValidationException("Invalid cursor")
+            if is_snapshot_expired(snapshot_at, now):
+                raise ValidationException("Snapshot expired, reload from the first page")
+        else:
+            snapshot_at = ranking_snapshots.bucket(now)
+        
+        repo = ThreadRepository(self._db)
+        ranking = f"hot:{kind}" if kind else "hot"
+        if cursor:
+            ids = await ranking_snapshots.get(ranking, snapshot_at, self._db)
+        else:
+            ids = await ranking_snapshots.get_or_build(
+                ranking, snapshot_at, lambda: repo.list_hot_ids(limit=SNAPSHOT_SIZE, kind=kind), self._db
+            )
+        
+        if ids is not None:
+            # Skip over slices whose threads were all deleted since the snapshot
+            rows: list = []
+            while not rows and offset < len(ids):
+                page_ids = ids[offset:offset + limit]
+                offset += len(page_ids)
+                rows = await repo.get_thread_cards_by_ids(ids=page_ids)
+            has_more = offset < len(ids)
+        else:
+            result = await repo.list_threads_hot(anchor=anchor, limit=limit, kind=kind)
+            rows = result["items"]
+            offset += len(rows)
+            has_more = result.get("nextCursor") is not None and offset < SNAPSHOT_SIZE
+        
+        snapshot_at_str = snapshot_at.isoformat().replace("+00:00", "Z")
+        next_cursor = None
+        if has_more and rows:
+            last_item = rows[-1]
+            cursor_data = {
+                "v": 1,
+                "score": last_item["hot_rank"],
+                "createdAt": last_item["created_at"].isoformat().replace("+00:00", "Z"),
+                "id": last_item["id"],
+                "snapshotAt": snapshot_at_str,
+                "offset": offset
+            }
+            if kind:
+                cursor_data["type"] = kind
+            next_cursor = encode_cursor(cursor_data)
+        
+        tags_by_thread = await self._load_tags(repo, [row["id"] for row in rows])
+        thread_cards = [
+            self._to_thread_card(thread_data, current_user_id, tags_by_thread.get(thread_data["id"], []))
+            for thread_data in rows
+        ]
+        
+        page = PaginatedThreadCards(items=thread_cards, nextCursor=next_cursor)
+        return page, snapshot_at_str
+    
+    async def list_saved_threads(
+        self,
+        *,
+        user_id: str,
+        cursor: Optional[str] = None,
+        limit: int = PAGE_SIZE
+    ) -> PaginatedThreadCards:
+        """List the threads a user saved, most recently saved first.
+        
+        Args:
+            user_id: ID of the current user (owner of the saves)
+            cursor: Pagination cursor ({v, savedAt, id})
+            limit: Page size (1..MAX_NEW_PAGE_SIZE, validated by the router)
+            
+        Returns:
+            PaginatedThreadCards of live saved threads
+            
+        Raises:
+            ValidationException: If cursor is invalid
+        """
+        anchor_saved_at = None
+        anchor_id = None
+        if cursor:
+            try:
+                from app.util.cursor import decode_cursor
+                cursor_data = decode_cursor(cursor)
+                anchor_saved_at = datetime.fromisoformat(cursor_data["savedAt"].replace("Z", "+00:00"))
+                anchor_id = cursor_data["id"]
+                if cursor_data.get("v") != 1 or not isinstance(anchor_id, str):
+                    raise ValidationException("Invalid cursor format")
+            except ValidationException:
+                raise
+            except Exception:
+                raise ValidationException("Invalid cursor")
+        
+        repo = ThreadRepository(self._db)
+        result = await repo.list_saved_threads(
+            user_id=user_id,
+            anchor_saved_at=anchor_saved_at,
+            anchor_id=anchor_id,
+            limit=limit
+        )
+        
+        rows = result["items"]
+        tags_by_thread = await self._load_tags(repo, [row["id"] for row in rows])
+        return PaginatedThreadCards(
+            items=[
+                self._to_thread_card(thread_data, user_id, tags_by_thread.get(thread_data["id"], []))
+                for thread_data in rows
+            ],
+            nextCursor=result.get("nextCursor")
+        )
+    
     async def delete_thread(
         self,
         *,
@@ -219,6 +596,17 @@ class ThreadService:
         
         # Perform soft delete
         await repo.soft_delete_thread(thread_id=thread_id, author_id=current_user_id)
+        timeline_cache.invalidate()
+    
+    async def _load_tags(self, repo: ThreadRepository, thread_ids: List[str]) -> Dict[str, List[Tag]]:
+        """Fetch tags for all given threads in a single query, grouped by thread ID."""
+        if not thread_ids:
+            return {}
+        rows_by_thread = await repo.get_tags_by_thread_ids(thread_ids=thread_ids)
+        return {
+            thread_id: [Tag(key=tag["key"], value=tag["value"]) for tag in tags]
+            for thread_id, tags in rows_by_thread.items()
+        }
     
     def _is_valid_thread_id(self, thread_id: str) -> bool:
         """Validate thread ID format.
@@ -243,6 +631,15 @@ class ThreadService:
         valid_chars = set("0123456789ABCDEFGHJKMNPQRSTVWXYZ")
         return all(c in valid_chars for c in ulid_part)
     
+    def _author_affiliation(self, thread_data: dict) -> Optional[AuthorAffiliation]:
+        """Build the author's public affiliation from the joined users columns."""
+        if thread_data.get("author_faculty") or thread_data.get("author_year"):
+            return AuthorAffiliation(
+                faculty=thread_data.get("author_faculty"),
+                year=thread_data.get("author_year")
+            )
+        return None
+    
     def _to_thread_card(self, thread_data: dict, current_user_id: str, tags: list[Tag]) -> ThreadCard:
         """Convert thread data to ThreadCard DTO.
         
@@ -254,8 +651,11 @@ class ThreadService:
         Returns:
             ThreadCard DTO
         """
-        # Create excerpt from body using standard 120 char length
-        excerpt = create_excerpt(thread_data.get("body", ""), 120)
+        # Use the excerpt stored at write time; rows not yet backfilled
+        # fall back to the standard 120 char excerpt of the body
+        excerpt = thread_data.get("excerpt")
+        if excerpt is None:
+            excerpt = create_excerpt(thread_data.get("body") or "", 120)
         
         # Determine if thread is solved
         is_solved = thread_data.get("solved_comment_id") is not None
@@ -263,8 +663,11 @@ class ThreadService:
         # Determine if thread belongs to current user
         is_mine = thread_data.get("author_id") == current_user_id
         
-        # TODO: Get actual comment count from comments table in later phase
-        comment_count = 0
+        # Reply stats are denormalized on threads (maintained by comment writes)
+        comment_count = thread_data.get("comment_count") or 0
+        last_reply_at = thread_data.get("last_reply_at")
+        if hasattr(last_reply_at, "isoformat"):
+            last_reply_at = last_reply_at.isoformat().replace("+00:00", "Z")
         
         # Format timestamp
         created_at = thread_data.get("created_at")
@@ -282,11 +685,12 @@ class ThreadService:
             replies=comment_count,
             saves=thread_data.get("save_count", 0),
             createdAt=created_at_str,
-            lastReplyAt=None,  # TODO: Get from comments table
+            lastReplyAt=last_reply_at,
             hasImage=False,  # TODO: Check attachments table in P3
             imageThumbUrl=None,
             solved=is_solved,
-            authorAffiliation=None  # Phase 1: No JOIN implementation yet
+            authorAffiliation=self._author_affiliation(thread_data),
+            isMine=is_mine
         )
     
     def _to_thread_detail(self, thread_data: dict, current_user_id: str, tags: list[Tag]) -> ThreadDetail:
@@ -328,7 +732,7 @@ class ThreadService:
             solvedCommentId=thread_data.get("solved_comment_id"),
             hasImage=False,  # TODO: Check attachments table in P3
             imageUrl=None,  # TODO: Get from attachments in P3
-            authorAffiliation=None,  # Phase 1: No JOIN implementation yet
+            authorAffiliation=self._author_affiliation(thread_data),
             isMine=is_mine
         )
     
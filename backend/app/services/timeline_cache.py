@@ -0,0 +1,200 @@
+"""In-process cache of the first pages of the 'new' timeline.
+
+Pages are stored user-agnostic (isMine unset) together with each card's
+author, and isMine is applied per request on the way out, so one cached
+page serves every caller. Each type filter (種別) has its own leading
+pages. Thread creation and deletion on this instance clear the cache;
+writes made on other instances are never seen as invalidations, so a page
+can be up to ttl_seconds stale for them and for counters (saves, replies)
+that change in place. A page read from a replica within
+replica_lag_seconds of a local invalidation is not stored, since the
+replica may not show the write yet.
+"""
+
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.schemas.threads import PaginatedThreadCards, ThreadCard
+from app.util.env import env_flag
+
+# Cursor key of the first page
+FIRST_PAGE = ""
+
+# (type filter, cursor key)
+PageKey = Tuple[Optional[str], str]
+
+
+class TimelineCache:
+    """Caches the first max_pages pages of GET /threads?sort=new (per type filter)."""
+
+    def __init__(
+        self,
+        max_pages: int = 3,
+        ttl_seconds: float = 10.0,
+        enabled: bool = True,
+        max_depths: int = 1024,
+        replica_lag_seconds: float = 5.0,
+    ):
+        """Initialize timeline cache.
+
+        Args:
+            max_pages: Number of leading pages cached (first page plus followers)
+            ttl_seconds: Maximum age of a served page
+            enabled: When False, nothing is cached
+            max_depths: Maximum follow-up cursors remembered (oldest dropped first)
+            replica_lag_seconds: After an invalidation, replica reads are not
+                stored for this long
+        """
+        self.max_pages = max_pages
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self.max_depths = max_depths
+        self.replica_lag_seconds = replica_lag_seconds
+        # Store: page key -> (cards, author_ids, next_cursor, stored_at, size_bytes)
+        self._pages: Dict[PageKey, Tuple[List[ThreadCard], List[str], Optional[str], float, int]] = {}
+        # Cursors handed out by cached pages -> page number they lead to.
+        # Dropping one only makes that page uncacheable until the next refill.
+        self._depths: "OrderedDict[PageKey, int]" = OrderedDict()
+        # Bumped on every invalidation; pages read before it are not stored
+        self.generation = 0
+        self.invalidated_at: Optional[float] = None
+        self.replica_fills_skipped = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.served_age_sum = 0.0
+        self.served_age_max = 0.0
+
+    def _depth(self, key: PageKey) -> Optional[int]:
+        if key[1] == FIRST_PAGE:
+            return 1
+        return self._depths.get(key)
+
+    def get(
+        self,
+        cursor: Optional[str],
+        current_user_id: Optional[str],
+        kind: Optional[str] = None,
+    ) -> Optional[PaginatedThreadCards]:
+        """Return the cached page for (kind, cursor) with isMine applied, or None."""
+        if not self.enabled:
+            return None
+        key = (kind, cursor or FIRST_PAGE)
+        if self._depth(key) is None:
+            # Not one of the leading pages; never cached
+            return None
+
+        entry = self._pages.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        cards, author_ids, next_cursor, stored_at, _ = entry
+        age = time.monotonic() - stored_at
+        if age > self.ttl_seconds:
+            del self._pages[key]
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.served_age_sum += age
+        self.served_age_max = max(self.served_age_max, age)
+        return PaginatedThreadCards(
+            items=[
+                card.model_copy(update={"isMine": author_id == current_user_id})
+                for card, author_id in zip(cards, author_ids)
+            ],
+            nextCursor=next_cursor,
+        )
+
+    def put(
+        self,
+        cursor: Optional[str],
+        cards: List[ThreadCard],
+        author_ids: List[str],
+        next_cursor: Optional[str],
+        generation: int,
+        kind: Optional[str] = None,
+        from_replica: bool = False,
+    ) -> None:
+        """Store a user-agnostic page read while generation was current.
+
+        A page read from a replica shortly after an invalidation is dropped:
+        the replica may still be behind the write that caused it.
+        """
+        if not self.enabled or generation != self.generation:
+            return
+        if (
+            from_replica
+            and self.invalidated_at is not None
+            and time.monotonic() - self.invalidated_at < self.replica_lag_seconds
+        ):
+            self.replica_fills_skipped += 1
+            return
+        key = (kind, cursor or FIRST_PAGE)
+        depth = self._depth(key)
+        if depth is None or depth > self.max_pages:
+            return
+
+        size = sum(len(card.model_dump_json()) for card in cards)
+        self._pages[key] = (list(cards), list(author_ids), next_cursor, time.monotonic(), size)
+        if next_cursor and depth < self.max_pages:
+            self._depths[(kind, next_cursor)] = depth + 1
+            self._depths.move_to_end((kind, next_cursor))
+            while len(self._depths) > self.max_depths:
+                self._depths.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every cached page (a thread was created or deleted)."""
+        self.generation += 1
+        self.invalidations += 1
+        self.invalidated_at = time.monotonic()
+        self._pages.clear()
+        self._depths.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters for metrics."""
+        lookups = self.hits + self.misses
+        now = time.monotonic()
+        return {
+            "enabled": self.enabled,
+            "pages": len(self._pages),
+            "maxPages": self.max_pages,
+            "ttlSeconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "cursors": len(self._depths),
+            "replicaFillsSkipped": self.replica_fills_skipped,
+            "approxBytes": sum(entry[4] for entry in self._pages.values()),
+            "oldestPageAgeSeconds": round(max((now - entry[3] for entry in self._pages.values()), default=0.0), 3),
+            "servedAgeAvgSeconds": round(self.served_age_sum / self.hits, 3) if self.hits else 0.0,
+            "servedAgeMaxSeconds": round(self.served_age_max, 3),
+        }
+
+    def reset(self) -> None:
+        """Clear pages and counters (for testing)."""
+        self._pages.clear()
+        self._depths.clear()
+        self.generation = 0
+        self.invalidated_at = None
+        self.replica_fills_skipped = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.served_age_sum = 0.0
+        self.served_age_max = 0.0
+
+
+# Global cache used by ThreadService.list_threads_new
+timeline_cache = TimelineCache(
+    max_pages=int(os.getenv("TIMELINE_CACHE_PAGES", "3")),
+    ttl_seconds=float(os.getenv("TIMELINE_CACHE_TTL_SECONDS", "10")),
+    enabled=env_flag("TIMELINE_CACHE_ENABLED", "true"),
+    max_depths=int(os.getenv("TIMELINE_CACHE_MAX_CURSORS", "1024")),
+    # Replica lag is assumed to stay within the read-your-writes pin window
+    replica_lag_seconds=float(os.getenv("DB_READ_PRIMARY_PIN_SECONDS", "5")),
+)
@@ -90,6 +90,11 @@ def validate_threads_cursor(obj: Dict[str, Any]) -> tuple:
         if not isinstance(obj["score"], (int, float)):
             errors["score"] = "Score must be a number"
     
+    # Validate type filter if present (type-filtered timelines)
+    if "type" in obj:
+        if not isinstance(obj["type"], str):
+            errors["type"] = "Type must be a string"
+    
     # If there are errors, return None for anchor
     if errors:
         return None, errors
@@ -104,6 +109,10 @@ def validate_threads_cursor(obj: Dict[str, Any]) -> tuple:
     if "score" in obj:
         anchor["score"] = obj["score"]
     
+    # Include the type filter the cursor was issued for
+    if "type" in obj:
+        anchor["type"] = obj["type"]
+    
     return anchor, None
 
 
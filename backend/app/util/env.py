@@ -0,0 +1,8 @@
+"""Environment variable helpers."""
+
+import os
+
+
+def env_flag(name: str, default: str) -> bool:
+    """Read a boolean flag from the environment."""
+    return os.getenv(name, default).strip().lower() not in ("0", "false", "no", "off")
@@ -21,6 +21,7 @@ class ErrorCode:
     CONFLICT = "CONFLICT"
     RATE_LIMITED = "RATE_LIMITED"
     INTERNAL = "INTERNAL"
+    UNAVAILABLE = "UNAVAILABLE"
 
 
 class ErrorDetail(BaseModel):
@@ -142,6 +143,19 @@ class InternalException(BaseAPIException):
         super().__init__(500, ErrorCode.INTERNAL, message, details)
 
 
+class ServiceUnavailableException(BaseAPIException):
+    """503 Service Unavailable (transient; the client may retry)."""
+    
+    def __init__(
+        self,
+        message: str = "Service temporarily unavailable",
+        retry_after: Optional[int] = None,
+        details: Optional[List[Dict[str, Any]]] = None,
+    ):
+        super().__init__(503, ErrorCode.UNAVAILABLE, message, details)
+        self.retry_after = retry_after
+
+
 def _get_or_generate_request_id(request: Request) -> str:
     """Get request ID from request state or generate a new one."""
     request_id = getattr(request.state, "request_id", None)
@@ -168,8 +182,8 @@ def api_exception_handler(request: Request, exc: BaseAPIException) -> JSONRespon
     
     headers = {"X-Request-Id": request_id}
     
-    # Add rate limit headers if applicable
-    if isinstance(exc, RateLimitedException) and exc.retry_after:
+    # Add Retry-After for rate limits and transient unavailability
+    if isinstance(exc, (RateLimitedException, ServiceUnavailableException)) and exc.retry_after:
         headers["Retry-After"] = str(exc.retry_after)
     
     logger.warning(
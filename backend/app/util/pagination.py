@@ -0,0 +1,27 @@
+"""Page size validation and next-page links for list endpoints."""
+
+from typing import Optional
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+
+from app.util.errors import ValidationException
+
+
+def validate_limit(limit: int, maximum: int) -> None:
+    """Reject page sizes outside 1..maximum."""
+    if not 1 <= limit <= maximum:
+        raise ValidationException(f"limit must be between 1 and {maximum}")
+
+
+def set_next_link(request: Request, response: Response, next_cursor: Optional[str]) -> None:
+    """Advertise the next page as a Link: rel="next" header (RFC 8288).
+
+    The target is the current request with cursor replaced, so clients can
+    prefetch it without rebuilding the query themselves.
+    """
+    if not next_cursor:
+        return
+    params = dict(request.query_params)
+    params["cursor"] = next_cursor
+    response.headers["Link"] = f'<{request.url.path}?{urlencode(params)}>; rel="next"'
@@ -0,0 +1,34 @@
+"""Per-request context (request id, route) for code outside the handler.
+
+Values are held in contextvars so the DB layer can label metrics and logs
+without threading the Request object through every call.
+"""
+
+from contextvars import ContextVar
+from typing import Optional
+
+from fastapi import Request
+
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+route_var: ContextVar[Optional[str]] = ContextVar("route", default=None)
+
+
+def get_request_id() -> str:
+    """Return the current X-Request-Id, or "-" outside a request."""
+    return request_id_var.get() or "-"
+
+
+def get_route() -> str:
+    """Return the current route label (e.g. "GET /threads/{thread_id}")."""
+    return route_var.get() or "background"
+
+
+async def bind_route(request: Request) -> None:
+    """App-wide dependency that records the matched route template.
+
+    Runs after routing, so the path template (not the raw path with IDs)
+    is used and metric labels stay low-cardinality.
+    """
+    route = request.scope.get("route")
+    path = getattr(route, "path", None) or request.url.path
+    route_var.set(f"{request.method} {path}")
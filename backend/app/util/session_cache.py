@@ -0,0 +1,234 @@
+"""In-process positive/negative caches for bearer token lookups."""
+
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from app.util.env import env_flag
+
+
+class SessionCache:
+    """Bounded TTL/LRU cache of validated sessions keyed by token_hash.
+
+    Entries never outlive the session's own expires_at, so an expired
+    session is never served from the cache even if the TTL has not elapsed.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 60.0, enabled: bool = True):
+        """Initialize session cache.
+
+        Args:
+            max_size: Maximum number of cached sessions (LRU eviction beyond this)
+            ttl_seconds: Maximum time an entry is trusted without re-checking the DB
+            enabled: When False, every lookup is a miss and nothing is stored
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        # Store: token_hash -> (user_id, valid_until_epoch)
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, token_hash: str) -> Optional[str]:
+        """Return cached user ID for token_hash, or None on miss/expiry.
+
+        Args:
+            token_hash: SHA256 hash of the bearer token
+
+        Returns:
+            User ID if a valid entry exists, None otherwise
+        """
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(token_hash)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        user_id, valid_until = entry
+        if valid_until <= time.time():
+            # TTL elapsed or session expired
+            del self._entries[token_hash]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(token_hash)
+        self.hits += 1
+        return user_id
+
+    def peek(self, token_hash: str) -> Optional[str]:
+        """Return cached user ID without touching LRU order or counters."""
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(token_hash)
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry[0]
+
+    def set(self, token_hash: str, user_id: str, expires_at: datetime) -> None:
+        """Cache a validated session.
+
+        Args:
+            token_hash: SHA256 hash of the bearer token
+            user_id: Owner of the session
+            expires_at: Session expiry (timezone-aware)
+        """
+        if not self.enabled or self.max_size <= 0:
+            return
+
+        valid_until = min(time.time() + self.ttl_seconds, expires_at.timestamp())
+        if valid_until <= time.time():
+            return
+
+        self._entries[token_hash] = (user_id, valid_until)
+        self._entries.move_to_end(token_hash)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, token_hash: str) -> bool:
+        """Drop a single session (e.g. on logout/revocation).
+
+        Returns:
+            True if an entry was removed
+        """
+        return self._entries.pop(token_hash, None) is not None
+
+    def invalidate_user(self, user_id: str) -> int:
+        """Drop every cached session belonging to user_id.
+
+        Returns:
+            Number of entries removed
+        """
+        stale = [key for key, (owner, _) in self._entries.items() if owner == user_id]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters for metrics."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "maxSize": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hitRatio": (self.hits / lookups) if lookups else 0.0,
+        }
+
+    def reset(self) -> None:
+        """Reset all cache state (for testing)."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+class NegativeTokenCache:
+    """Bounded TTL set of recently rejected token hashes.
+
+    Repeated unknown or expired tokens are rejected without a sessions
+    lookup. Keys are truncated to 16 bytes of the SHA256 digest to keep the
+    set compact; an exact set (rather than a Bloom filter) is used so a
+    valid token can never be rejected by a false positive.
+    """
+
+    def __init__(self, max_size: int = 50000, ttl_seconds: float = 300.0, enabled: bool = True):
+        """Initialize negative token cache.
+
+        Args:
+            max_size: Maximum number of remembered rejections (oldest dropped first)
+            ttl_seconds: How long a rejection is remembered
+            enabled: When False, nothing is remembered and nothing is shed
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        # Store: digest prefix -> rejected_until_epoch (insertion ordered)
+        self._entries: "OrderedDict[bytes, float]" = OrderedDict()
+        self.shed = 0
+        self.recorded = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(token_hash: str) -> bytes:
+        return bytes.fromhex(token_hash[:32])
+
+    def contains(self, token_hash: str) -> bool:
+        """Return True (and count a shed lookup) if token_hash was recently rejected."""
+        if not self.enabled:
+            return False
+
+        key = self._key(token_hash)
+        rejected_until = self._entries.get(key)
+        if rejected_until is None:
+            return False
+
+        if rejected_until <= time.time():
+            del self._entries[key]
+            return False
+
+        self.shed += 1
+        return True
+
+    def add(self, token_hash: str) -> None:
+        """Remember a rejected token hash."""
+        if not self.enabled or self.max_size <= 0:
+            return
+
+        key = self._key(token_hash)
+        self._entries[key] = time.time() + self.ttl_seconds
+        self._entries.move_to_end(key)
+        self.recorded += 1
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def discard(self, token_hash: str) -> None:
+        """Forget a rejection (e.g. the token was just issued)."""
+        self._entries.pop(self._key(token_hash), None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters for metrics."""
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "maxSize": self.max_size,
+            "shed": self.shed,
+            "recorded": self.recorded,
+            "evictions": self.evictions,
+        }
+
+    def reset(self) -> None:
+        """Reset all state (for testing)."""
+        self._entries.clear()
+        self.shed = 0
+        self.recorded = 0
+        self.evictions = 0
+
+
+# Global session cache used by get_current_user
+# SESSION_CACHE_ENABLED=false turns it off entirely
+session_cache = SessionCache(
+    max_size=int(os.getenv("SESSION_CACHE_MAX_SIZE", "10000")),
+    ttl_seconds=float(os.getenv("SESSION_CACHE_TTL_SECONDS", "60")),
+    enabled=env_flag("SESSION_CACHE_ENABLED", "true"),
+)
+
+# Global negative cache of rejected tokens used by get_current_user
+# NEGATIVE_TOKEN_CACHE_ENABLED=false turns it off entirely
+negative_token_cache = NegativeTokenCache(
+    max_size=int(os.getenv("NEGATIVE_TOKEN_CACHE_MAX_SIZE", "50000")),
+    ttl_seconds=float(os.getenv("NEGATIVE_TOKEN_CACHE_TTL_SECONDS", "300")),
+    enabled=env_flag("NEGATIVE_TOKEN_CACHE_ENABLED", "true"),
+)
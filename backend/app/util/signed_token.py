@@ -0,0 +1,274 @@
+"""HMAC-signed self-verifying session tokens.
+
+Format: ``st1.<payload>.<signature>`` where payload is the base64url encoding
+of ``user_id|session_id|expires_epoch`` and signature is the base64url
+HMAC-SHA256 of ``st1.<payload>`` under SESSION_TOKEN_SECRET. Opaque tokens
+from ``secrets.token_urlsafe`` never contain ``.``, so the two formats can
+coexist during migration.
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, NamedTuple, Optional
+
+from app.util.env import env_flag
+
+SIGNED_TOKEN_PREFIX = "st1."
+
+
+class SignedTokenClaims(NamedTuple):
+    """Claims carried by a signed token."""
+    user_id: str
+    session_id: str
+    expires_at: datetime
+
+
+def get_token_secret() -> Optional[bytes]:
+    """Return the HMAC key from SESSION_TOKEN_SECRET, or None if unset."""
+    secret = os.getenv("SESSION_TOKEN_SECRET")
+    return secret.encode() if secret else None
+
+
+def get_token_mode() -> str:
+    """Return the token format issued by bootstrap: 'opaque' or 'signed'."""
+    mode = os.getenv("AUTH_TOKEN_MODE", "opaque").strip().lower()
+    return mode if mode in ("opaque", "signed") else "opaque"
+
+
+def is_signed_token(token: str) -> bool:
+    """Return True if token uses the signed format."""
+    return token.startswith(SIGNED_TOKEN_PREFIX)
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _sign(signing_input: str, secret: bytes) -> str:
+    return _b64encode(hmac.new(secret, signing_input.encode(), hashlib.sha256).digest())
+
+
+def encode_signed_token(user_id: str, session_id: str, expires_at: datetime, secret: bytes) -> str:
+    """Create a signed token.
+
+    Args:
+        user_id: Owner of the session
+        session_id: Session ID (used for revocation)
+        expires_at: Session expiry (timezone-aware)
+        secret: HMAC key
+
+    Returns:
+        Signed token string
+    """
+    payload = _b64encode(f"{user_id}|{session_id}|{int(expires_at.timestamp())}".encode())
+    signing_input = f"{SIGNED_TOKEN_PREFIX}{payload}"
+    return f"{signing_input}.{_sign(signing_input, secret)}"
+
+
+def decode_signed_token(token: str, secret: bytes) -> Optional[SignedTokenClaims]:
+    """Verify a signed token and return its claims.
+
+    Args:
+        token: Token string
+        secret: HMAC key
+
+    Returns:
+        Claims if the signature is valid and the token has not expired, None otherwise
+    """
+    if not is_signed_token(token):
+        return None
+
+    signing_input, _, signature = token.rpartition(".")
+    if not signing_input or not hmac.compare_digest(signature, _sign(signing_input, secret)):
+        return None
+
+    try:
+        user_id, session_id, expires_epoch = (
+            _b64decode(signing_input[len(SIGNED_TOKEN_PREFIX):]).decode().split("|")
+        )
+        expires_ts = int(expires_epoch)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+    if expires_ts <= time.time():
+        return None
+
+    return SignedTokenClaims(
+        user_id=user_id,
+        session_id=session_id,
+        expires_at=datetime.fromtimestamp(expires_ts, tz=timezone.utc),
+    )
+
+
+class TokenRevocationList:
+    """Bounded set of revoked session IDs for signed tokens.
+
+    An entry only needs to live until the token it revokes would have
+    expired anyway, and is never dropped before that: a dropped entry would
+    make a logged-out token valid again. When the list is full, further
+    revocations are not recorded and ``complete`` turns False until the
+    unrecorded ones would have expired; callers must then verify signed
+    tokens against the sessions table instead of trusting the list.
+
+    The list is per process and only makes a logout immediate on the
+    instance that served it. Other instances notice the deleted session row
+    at their next re-check (see SignedSessionChecks).
+    """
+
+    def __init__(self, max_size: int = 10000):
+        """Initialize revocation list.
+
+        Args:
+            max_size: Maximum number of revoked sessions kept
+        """
+        self.max_size = max_size
+        # Store: session_id -> token expiry epoch
+        self._entries: Dict[str, float] = {}
+        # Latest expiry among revocations that did not fit
+        self._overflow_until = 0.0
+        self.rejected = 0
+        self.overflows = 0
+
+    @property
+    def complete(self) -> bool:
+        """Whether every live revocation made on this process is held."""
+        return self._overflow_until <= time.time()
+
+    def revoke(self, session_id: str, expires_at: datetime) -> bool:
+        """Revoke a signed session until its expiry.
+
+        Returns:
+            False if the list is full and the revocation was not recorded
+        """
+        until = expires_at.timestamp()
+        self._prune()
+        if session_id not in self._entries and len(self._entries) >= self.max_size:
+            self._overflow_until = max(self._overflow_until, until)
+            self.overflows += 1
+            return False
+        self._entries[session_id] = until
+        return True
+
+    def is_revoked(self, session_id: str) -> bool:
+        """Return True (and count a rejection) if session_id was revoked."""
+        until = self._entries.get(session_id)
+        if until is None:
+            return False
+        if until <= time.time():
+            del self._entries[session_id]
+            return False
+        self.rejected += 1
+        return True
+
+    def _prune(self) -> None:
+        now = time.time()
+        for session_id in [key for key, until in self._entries.items() if until <= now]:
+            del self._entries[session_id]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters for metrics."""
+        return {
+            "size": len(self._entries),
+            "maxSize": self.max_size,
+            "complete": self.complete,
+            "rejected": self.rejected,
+            "overflows": self.overflows,
+        }
+
+    def reset(self) -> None:
+        """Reset all state (for testing)."""
+        self._entries.clear()
+        self._overflow_until = 0.0
+        self.rejected = 0
+        self.overflows = 0
+
+
+class SignedSessionChecks:
+    """When each signed session was last confirmed against the sessions table.
+
+    A signed token is only trusted on its signature for recheck_seconds
+    after its session row was last seen, so a logout (row deleted) on any
+    instance stops the token everywhere within that interval. Dropping an
+    entry only forces an earlier re-check, so the oldest are evicted freely.
+
+    With db_recheck off every signed session counts as fresh and is never
+    looked up: a logout then only reaches the instance that served it (via
+    the revocation list), and a token stays valid elsewhere until it expires.
+    """
+
+    def __init__(self, recheck_seconds: float = 60.0, max_size: int = 10000, db_recheck: bool = True):
+        """Initialize session checks.
+
+        Args:
+            recheck_seconds: How long a confirmed session is trusted without the DB
+            max_size: Maximum number of sessions tracked (oldest confirmation dropped first)
+            db_recheck: When False, signed sessions are trusted on the signature alone
+        """
+        self.recheck_seconds = recheck_seconds
+        self.max_size = max_size
+        self.db_recheck = db_recheck
+        # Store: session_id -> confirmed at epoch (oldest first)
+        self._confirmed: "OrderedDict[str, float]" = OrderedDict()
+        self.fresh = 0
+        self.stale = 0
+
+    def is_fresh(self, session_id: str) -> bool:
+        """Return True if session_id was confirmed within recheck_seconds."""
+        if not self.db_recheck:
+            self.fresh += 1
+            return True
+        confirmed_at = self._confirmed.get(session_id)
+        if confirmed_at is not None and time.time() - confirmed_at < self.recheck_seconds:
+            self.fresh += 1
+            return True
+        self.stale += 1
+        return False
+
+    def confirm(self, session_id: str) -> None:
+        """Record that session_id's row was just found in the sessions table."""
+        self._confirmed.pop(session_id, None)
+        self._confirmed[session_id] = time.time()
+        while len(self._confirmed) > self.max_size:
+            self._confirmed.popitem(last=False)
+
+    def forget(self, session_id: str) -> None:
+        """Drop session_id so its next use is re-checked (e.g. on logout)."""
+        self._confirmed.pop(session_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters for metrics."""
+        return {
+            "size": len(self._confirmed),
+            "recheckSeconds": self.recheck_seconds,
+            "dbRecheck": self.db_recheck,
+            "fresh": self.fresh,
+            "stale": self.stale,
+        }
+
+    def reset(self) -> None:
+        """Reset all state (for testing)."""
+        self._confirmed.clear()
+        self.fresh = 0
+        self.stale = 0
+
+
+# Global revocation list consulted by get_current_user
+token_revocation_list = TokenRevocationList(
+    max_size=int(os.getenv("TOKEN_REVOCATION_MAX_SIZE", "10000")),
+)
+
+# Global re-check bookkeeping consulted by get_current_user
+signed_session_checks = SignedSessionChecks(
+    recheck_seconds=float(os.getenv("SIGNED_TOKEN_RECHECK_SECONDS", "60")),
+    max_size=int(os.getenv("SIGNED_TOKEN_RECHECK_MAX_SIZE", "10000")),
+    db_recheck=env_flag("SIGNED_TOKEN_DB_RECHECK", "true"),
+)
@@ -0,0 +1,12 @@
+"""Shared test fixtures."""
+import pytest
+
+from app.services.timeline_cache import timeline_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_timeline_cache():
+    """Keep cached timeline pages from leaking between tests."""
+    timeline_cache.reset()
+    yield
+    timeline_cache.reset()
@@ -59,8 +59,12 @@ def create_mock_paginated_response():
         nextCursor=None
     )
 
-# Override dependency for testing
-app.dependency_overrides[get_db_connection] = mock_get_db_connection
+@pytest.fixture(autouse=True)
+def _override_db_connection():
+    """Override the DB dependency for this module only."""
+    app.dependency_overrides[get_db_connection] = mock_get_db_connection
+    yield
+    app.dependency_overrides.pop(get_db_connection, None)
 
 def test_list_new_contract_and_order():
     """Test threads list new endpoint for contract compliance and ordering."""
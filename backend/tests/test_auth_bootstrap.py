@@ -69,22 +69,26 @@ def test_bootstrap_new_user(mock_db_pool):
 
 
 def test_bootstrap_with_device_secret(mock_db_pool):
-    """Test bootstrap with device_secret still creates new user in Phase 1."""
+    """Test bootstrap with device_secret resolves the user in one statement."""
     mock_pool, mock_connection = mock_db_pool
     
-    # Mock database queries
-    mock_connection.fetchrow = AsyncMock(return_value=None)
+    # The device is already bound to an existing user
+    existing_user_id = "usr_01HX0000000000000000000000"
+    mock_connection.fetchval = AsyncMock(return_value=existing_user_id)
     mock_connection.execute = AsyncMock()
     
     with patch("app.core.db.get_db_pool", AsyncMock(return_value=mock_pool)):
         
         with patch("app.routers.auth.generate_id") as mock_generate_id:
-            mock_generate_id.side_effect = ["usr_01HX1234567890ABCDEFGHIJKL", "ses_01HX1234567890ABCDEFGHIJKL"]
+            mock_generate_id.side_effect = [
+                "usr_01HX1234567890ABCDEFGHIJKL",
+                "ses_01HX1234567890ABCDEFGHIJKL",
+                "cre_01HX1234567890ABCDEFGHIJKL",
+            ]
             
             from app.main import app
             client = TestClient(app)
             
-            # Phase 1: device_secret is ignored
             device_secret = "existing_device_secret_123"
             
             response = client.post("/api/v1/auth/bootstrap", json={
@@ -93,9 +97,23 @@ def test_bootstrap_with_device_secret(mock_db_pool):
             
             assert response.status_code == 200
             data = response.json()
-            assert data["userId"].startswith("usr_")
+            assert data["userId"] == existing_user_id
             assert "token" in data
             assert "expiresAt" in data
+            
+            # Credential, user and session writes are a single round trip
+            mock_connection.fetchval.assert_called_once()
+            mock_connection.execute.assert_not_called()
+            query, *params = mock_connection.fetchval.call_args[0]
+            assert "provider = 'device'" in query
+            assert "ON CONFLICT (provider, subject)" in query
+            assert "INSERT INTO sessions" in query
+            
+            # The raw device secret is never stored
+            device_subject = hashlib.sha256(device_secret.encode()).hexdigest()
+            assert params[0] == device_subject
+            assert device_secret not in params
+            assert hashlib.sha256(data["token"].encode()).hexdigest() in params
 
 
 def test_bootstrap_without_device_secret(mock_db_pool):
@@ -171,9 +189,13 @@ def test_bootstrap_token_hash_stored(mock_db_pool):
             data = response.json()
             token = data["token"]
             
-            # Verify that execute was called for both users and sessions
-            assert mock_connection.execute.called
-            assert mock_connection.execute.call_count >= 2  # At least 2 inserts
+            # Users and sessions are inserted by a single statement
+            mock_connection.execute.assert_called_once()
+            query, *params = mock_connection.execute.call_args[0]
+            assert "INSERT INTO users" in query
+            assert "INSERT INTO sessions" in query
+            assert hashlib.sha256(token.encode()).hexdigest() in params
+            assert token not in params
 
 
 def test_bootstrap_response_format(mock_db_pool):
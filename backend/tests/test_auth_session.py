@@ -197,4 +197,58 @@ def test_session_endpoint_with_expired_token(mock_db_pool):
         
         assert response.status_code == 401
         data = response.json()
-        assert data["error"]["code"] == "UNAUTHORIZED"
\ No newline at end of file
+        assert data["error"]["code"] == "UNAUTHORIZED"
+
+def test_get_current_user_reuses_request_connection(mock_db_pool):
+    """Test that the session lookup runs on the request's shared connection."""
+    mock_pool, mock_connection = mock_db_pool
+    
+    mock_connection.fetchrow = AsyncMock(return_value={
+        "user_id": "usr_01HX1234567890ABCDEFGHIJKL",
+        "expires_at": datetime.now(timezone.utc) + timedelta(days=1)
+    })
+    
+    with patch("app.core.db.get_db_pool", AsyncMock(return_value=mock_pool)):
+        from app.core.db import RequestConnection, get_db_connection
+        from app.routers.auth import get_current_user
+        
+        async def run_test():
+            handle = RequestConnection(get_db_connection())
+            user_id = await get_current_user("Bearer request_scoped_token", request_db=handle)
+            assert user_id == "usr_01HX1234567890ABCDEFGHIJKL"
+            
+            # Handler reuses the connection checked out for auth
+            async with handle as conn:
+                await conn.fetchrow("SELECT 1")
+            assert mock_connection.fetchrow.call_count == 2
+            
+            await handle.release()
+            mock_pool.acquire.assert_called_once()
+        
+        import asyncio
+        asyncio.run(run_test())
+
+
+def test_get_current_user_records_user_on_request(mock_db_pool):
+    """Test that the resolved user is exposed as request.state.user_id for primary pinning."""
+    from types import SimpleNamespace
+    mock_pool, mock_connection = mock_db_pool
+    
+    mock_connection.fetchrow = AsyncMock(return_value={
+        "user_id": "usr_01HX1234567890ABCDEFGHIJKL",
+        "expires_at": datetime.now(timezone.utc) + timedelta(days=1)
+    })
+    request = SimpleNamespace(state=SimpleNamespace())
+    
+    with patch("app.core.db.get_db_pool", AsyncMock(return_value=mock_pool)):
+        from app.routers.auth import get_current_user
+        
+        async def run_test():
+            user_id = await get_current_user("Bearer state_token", request=request)
+            assert request.state.user_id == user_id == "usr_01HX1234567890ABCDEFGHIJKL"
+        
+        import asyncio
+        asyncio.run(run_test())
+    
+    from app.util.session_cache import session_cache
+    session_cache.reset()
@@ -5,6 +5,16 @@ from unittest.mock import AsyncMock, MagicMock
 from app.repositories.comments_repo import CommentRepository
 
 
+def _mock_db():
+    """AsyncMock connection whose transaction() works as an async context manager."""
+    mock_db = AsyncMock()
+    mock_transaction = AsyncMock()
+    mock_transaction.__aenter__ = AsyncMock(return_value=mock_transaction)
+    mock_transaction.__aexit__ = AsyncMock(return_value=None)
+    mock_db.transaction = MagicMock(return_value=mock_transaction)
+    return mock_db
+
+
 def test_comments_repo_class_exists():
     """Test that CommentRepository can be instantiated."""
     repo = CommentRepository(db=None)
@@ -120,7 +130,7 @@ def test_methods_raise_not_implemented():
 def test_create_comment_success():
     """Test successful comment creation."""
     # Mock DB responses
-    mock_db = AsyncMock()
+    mock_db = _mock_db()
     mock_db.fetchrow = AsyncMock(return_value={
         "id": "cmt_01HX123456789ABCDEFGHJKMNP",
         "created_at": datetime(2025, 8, 9, 7, 0, 0, tzinfo=timezone.utc)
@@ -150,6 +160,11 @@ def test_create_comment_success():
         update_query = mock_db.execute.call_args[0][0]
         assert "UPDATE threads" in update_query
         assert "last_activity_at" in update_query
+        assert "comment_count = comment_count + 1" in update_query
+        assert "last_reply_at" in update_query
+        
+        # Both statements run in one transaction
+        mock_db.transaction.assert_called_once()
     
     # Run async test
     loop = asyncio.new_event_loop()
@@ -162,7 +177,7 @@ def test_create_comment_success():
 
 def test_list_comments_by_thread_success():
     """Test successful listing of comments in ASC order."""
-    mock_db = AsyncMock()
+    mock_db = _mock_db()
     
     # Mock response: comments in ASC order with author affiliation
     mock_db.fetch = AsyncMock(return_value=[
@@ -220,7 +235,7 @@ def test_list_comments_by_thread_success():
 
 def test_list_comments_by_thread_with_cursor():
     """Test listing comments with cursor pagination."""
-    mock_db = AsyncMock()
+    mock_db = _mock_db()
     mock_db.fetch = AsyncMock(return_value=[
         {
             "id": "cmt_01HX123456789ABCDEFGHJKMNR",
@@ -260,7 +275,7 @@ def test_list_comments_by_thread_with_cursor():
 
 def test_list_comments_by_thread_empty_result():
     """Test listing comments for non-existent thread returns empty list."""
-    mock_db = AsyncMock()
+    mock_db = _mock_db()
     mock_db.fetch = AsyncMock(return_value=[])
     
     repo = CommentRepository(db=mock_db)
@@ -283,7 +298,7 @@ def test_list_comments_by_thread_empty_result():
 
 def test_list_comments_by_thread_excludes_deleted():
     """Test that deleted comments are excluded from results."""
-    mock_db = AsyncMock()
+    mock_db = _mock_db()
     
     # Only return non-deleted comments
     mock_db.fetch = AsyncMock(return_value=[
@@ -322,7 +337,7 @@ def test_list_comments_by_thread_excludes_deleted():
 
 def test_create_comment_with_image():
     """Test comment creation with image key."""
-    mock_db = AsyncMock()
+    mock_db = _mock_db()
     mock_db.fetchrow = AsyncMock(return_value={
         "id": "cmt_01HX123456789ABCDEFGHJKMNP", 
         "created_at": datetime(2025, 8, 9, 7, 0, 0, tzinfo=timezone.utc)
@@ -353,7 +368,7 @@ def test_create_comment_with_image():
 
 def test_list_comments_by_thread_success():
     """Test successful listing of comments in ASC order."""
-    mock_db = AsyncMock()
+    mock_db = _mock_db()
     
     # Mock response: comments in ASC order with author affiliation
     mock_db.fetch = AsyncMock(return_value=[
@@ -411,7 +426,7 @@ def test_list_comments_by_thread_success():
 
 def test_list_comments_by_thread_with_cursor():
     """Test listing comments with cursor pagination."""
-    mock_db = AsyncMock()
+    mock_db = _mock_db()
     mock_db.fetch = AsyncMock(return_value=[
         {
             "id": "cmt_01HX123456789ABCDEFGHJKMNR",
@@ -451,7 +466,7 @@ def test_list_comments_by_thread_with_cursor():
 
 def test_list_comments_by_thread_empty_result():
     """Test listing comments for non-existent thread returns empty list."""
-    mock_db = AsyncMock()
+    mock_db = _mock_db()
     mock_db.fetch = AsyncMock(return_value=[])
     
     repo = CommentRepository(db=mock_db)
@@ -474,7 +489,7 @@ def test_list_comments_by_thread_empty_result():
 
 def test_list_comments_by_thread_excludes_deleted():
     """Test that deleted comments are excluded from results."""
-    mock_db = AsyncMock()
+    mock_db = _mock_db()
     
     # Only return non-deleted comments
     mock_db.fetch = AsyncMock(return_value=[
@@ -516,7 +531,7 @@ def test_create_comment_foreign_key_error():
     import asyncpg
     
     # Mock foreign key constraint violation
-    mock_db = AsyncMock()
+    mock_db = _mock_db()
     mock_db.fetchrow = AsyncMock(side_effect=asyncpg.ForeignKeyViolationError("foreign key violation"))
     
     repo = CommentRepository(db=mock_db)
@@ -542,11 +557,12 @@ def test_create_comment_foreign_key_error():
 
 def test_soft_delete_comment_by_author():
     """Test soft delete comment succeeds when called by the author."""
-    mock_db = AsyncMock()
+    mock_db = _mock_db()
     
     # Mock successful update (returns affected row)
     mock_db.fetchrow = AsyncMock(return_value={
-        "id": "cmt_01HX123456789ABCDEFGHJKMNP"
+        "id": "cmt_01HX123456789ABCDEFGHJKMNP",
+        "thread_id": "thr_01HX123456789ABCDEFGHJKMNP"
     })
     
     repo = CommentRepository(db=mock_db)
@@ -575,6 +591,14 @@ def test_soft_delete_comment_by_author():
         assert len(params) == 3
         assert params[1] == "cmt_01HX123456789ABCDEFGHJKMNP"
         assert params[2] == "usr_01HX123456789ABCDEFGHJKMNP"
+        
+        # Thread reply stats are updated in the same transaction
+        mock_db.transaction.assert_called_once()
+        mock_db.execute.assert_called_once()
+        thread_query, thread_id = mock_db.execute.call_args[0]
+        assert "comment_count = GREATEST(comment_count - 1, 0)" in thread_query
+        assert "MAX(created_at)" in thread_query
+        assert thread_id == "thr_01HX123456789ABCDEFGHJKMNP"
     
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
@@ -586,7 +610,7 @@ def test_soft_delete_comment_by_author():
 
 def test_soft_delete_comment_by_non_author():
     """Test soft delete comment fails when called by non-author."""
-    mock_db = AsyncMock()
+    mock_db = _mock_db()
     
     # Mock no rows updated (returns None)
     mock_db.fetchrow = AsyncMock(return_value=None)
@@ -603,6 +627,8 @@ def test_soft_delete_comment_by_non_author():
         
         # Query should still be executed
         mock_db.fetchrow.assert_called_once()
+        # Thread stats untouched when nothing was deleted
+        mock_db.execute.assert_not_called()
     
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
@@ -614,7 +640,7 @@ def test_soft_delete_comment_by_non_author():
 
 def test_soft_delete_comment_already_deleted():
     """Test soft delete comment fails when comment is already deleted."""
-    mock_db = AsyncMock()
+    mock_db = _mock_db()
     
     # Mock no rows updated because deleted_at IS NULL check fails
     mock_db.fetchrow = AsyncMock(return_value=None)
@@ -643,7 +669,7 @@ def test_soft_delete_comment_already_deleted():
 
 def test_soft_delete_comment_nonexistent():
     """Test soft delete comment fails when comment doesn't exist."""
-    mock_db = AsyncMock()
+    mock_db = _mock_db()
     
     # Mock no rows found
     mock_db.fetchrow = AsyncMock(return_value=None)
@@ -668,7 +694,7 @@ def test_soft_delete_comment_nonexistent():
 
 def test_list_comments_by_thread_success():
     """Test successful listing of comments in ASC order."""
-    mock_db = AsyncMock()
+    mock_db = _mock_db()
     
     # Mock response: comments in ASC order with author affiliation
     mock_db.fetch = AsyncMock(return_value=[
@@ -726,7 +752,7 @@ def test_list_comments_by_thread_success():
 
 def test_list_comments_by_thread_with_cursor():
     """Test listing comments with cursor pagination."""
-    mock_db = AsyncMock()
+    mock_db = _mock_db()
     mock_db.fetch = AsyncMock(return_value=[
         {
             "id": "cmt_01HX123456789ABCDEFGHJKMNR",
@@ -766,7 +792,7 @@ def test_list_comments_by_thread_with_cursor():
 
 def test_list_comments_by_thread_empty_result():
     """Test listing comments for non-existent thread returns empty list."""
-    mock_db = AsyncMock()
+    mock_db = _mock_db()
     mock_db.fetch = AsyncMock(return_value=[])
     
     repo = CommentRepository(db=mock_db)
@@ -789,7 +815,7 @@ def test_list_comments_by_thread_empty_result():
 
 def test_list_comments_by_thread_excludes_deleted():
     """Test that deleted comments are excluded from results."""
-    mock_db = AsyncMock()
+    mock_db = _mock_db()
     
     # Only return non-deleted comments
     mock_db.fetch = AsyncMock(return_value=[
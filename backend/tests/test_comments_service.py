@@ -256,8 +256,10 @@ def test_list_comments_success():
             thread_id="thr_01HX123456789ABCDEFGHJKMNP",
             anchor_created_at=None,
             anchor_id=None,
-            limit=20
+            limit=21
         )
+        # Fewer rows than the lookahead means this is the last page
+        assert result.nextCursor is None
     
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
@@ -406,4 +408,45 @@ def test_delete_comment_unauthorized():
     try:
         loop.run_until_complete(run_test())
     finally:
-        loop.close()
\ No newline at end of file
+        loop.close()
+
+def test_list_comments_limit_uses_lookahead():
+    """Test that the page size flows into a limit+1 lookahead for nextCursor."""
+    from datetime import datetime, timezone
+    service = CommentService(db=AsyncMock())
+    rows = [
+        {
+            "id": f"cmt_01HX123456789ABCDEFGHJKM{i:02d}",
+            "body": "comment",
+            "up_count": 0,
+            "created_at": datetime(2025, 8, 9, 6, i, 0, tzinfo=timezone.utc),
+            "author_faculty": None,
+            "author_year": None
+        }
+        for i in range(6)
+    ]
+    service._repo = AsyncMock()
+    service._repo.list_comments_by_thread = AsyncMock(return_value=rows)
+    
+    async def run_test():
+        result = await service.list_comments(
+            thread_id="thr_01HX123456789ABCDEFGHJKMNP",
+            current_user_id=None,
+            limit=5
+        )
+        
+        assert service._repo.list_comments_by_thread.call_args.kwargs["limit"] == 6
+        assert [comment.id for comment in result.items] == [row["id"] for row in rows[:5]]
+        assert result.nextCursor is not None
+        
+        # Exactly a full page with nothing after it has no next page
+        service._repo.list_comments_by_thread = AsyncMock(return_value=rows[:5])
+        result = await service.list_comments(
+            thread_id="thr_01HX123456789ABCDEFGHJKMNP",
+            current_user_id=None,
+            limit=5
+        )
+        assert len(result.items) == 5
+        assert result.nextCursor is None
+    
+    asyncio.run(run_test())
@@ -33,6 +33,7 @@ def test_error_codes():
     assert ErrorCode.CONFLICT == "CONFLICT"
     assert ErrorCode.RATE_LIMITED == "RATE_LIMITED"
     assert ErrorCode.INTERNAL == "INTERNAL"
+    assert ErrorCode.UNAVAILABLE == "UNAVAILABLE"
 
 
 def test_error_response_model():
@@ -1,4 +1,7 @@
+from unittest.mock import AsyncMock, patch
+
 from fastapi.testclient import TestClient
+
 from app.main import app
 
 client = TestClient(app)
@@ -6,4 +9,29 @@ client = TestClient(app)
 def test_health_check():
     response = client.get("/api/v1/health")
     assert response.status_code == 200
-    assert response.json() == {"status": "healthy"}
\ No newline at end of file
+    assert response.json() == {"status": "healthy"}
+
+def test_readiness_reports_ready_after_warm_up():
+    with patch("app.core.db.is_db_ready", return_value=True):
+        response = client.get("/api/v1/health/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready"}
+
+
+def test_readiness_not_ready_when_warm_up_fails():
+    with patch("app.core.db.is_db_ready", return_value=False), \
+         patch("app.core.db.is_db_draining", return_value=False), \
+         patch("app.core.db.init_db_pool", AsyncMock(side_effect=Exception("db down"))) as mock_init:
+        response = client.get("/api/v1/health/ready")
+    assert response.status_code == 503
+    assert response.json() == {"status": "not_ready"}
+    mock_init.assert_awaited_once()
+
+
+def test_readiness_never_retries_while_draining():
+    with patch("app.core.db.is_db_ready", return_value=False), \
+         patch("app.core.db.is_db_draining", return_value=True), \
+         patch("app.core.db.init_db_pool", AsyncMock()) as mock_init:
+        response = client.get("/api/v1/health/ready")
+    assert response.status_code == 503
+    mock_init.assert_not_awaited()
@@ -0,0 +1,162 @@
+"""Test connection pool instrumentation."""
+import asyncio
+import logging
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.pool_metrics import Histogram, InstrumentedPool, PoolMetrics
+from app.util.request_context import request_id_var, route_var
+
+
+def _raw_pool(enter=None):
+    raw = MagicMock()
+    connection = object()
+
+    class MockAcquire:
+        async def __aenter__(self):
+            if enter is not None:
+                await enter()
+            return connection
+        async def __aexit__(self, *args):
+            pass
+
+    raw.acquire.side_effect = lambda timeout=None: MockAcquire()
+    raw.get_size.return_value = 5
+    raw.get_idle_size.return_value = 4
+    raw.get_min_size.return_value = 5
+    raw.get_max_size.return_value = 20
+    return raw, connection
+
+
+def test_histogram_buckets_are_cumulative():
+    """Test histogram bucketing."""
+    hist = Histogram()
+    for value in (0.5, 3, 3, 7000):
+        hist.observe(value)
+
+    snap = hist.snapshot()
+    assert snap["count"] == 4
+    assert snap["buckets"]["le_1"] == 1
+    assert snap["buckets"]["le_5"] == 3
+    assert snap["buckets"]["le_5000"] == 3
+    assert snap["buckets"]["le_inf"] == 4
+    assert snap["maxMs"] == 7000
+
+
+@pytest.mark.asyncio
+async def test_acquire_records_wait_hold_and_route():
+    """Test that every acquire is labelled with the current route."""
+    metrics = PoolMetrics()
+    raw, connection = _raw_pool()
+    pool = InstrumentedPool(raw, metrics, acquire_timeout=3)
+
+    token = route_var.set("GET /threads")
+    try:
+        async with pool.acquire() as conn:
+            assert conn is connection
+            assert metrics.in_use == 1
+    finally:
+        route_var.reset(token)
+
+    raw.acquire.assert_called_once_with(timeout=3)
+    stats = metrics.stats(pool)
+    assert stats["acquires"] == 1
+    assert stats["inUse"] == 0
+    assert stats["routes"]["GET /threads"]["wait"]["count"] == 1
+    assert stats["routes"]["GET /threads"]["hold"]["count"] == 1
+    assert stats["size"] == 5
+    assert stats["idle"] == 4
+    assert stats["maxSize"] == 20
+
+
+@pytest.mark.asyncio
+async def test_acquire_timeout_is_counted():
+    """Test acquire timeouts are counted and re-raised."""
+    async def stuck():
+        raise asyncio.TimeoutError()
+
+    metrics = PoolMetrics()
+    raw, _ = _raw_pool(enter=stuck)
+    pool = InstrumentedPool(raw, metrics, acquire_timeout=0.01)
+
+    with pytest.raises(asyncio.TimeoutError):
+        async with pool.acquire():
+            pass
+
+    assert metrics.stats()["acquireTimeouts"] == 1
+    assert metrics.stats()["acquires"] == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_hold_is_logged_with_request_id(caplog):
+    """Test that holds over the threshold are logged with X-Request-Id."""
+    metrics = PoolMetrics(slow_hold_ms=0)
+    raw, _ = _raw_pool()
+    pool = InstrumentedPool(raw, metrics)
+
+    token = request_id_var.set("req-slow-123")
+    try:
+        with caplog.at_level(logging.WARNING, logger="app.core.pool_metrics"):
+            async with pool.acquire():
+                await asyncio.sleep(0.001)
+    finally:
+        request_id_var.reset(token)
+
+    assert metrics.slow_holds == 1
+    assert "request_id=req-slow-123" in caplog.text
+    assert "slow_pool_hold=" in caplog.text
+
+
+def test_metrics_endpoint_exposes_per_pool_and_cache_stats():
+    """Test the JSON metrics surface for a caller with the metrics token."""
+    from app.main import app
+
+    with patch.dict(os.environ, {"METRICS_TOKEN": "metrics-secret"}):
+        response = TestClient(app).get(
+            "/api/v1/health/metrics", headers={"X-Metrics-Token": "metrics-secret"}
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert {"dbPool", "sessionCache", "negativeTokenCache", "sessionSweeper"} <= set(data)
+    assert set(data["dbPool"]) == {"primary", "replica"}
+    assert "acquireTimeouts" in data["dbPool"]["primary"]
+    assert "routes" in data["dbPool"]["replica"]
+
+
+def test_metrics_endpoint_requires_token():
+    """Test that metrics are hidden without METRICS_TOKEN and refused without the header."""
+    from app.main import app
+
+    client = TestClient(app)
+    with patch.dict(os.environ, {}, clear=False):
+        os.environ.pop("METRICS_TOKEN", None)
+        assert client.get("/api/v1/health/metrics").status_code == 404
+
+    with patch.dict(os.environ, {"METRICS_TOKEN": "metrics-secret"}):
+        assert client.get("/api/v1/health/metrics").status_code == 401
+        wrong = client.get("/api/v1/health/metrics", headers={"X-Metrics-Token": "guess"})
+        assert wrong.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_replica_pool_records_into_its_own_metrics():
+    """Test that primary and replica acquires are not mixed."""
+    from app.core import db
+    from app.core.pool_metrics import primary_pool_metrics, replica_pool_metrics
+
+    primary_pool_metrics.reset()
+    replica_pool_metrics.reset()
+    raw, _ = _raw_pool()
+    with patch("app.core.db.asyncpg.create_pool", AsyncMock(return_value=raw)):
+        replica = await db._create_pool("postgresql://replica/test", replica_pool_metrics, max_retries=1)
+
+    async with replica.acquire():
+        pass
+
+    assert replica_pool_metrics.acquires == 1
+    assert primary_pool_metrics.acquires == 0
+    replica_pool_metrics.reset()
@@ -47,7 +47,9 @@ class TestProfileRouter:
         })
         
         # Mock profile repository response
-        def mock_fetchrow_side_effect(query, *args):
+        def mock_fetchrow_side_effect(query, *args, **kwargs):
+            # Request connections run under the route's query budget
+            assert "timeout" in kwargs
             # For session validation
             if "sessions" in query:
                 return {
@@ -174,4 +176,36 @@ class TestProfileRouter:
             
             # Assert response
             assert response.status_code == 204
-            mock_connection.execute.assert_called_once()
\ No newline at end of file
+            mock_connection.execute.assert_called_once()
+    def test_get_my_saved_threads(self, mock_db_pool):
+        """Test GET /auth/me/saved pages my saves and advertises the next page."""
+        from app.schemas.threads import PaginatedThreadCards
+        mock_pool, _ = mock_db_pool
+        
+        mock_service = MagicMock()
+        mock_service.list_saved_threads = AsyncMock(
+            return_value=PaginatedThreadCards(items=[], nextCursor="next-cursor")
+        )
+        
+        with patch("app.core.db.get_db_pool", AsyncMock(return_value=mock_pool)), \
+             patch("app.routers.profile.get_current_user", AsyncMock(return_value="usr_01234567890123456789012345")), \
+             patch("app.routers.profile.ThreadService", return_value=mock_service):
+            response = client.get(
+                "/api/v1/auth/me/saved?limit=10",
+                headers={"Authorization": "Bearer valid-token"}
+            )
+            
+            assert response.status_code == 200
+            assert response.json() == {"items": [], "nextCursor": "next-cursor"}
+            mock_service.list_saved_threads.assert_called_once_with(
+                user_id="usr_01234567890123456789012345",
+                cursor=None,
+                limit=10
+            )
+            assert response.headers["Link"] == '</api/v1/auth/me/saved?limit=10&cursor=next-cursor>; rel="next"'
+            
+            response = client.get(
+                "/api/v1/auth/me/saved?limit=0",
+                headers={"Authorization": "Bearer valid-token"}
+            )
+            assert response.status_code == 400
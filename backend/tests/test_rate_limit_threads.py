@@ -319,4 +319,39 @@ def test_rate_limit_reset_after_time(mock_get_current_user, mock_get_db_pool):
                 "imageKey": None
             }
         )
-        assert response2.status_code == status.HTTP_201_CREATED
\ No newline at end of file
+        assert response2.status_code == status.HTTP_201_CREATED
+
+@patch('app.core.db.get_db_pool')
+@patch('app.routers.threads.get_current_user')
+def test_rate_limited_thread_create_does_not_acquire_connection(mock_get_current_user, mock_get_db_pool):
+    """Test that a 429 is answered without checking out a pooled connection."""
+    from app.main import app
+    from app.util.rate_limit import rate_limiter
+    
+    rate_limiter.reset()
+    client = TestClient(app)
+    
+    user_id = "usr_01HX123456789ABCDEFGHJKMNP"
+    mock_get_current_user.return_value = user_id
+    
+    mock_pool = MagicMock()
+    mock_pool.acquire.return_value = MockAcquire(AsyncMock())
+    mock_get_db_pool.return_value = mock_pool
+    
+    # Use up the user's allowance
+    rate_limiter.check_rate_limit(user_id)
+    
+    response = client.post(
+        "/api/v1/threads",
+        headers={"Authorization": "Bearer test_token"},
+        json={
+            "title": "Test Thread",
+            "body": "Test body",
+            "tags": [],
+            "imageKey": None
+        }
+    )
+    
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    mock_pool.acquire.assert_not_called()
+    rate_limiter.reset()
@@ -7,7 +7,7 @@ from fastapi import FastAPI
 
 from app.routers.reactions import router
 from app.routers.auth import get_current_user, get_authorization_header  
-from app.core.db import get_db_connection
+from app.core.db import get_request_connection
 from app.services.reactions_service import ReactionService
 from app.util.errors import ValidationException, ConflictException, BaseAPIException, api_exception_handler
 from app.schemas.reactions import ReactionRequestThread
@@ -35,19 +35,19 @@ class TestReactionCommentRouter:
             return mock_user_id
         
         # Mock database connection
-        async def mock_get_db_connection():
+        async def mock_get_request_connection():
             yield AsyncMock()
         
         # Override dependencies correctly
         self.app.dependency_overrides[get_authorization_header] = mock_get_auth_header
         self.app.dependency_overrides[get_current_user] = lambda auth: mock_user_id
-        self.app.dependency_overrides[get_db_connection] = mock_get_db_connection
+        self.app.dependency_overrides[get_request_connection] = mock_get_request_connection
     
     @patch('app.routers.reactions.get_current_user')
     @patch('app.routers.reactions.get_authorization_header')
-    @patch('app.routers.reactions.get_db_connection')
+    @patch('app.routers.reactions.get_request_connection')
     @patch('app.routers.reactions.ReactionService')
-    def test_post_comment_reaction_up_success(self, mock_service_class, mock_get_db_connection, mock_get_auth_header, mock_get_current_user):
+    def test_post_comment_reaction_up_success(self, mock_service_class, mock_get_request_connection, mock_get_auth_header, mock_get_current_user):
         """Test successful comment up reaction (204 No Content)."""
         
         # Mock authentication
@@ -56,8 +56,8 @@ class TestReactionCommentRouter:
         
         # Mock database connection
         mock_db_conn = AsyncMock()
-        mock_get_db_connection.return_value.__aenter__ = AsyncMock(return_value=mock_db_conn)
-        mock_get_db_connection.return_value.__aexit__ = AsyncMock()
+        mock_get_request_connection.return_value.__aenter__ = AsyncMock(return_value=mock_db_conn)
+        mock_get_request_connection.return_value.__aexit__ = AsyncMock()
         
         # Mock service
         mock_service = AsyncMock()
@@ -82,9 +82,9 @@ class TestReactionCommentRouter:
     
     @patch('app.routers.reactions.get_current_user')
     @patch('app.routers.reactions.get_authorization_header')
-    @patch('app.routers.reactions.get_db_connection')
+    @patch('app.routers.reactions.get_request_connection')
     @patch('app.routers.reactions.ReactionService')
-    def test_post_comment_reaction_conflict(self, mock_service_class, mock_get_db_connection, mock_get_auth_header, mock_get_current_user):
+    def test_post_comment_reaction_conflict(self, mock_service_class, mock_get_request_connection, mock_get_auth_header, mock_get_current_user):
         """Test comment reaction when already exists (409 Conflict)."""
         
         # Mock authentication
@@ -93,8 +93,8 @@ class TestReactionCommentRouter:
         
         # Mock database connection
         mock_db_conn = AsyncMock()
-        mock_get_db_connection.return_value.__aenter__ = AsyncMock(return_value=mock_db_conn)
-        mock_get_db_connection.return_value.__aexit__ = AsyncMock()
+        mock_get_request_connection.return_value.__aenter__ = AsyncMock(return_value=mock_db_conn)
+        mock_get_request_connection.return_value.__aexit__ = AsyncMock()
         
         # Mock service to raise ConflictException
         mock_service = AsyncMock()
@@ -118,9 +118,9 @@ class TestReactionCommentRouter:
     
     @patch('app.routers.reactions.get_current_user')
     @patch('app.routers.reactions.get_authorization_header')
-    @patch('app.routers.reactions.get_db_connection')
+    @patch('app.routers.reactions.get_request_connection')
     @patch('app.routers.reactions.ReactionService')
-    def test_post_comment_reaction_validation_error(self, mock_service_class, mock_get_db_connection, mock_get_auth_header, mock_get_current_user):
+    def test_post_comment_reaction_validation_error(self, mock_service_class, mock_get_request_connection, mock_get_auth_header, mock_get_current_user):
         """Test comment reaction with invalid comment ID format."""
         
         # Mock authentication
@@ -129,8 +129,8 @@ class TestReactionCommentRouter:
         
         # Mock database connection
         mock_db_conn = AsyncMock()
-        mock_get_db_connection.return_value.__aenter__ = AsyncMock(return_value=mock_db_conn)
-        mock_get_db_connection.return_value.__aexit__ = AsyncMock()
+        mock_get_request_connection.return_value.__aenter__ = AsyncMock(return_value=mock_db_conn)
+        mock_get_request_connection.return_value.__aexit__ = AsyncMock()
         
         # Mock service to raise ValidationException
         mock_service = AsyncMock()
@@ -223,19 +223,19 @@ class TestReactionThreadRouter:
             return mock_user_id
         
         # Mock database connection
-        async def mock_get_db_connection():
+        async def mock_get_request_connection():
             yield AsyncMock()
         
         # Override dependencies correctly
         self.app.dependency_overrides[get_authorization_header] = mock_get_auth_header
         self.app.dependency_overrides[get_current_user] = lambda auth: mock_user_id
-        self.app.dependency_overrides[get_db_connection] = mock_get_db_connection
+        self.app.dependency_overrides[get_request_connection] = mock_get_request_connection
     
     @patch('app.routers.reactions.get_current_user')
     @patch('app.routers.reactions.get_authorization_header')
-    @patch('app.routers.reactions.get_db_connection')
+    @patch('app.routers.reactions.get_request_connection')
     @patch('app.routers.reactions.ReactionService')
-    def test_post_thread_reaction_up_success(self, mock_service_class, mock_get_db_connection, mock_get_auth_header, mock_get_current_user):
+    def test_post_thread_reaction_up_success(self, mock_service_class, mock_get_request_connection, mock_get_auth_header, mock_get_current_user):
         """Test successful thread up reaction (204 No Content)."""
         
         # Mock authentication
@@ -244,8 +244,8 @@ class TestReactionThreadRouter:
         
         # Mock database connection
         mock_db_conn = AsyncMock()
-        mock_get_db_connection.return_value.__aenter__ = AsyncMock(return_value=mock_db_conn)
-        mock_get_db_connection.return_value.__aexit__ = AsyncMock()
+        mock_get_request_connection.return_value.__aenter__ = AsyncMock(return_value=mock_db_conn)
+        mock_get_request_connection.return_value.__aexit__ = AsyncMock()
         
         # Mock service
         mock_service = AsyncMock()
@@ -270,9 +270,9 @@ class TestReactionThreadRouter:
     
     @patch('app.routers.reactions.get_current_user')
     @patch('app.routers.reactions.get_authorization_header')
-    @patch('app.routers.reactions.get_db_connection')
+    @patch('app.routers.reactions.get_request_connection')
     @patch('app.routers.reactions.ReactionService')
-    def test_post_thread_reaction_save_success(self, mock_service_class, mock_get_db_connection, mock_get_auth_header, mock_get_current_user):
+    def test_post_thread_reaction_save_success(self, mock_service_class, mock_get_request_connection, mock_get_auth_header, mock_get_current_user):
         """Test successful thread save reaction (204 No Content)."""
         
         # Mock authentication
@@ -281,8 +281,8 @@ class TestReactionThreadRouter:
         
         # Mock database connection
         mock_db_conn = AsyncMock()
-        mock_get_db_connection.return_value.__aenter__ = AsyncMock(return_value=mock_db_conn)
-        mock_get_db_connection.return_value.__aexit__ = AsyncMock()
+        mock_get_request_connection.return_value.__aenter__ = AsyncMock(return_value=mock_db_conn)
+        mock_get_request_connection.return_value.__aexit__ = AsyncMock()
         
         # Mock service
         mock_service = AsyncMock()
@@ -307,9 +307,9 @@ class TestReactionThreadRouter:
     
     @patch('app.routers.reactions.get_current_user')
     @patch('app.routers.reactions.get_authorization_header')
-    @patch('app.routers.reactions.get_db_connection')
+    @patch('app.routers.reactions.get_request_connection')
     @patch('app.routers.reactions.ReactionService')
-    def test_post_thread_reaction_up_conflict(self, mock_service_class, mock_get_db_connection, mock_get_auth_header, mock_get_current_user):
+    def test_post_thread_reaction_up_conflict(self, mock_service_class, mock_get_request_connection, mock_get_auth_header, mock_get_current_user):
         """Test thread up reaction when already exists (409 Conflict)."""
         
         # Mock authentication
@@ -318,8 +318,8 @@ class TestReactionThreadRouter:
         
         # Mock database connection
         mock_db_conn = AsyncMock()
-        mock_get_db_connection.return_value.__aenter__ = AsyncMock(return_value=mock_db_conn)
-        mock_get_db_connection.return_value.__aexit__ = AsyncMock()
+        mock_get_request_connection.return_value.__aenter__ = AsyncMock(return_value=mock_db_conn)
+        mock_get_request_connection.return_value.__aexit__ = AsyncMock()
         
         # Mock service to raise ConflictException
         mock_service = AsyncMock()
@@ -343,9 +343,9 @@ class TestReactionThreadRouter:
     
     @patch('app.routers.reactions.get_current_user')
     @patch('app.routers.reactions.get_authorization_header')
-    @patch('app.routers.reactions.get_db_connection')
+    @patch('app.routers.reactions.get_request_connection')
     @patch('app.routers.reactions.ReactionService')
-    def test_post_thread_reaction_save_conflict(self, mock_service_class, mock_get_db_connection, mock_get_auth_header, mock_get_current_user):
+    def test_post_thread_reaction_save_conflict(self, mock_service_class, mock_get_request_connection, mock_get_auth_header, mock_get_current_user):
         """Test thread save reaction when already exists (409 Conflict)."""
         
         # Mock authentication
@@ -354,8 +354,8 @@ class TestReactionThreadRouter:
         
         # Mock database connection
         mock_db_conn = AsyncMock()
-        mock_get_db_connection.return_value.__aenter__ = AsyncMock(return_value=mock_db_conn)
-        mock_get_db_connection.return_value.__aexit__ = AsyncMock()
+        mock_get_request_connection.return_value.__aenter__ = AsyncMock(return_value=mock_db_conn)
+        mock_get_request_connection.return_value.__aexit__ = AsyncMock()
         
         # Mock service to raise ConflictException
         mock_service = AsyncMock()
@@ -379,9 +379,9 @@ class TestReactionThreadRouter:
     
     @patch('app.routers.reactions.get_current_user')
     @patch('app.routers.reactions.get_authorization_header')
-    @patch('app.routers.reactions.get_db_connection')
+    @patch('app.routers.reactions.get_request_connection')
     @patch('app.routers.reactions.ReactionService')
-    def test_post_thread_reaction_validation_error(self, mock_service_class, mock_get_db_connection, mock_get_auth_header, mock_get_current_user):
+    def test_post_thread_reaction_validation_error(self, mock_service_class, mock_get_request_connection, mock_get_auth_header, mock_get_current_user):
         """Test thread reaction with invalid thread ID format."""
         
         # Mock authentication
@@ -390,8 +390,8 @@ class TestReactionThreadRouter:
         
         # Mock database connection
         mock_db_conn = AsyncMock()
-        mock_get_db_connection.return_value.__aenter__ = AsyncMock(return_value=mock_db_conn)
-        mock_get_db_connection.return_value.__aexit__ = AsyncMock()
+        mock_get_request_connection.return_value.__aenter__ = AsyncMock(return_value=mock_db_conn)
+        mock_get_request_connection.return_value.__aexit__ = AsyncMock()
         
         # Mock service to raise ValidationException
         mock_service = AsyncMock()
@@ -73,4 +73,31 @@ def test_thread_card_excerpt_handles_newlines():
     # Should replace newlines with spaces and compress multiple spaces
     expected_excerpt = create_excerpt(text_with_newlines, 120)
     assert thread_card.excerpt == expected_excerpt
-    assert thread_card.excerpt == "First line Second line Third line"
\ No newline at end of file
+    assert thread_card.excerpt == "First line Second line Third line"
+
+
+def test_thread_card_uses_stored_excerpt():
+    """Test that a stored excerpt is used as-is without recomputing from body."""
+    service = ThreadService(db=None)
+    
+    thread_data = {
+        "id": "thr_01HX123456789ABCDEFGHJKMNP",
+        "author_id": "usr_01HX123456789ABCDEFGHJKMNP",
+        "title": "Test Thread",
+        "excerpt": "Stored excerpt",
+        "body": None,  # Not selected once the excerpt is stored
+        "up_count": 0,
+        "save_count": 0,
+        "heat": 0,
+        "created_at": "2024-01-01T12:00:00Z",
+        "last_activity_at": "2024-01-01T12:00:00Z",
+        "solved_comment_id": None
+    }
+    
+    thread_card = service._to_thread_card(
+        thread_data=thread_data,
+        current_user_id="usr_01HX123456789ABCDEFGHJKMNP",
+        tags=[]
+    )
+    
+    assert thread_card.excerpt == "Stored excerpt"
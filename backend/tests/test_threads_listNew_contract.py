@@ -19,6 +19,7 @@ async def test_list_threads_new_uses_repo_items_and_nextCursor():
     
     # Mock repository response with items and nextCursor
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     mock_repo.list_threads_new = AsyncMock(return_value={
         "items": [
             {
@@ -81,6 +82,7 @@ async def test_list_threads_new_handles_no_nextCursor():
     
     # Mock repository response with items but no nextCursor
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     mock_repo.list_threads_new = AsyncMock(return_value={
         "items": [
             {
@@ -126,6 +128,7 @@ async def test_list_threads_new_handles_empty_items():
     
     # Mock repository response with empty items
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     mock_repo.list_threads_new = AsyncMock(return_value={
         "items": [],
         "nextCursor": None
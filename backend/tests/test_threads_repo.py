@@ -95,6 +95,27 @@ def test_get_thread_by_id_with_existing_thread():
     asyncio.run(run_test())
 
 
+def test_get_thread_by_id_with_viewer_reaction_flags():
+    """Test the viewer's up/save flags come from the same statement as the thread row."""
+    mock_conn = AsyncMock()
+    mock_conn.fetchrow = AsyncMock(return_value={"id": "thr_01HX123456789ABCDEFGHJKMNP", "viewer_up": True, "viewer_save": False})
+    repo = ThreadRepository(db=mock_conn)
+    
+    async def run_test():
+        result = await repo.get_thread_by_id(
+            thread_id="thr_01HX123456789ABCDEFGHJKMNP", viewer_id="usr_01HX123456789ABCDEFGHJKMNP"
+        )
+        assert result["viewer_up"] is True
+        
+        query, *params = mock_conn.fetchrow.call_args[0]
+        assert params == ["thr_01HX123456789ABCDEFGHJKMNP", "usr_01HX123456789ABCDEFGHJKMNP"]
+        assert "AS viewer_up" in query and "AS viewer_save" in query
+        assert "r.user_id = $2" in query
+        mock_conn.fetchrow.assert_called_once()
+    
+    asyncio.run(run_test())
+
+
 def test_get_thread_by_id_with_non_existing_thread():
     """Test get_thread_by_id returns None when thread doesn't exist."""
     mock_conn = AsyncMock()
@@ -577,18 +598,26 @@ def test_create_thread_basic():
         assert "RETURNING *" in query
         
         # Check parameters
-        assert len(params) == 11  # id, author_id, title, body, created_at, last_activity_at, heat, up_count, save_count, solved_comment_id, deleted_at
+        assert len(params) == 13  # id, author_id, title, body, created_at, last_activity_at, heat, up_count, save_count, solved_comment_id, deleted_at, excerpt, kind
         assert params[0].startswith("thr_")  # Generated thread ID
         assert params[1] == "usr_01HX123456789ABCDEFGHJKMNP"
         assert params[2] == "Test Thread"
         assert params[3] == "Test body content"
+        assert params[11] == "Test body content"  # Excerpt stored at write time
+        assert params[12] is None  # No 種別 tag, no kind
     
     asyncio.run(run_test())
 
 
 def test_create_thread_with_tags_and_image():
-    """Test create_thread with tags and image_key."""
+    """Test create_thread inserts all tags in one statement inside the thread's transaction."""
+    from app.schemas.threads import Tag
+    
     mock_conn = AsyncMock()
+    mock_transaction = AsyncMock()
+    mock_transaction.__aenter__ = AsyncMock(return_value=mock_transaction)
+    mock_transaction.__aexit__ = AsyncMock(return_value=None)
+    mock_conn.transaction = MagicMock(return_value=mock_transaction)
     
     # Mock successful insert
     mock_conn.fetchrow = AsyncMock(return_value={
@@ -604,6 +633,7 @@ def test_create_thread_with_tags_and_image():
         "last_activity_at": datetime.now(timezone.utc),
         "deleted_at": None
     })
+    mock_conn.execute = AsyncMock(return_value="INSERT 0 2")
     
     repo = ThreadRepository(db=mock_conn)
     
@@ -612,15 +642,54 @@ def test_create_thread_with_tags_and_image():
             author_id="usr_01HX123456789ABCDEFGHJKMNP",
             title="Test Thread with Tags",
             body="Body with image",
-            tags=["question", "programming"],
+            tags=[Tag(key="種別", value="question"), Tag(key="場所", value="図書館")],
             image_key="2024/01/15/thr_01HX123456789ABCDEFGHJKMNP.webp"
         )
         
         assert thread_id == "thr_01HX123456789ABCDEFGHJKMNP"
-        
-        # Note: tags and image_key are handled by separate tables in later phases
-        # For now, just ensure the basic thread creation works
+        mock_conn.transaction.assert_called_once()
         mock_conn.fetchrow.assert_called_once()
+        
+        # One multi-row INSERT for all tags
+        mock_conn.execute.assert_called_once()
+        query, tag_thread_id, keys, values = mock_conn.execute.call_args[0]
+        assert "INSERT INTO tags" in query
+        assert "unnest" in query
+        assert tag_thread_id == mock_conn.fetchrow.call_args[0][1]
+        assert keys == ["種別", "場所"]
+        assert values == ["question", "図書館"]
+        
+        # 種別 is denormalized into threads.kind
+        assert mock_conn.fetchrow.call_args[0][13] == "question"
+    
+    asyncio.run(run_test())
+
+
+def test_get_tags_by_thread_ids_single_query_grouped():
+    """Test tags for a page are read in one ANY($1) query and grouped by thread."""
+    mock_conn = AsyncMock()
+    mock_conn.fetch = AsyncMock(return_value=[
+        {"thread_id": "thr_A", "key": "種別", "value": "question"},
+        {"thread_id": "thr_A", "key": "場所", "value": "図書館"},
+        {"thread_id": "thr_B", "key": "種別", "value": "notice"},
+    ])
+    repo = ThreadRepository(db=mock_conn)
+    
+    async def run_test():
+        result = await repo.get_tags_by_thread_ids(thread_ids=["thr_A", "thr_B", "thr_C"])
+        
+        mock_conn.fetch.assert_called_once()
+        query, ids = mock_conn.fetch.call_args[0]
+        assert "ANY($1::text[])" in query
+        assert ids == ["thr_A", "thr_B", "thr_C"]
+        assert result == {
+            "thr_A": [{"key": "種別", "value": "question"}, {"key": "場所", "value": "図書館"}],
+            "thr_B": [{"key": "種別", "value": "notice"}],
+        }
+        
+        # No query for an empty page
+        assert await repo.get_tags_by_thread_ids(thread_ids=[]) == {}
+        mock_conn.fetch.assert_called_once()
     
     asyncio.run(run_test())
 
@@ -795,3 +864,145 @@ def test_create_thread_other_db_errors():
             assert "Database connection lost" in str(e)
     
     asyncio.run(run_test())
+
+
+def test_list_threads_new_selects_card_columns_only():
+    """Test that the timeline query does not ship full bodies."""
+    mock_conn = AsyncMock()
+    mock_conn.fetch = AsyncMock(return_value=[])
+    repo = ThreadRepository(db=mock_conn)
+    
+    async def run_test():
+        await repo.list_threads_new()
+        query = mock_conn.fetch.call_args[0][0]
+        
+        assert "SELECT *" not in query
+        assert "excerpt" in query
+        # body is only read for rows whose excerpt is not backfilled yet
+        assert "CASE WHEN excerpt IS NULL THEN body END AS body" in query
+    
+    asyncio.run(run_test())
+
+
+def test_set_excerpts_only_fills_missing_rows():
+    """Test the backfill write statement."""
+    mock_conn = AsyncMock()
+    repo = ThreadRepository(db=mock_conn)
+    
+    async def run_test():
+        await repo.set_excerpts(excerpts=[("thr_01HX123456789ABCDEFGHJKMNP", "Body")])
+        query, args = mock_conn.executemany.call_args[0]
+        
+        assert "SET excerpt = $2" in query
+        assert "excerpt IS NULL" in query
+        assert args == [("thr_01HX123456789ABCDEFGHJKMNP", "Body")]
+    
+    asyncio.run(run_test())
+
+
+def test_list_threads_hot_uses_keyset_on_rank():
+    """Test hot timeline query, anchor params and next cursor."""
+    from app.services.cursor import decode
+    
+    created_at = datetime(2024, 1, 2, 0, 0, 0, tzinfo=timezone.utc)
+    mock_conn = AsyncMock()
+    mock_conn.fetch = AsyncMock(return_value=[
+        {"id": f"thr_01HX123456789ABCDEFGHJKMN{i}", "hot_rank": 40000.5 - i, "created_at": created_at}
+        for i in range(3)
+    ])
+    repo = ThreadRepository(db=mock_conn)
+    
+    async def run_test():
+        anchor = {"score": 40001.25, "createdAt": "2024-01-03T00:00:00Z", "id": "thr_01HX123456789ABCDEFGHJKMNZ"}
+        result = await repo.list_threads_hot(anchor=anchor, limit=2)
+        
+        query, *params = mock_conn.fetch.call_args[0]
+        assert "(hot_rank, created_at, id) < ($1, $2, $3)" in query
+        assert "ORDER BY hot_rank DESC, created_at DESC, id DESC" in query
+        assert params == [40001.25, datetime(2024, 1, 3, tzinfo=timezone.utc), "thr_01HX123456789ABCDEFGHJKMNZ", 3]
+        
+        assert len(result["items"]) == 2
+        cursor = decode(result["nextCursor"])
+        assert cursor == {"v": 1, "score": 39999.5, "createdAt": "2024-01-02T00:00:00Z", "id": "thr_01HX123456789ABCDEFGHJKMN1"}
+    
+    asyncio.run(run_test())
+
+
+def test_refresh_hot_commenters_parses_update_count():
+    """Test the commenter refresh statement and command tag parsing."""
+    mock_conn = AsyncMock()
+    mock_conn.execute = AsyncMock(return_value="UPDATE 7")
+    repo = ThreadRepository(db=mock_conn)
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    
+    async def run_test():
+        assert await repo.refresh_hot_commenters(now=now) == 7
+        query, param = mock_conn.execute.call_args[0]
+        assert "COUNT(DISTINCT author_id)" in query
+        assert "interval '3 hours'" in query
+        assert "hot_uniq3h > 0" in query
+        assert param == now
+    
+    asyncio.run(run_test())
+
+
+def test_list_threads_new_kind_filter_and_cursor():
+    """Test the 種別 filter is applied in SQL and recorded in the next cursor."""
+    from app.services.cursor import decode, encode
+    
+    rows = [
+        {"id": f"thr_01HX123456789ABCDEFGHJKM{i:02d}", "created_at": datetime(2024, 1, 1, 12 - i, tzinfo=timezone.utc)}
+        for i in range(3)
+    ]
+    mock_conn = AsyncMock()
+    mock_conn.fetch = AsyncMock(return_value=rows)
+    repo = ThreadRepository(db=mock_conn)
+    
+    async def run_test():
+        result = await repo.list_threads_new(limit=2, kind="question")
+        query, *params = mock_conn.fetch.call_args[0]
+        assert "AND kind = $2" in query
+        assert params == [3, "question"]
+        assert decode(result["nextCursor"])["type"] == "question"
+        
+        cursor = encode({"v": 1, "createdAt": "2024-01-01T10:00:00Z", "id": rows[1]["id"], "type": "question"})
+        await repo.list_threads_new(cursor=cursor, limit=2, kind="question")
+        query, *params = mock_conn.fetch.call_args[0]
+        assert "AND kind = $4" in query
+        assert "(created_at, id) < ($1, $2)" in query
+        assert params[2:] == [3, "question"]
+    
+    asyncio.run(run_test())
+
+
+def test_list_saved_threads_keyset_over_saves():
+    """Test saved threads are paged by (save time, save id) and the cursor records the last save."""
+    from app.services.cursor import decode
+    
+    saved_at = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    rows = [
+        {"id": f"thr_01HX123456789ABCDEFGHJKM{i:02d}", "saved_at": saved_at, "save_id": f"rcn_01HX123456789ABCDEFGHJKM{i:02d}"}
+        for i in range(3)
+    ]
+    mock_conn = AsyncMock()
+    mock_conn.fetch = AsyncMock(return_value=rows)
+    repo = ThreadRepository(db=mock_conn)
+    
+    async def run_test():
+        result = await repo.list_saved_threads(user_id="usr_01HX123456789ABCDEFGHJKMNP", limit=2)
+        query, *params = mock_conn.fetch.call_args[0]
+        assert params == ["usr_01HX123456789ABCDEFGHJKMNP", 3]
+        assert "s.kind = 'save'" in query
+        assert "deleted_at IS NULL" in query
+        assert "ORDER BY s.created_at DESC, s.id DESC" in query
+        assert [item["id"] for item in result["items"]] == [rows[0]["id"], rows[1]["id"]]
+        assert decode(result["nextCursor"]) == {"v": 1, "savedAt": "2024-01-02T00:00:00Z", "id": rows[1]["save_id"]}
+        
+        await repo.list_saved_threads(
+            user_id="usr_01HX123456789ABCDEFGHJKMNP", anchor_saved_at=saved_at, anchor_id=rows[1]["save_id"]
+        )
+        query, *params = mock_conn.fetch.call_args[0]
+        assert "(s.created_at, s.id) < ($3, $4)" in query
+        assert params[2:] == [saved_at, rows[1]["save_id"]]
+    
+    asyncio.run(run_test())
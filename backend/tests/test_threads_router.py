@@ -384,6 +384,7 @@ def test_list_threads_with_cursor(mock_get_db_pool):
 def test_list_threads_with_sort_hot(mock_get_db_pool):
     """Test listing threads with sort=hot."""
     from app.main import app
+    from app.schemas.threads import PaginatedThreadCards
     client = TestClient(app)
     
     # Mock database pool and connection
@@ -392,14 +393,106 @@ def test_list_threads_with_sort_hot(mock_get_db_pool):
     mock_pool.acquire.return_value = MockAcquire(mock_conn)
     mock_get_db_pool.return_value = mock_pool
     
-    # For Phase 1, hot sorting is not implemented, should return 400
-    response = client.get("/api/v1/threads?sort=hot")
+    mock_service = MagicMock()
+    mock_service.list_threads_hot = AsyncMock(
+        return_value=(PaginatedThreadCards(items=[], nextCursor=None), "2024-01-01T00:00:00Z")
+    )
+    
+    with patch('app.routers.threads.ThreadService', return_value=mock_service):
+        response = client.get("/api/v1/threads?sort=hot")
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["X-Snapshot-At"] == "2024-01-01T00:00:00Z"
+    mock_service.list_threads_hot.assert_called_once()
+    mock_service.list_threads_new.assert_not_called()
+
+
+@patch('app.core.db.get_db_pool')
+def test_list_threads_with_unknown_sort(mock_get_db_pool):
+    """Test that an unknown sort order is rejected."""
+    from app.main import app
+    client = TestClient(app)
+    
+    response = client.get("/api/v1/threads?sort=top")
     
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     data = response.json()
     assert data["error"]["code"] == "VALIDATION_ERROR"
 
 
+@patch('app.core.db.get_db_pool')
+def test_list_threads_with_type_filter(mock_get_db_pool):
+    """Test that type= is validated and passed through as the 種別 filter."""
+    from app.main import app
+    from app.schemas.threads import PaginatedThreadCards
+    client = TestClient(app)
+
+    mock_conn = AsyncMock()
+    mock_pool = MagicMock()
+    mock_pool.acquire.return_value = MockAcquire(mock_conn)
+    mock_get_db_pool.return_value = mock_pool
+
+    mock_service = MagicMock()
+    mock_service.list_threads_new = AsyncMock(return_value=PaginatedThreadCards(items=[], nextCursor=None))
+    mock_service.list_threads_hot = AsyncMock(
+        return_value=(PaginatedThreadCards(items=[], nextCursor=None), "2024-01-01T00:00:00Z")
+    )
+
+    with patch('app.routers.threads.ThreadService', return_value=mock_service):
+        response = client.get("/api/v1/threads?type=question")
+        assert response.status_code == status.HTTP_200_OK
+        assert mock_service.list_threads_new.call_args.kwargs["kind"] == "question"
+
+        response = client.get("/api/v1/threads?sort=hot&type=recruit")
+        assert response.status_code == status.HTTP_200_OK
+        assert mock_service.list_threads_hot.call_args.kwargs["kind"] == "recruit"
+
+        response = client.get("/api/v1/threads?type=poll")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["error"]["code"] == "VALIDATION_ERROR"
+
+
+@patch('app.core.db.get_db_pool')
+def test_list_threads_limit_and_next_link(mock_get_db_pool):
+    """Test that limit is validated per sort and the next page is advertised in Link."""
+    from urllib.parse import parse_qs, urlsplit
+
+    from app.main import app
+    from app.schemas.threads import PaginatedThreadCards
+    client = TestClient(app)
+
+    mock_conn = AsyncMock()
+    mock_pool = MagicMock()
+    mock_pool.acquire.return_value = MockAcquire(mock_conn)
+    mock_get_db_pool.return_value = mock_pool
+
+    mock_service = MagicMock()
+    mock_service.list_threads_new = AsyncMock(return_value=PaginatedThreadCards(items=[], nextCursor="next-cursor"))
+    mock_service.list_threads_hot = AsyncMock(
+        return_value=(PaginatedThreadCards(items=[], nextCursor=None), "2024-01-01T00:00:00Z")
+    )
+
+    with patch('app.routers.threads.ThreadService', return_value=mock_service):
+        response = client.get("/api/v1/threads?type=question&limit=5")
+        assert response.status_code == status.HTTP_200_OK
+        assert mock_service.list_threads_new.call_args.kwargs["limit"] == 5
+        target, rel = response.headers["Link"].split("; ")
+        assert rel == 'rel="next"'
+        url = urlsplit(target.strip("<>"))
+        assert url.path == "/api/v1/threads"
+        assert parse_qs(url.query) == {"type": ["question"], "limit": ["5"], "cursor": ["next-cursor"]}
+
+        # Default page size, and no Link on the last page
+        response = client.get("/api/v1/threads?sort=hot")
+        assert mock_service.list_threads_hot.call_args.kwargs["limit"] == 20
+        assert "Link" not in response.headers
+
+        for query in ("limit=0", "limit=101", "sort=hot&limit=51", "limit=abc"):
+            response = client.get(f"/api/v1/threads?{query}")
+            assert response.status_code == status.HTTP_400_BAD_REQUEST, query
+            assert response.json()["error"]["code"] == "VALIDATION_ERROR"
+
+
 @patch('app.core.db.get_db_pool')
 def test_get_thread_detail(mock_get_db_pool):
     """Test getting thread detail."""
@@ -490,6 +583,147 @@ def test_get_thread_detail_with_auth(mock_get_current_user, mock_get_db_pool):
         assert data["isMine"] is True
 
 
+@patch('app.core.db.get_db_pool')
+def test_get_thread_detail_etag_and_not_modified(mock_get_db_pool):
+    """Test that detail carries an ETag and a matching If-None-Match gets 304 from the version probe."""
+    from app.main import app
+    from app.schemas.threads import ThreadDetail
+    from app.services.threads_service import thread_detail_etag
+    client = TestClient(app)
+    
+    mock_conn = AsyncMock()
+    mock_pool = MagicMock()
+    mock_pool.acquire.return_value = MockAcquire(mock_conn)
+    mock_get_db_pool.return_value = mock_pool
+    
+    mock_thread = ThreadDetail(
+        id="thr_01HX123456789ABCDEFGHJKMNP",
+        title="Test Thread",
+        body="Test body content",
+        tags=[],
+        upCount=5,
+        saveCount=2,
+        createdAt="2024-01-01T00:00:00Z",
+        lastActivityAt="2024-01-01T00:00:00Z",
+        solvedCommentId=None,
+        hasImage=False,
+        imageUrl=None,
+        authorAffiliation=None,
+        isMine=False
+    )
+    etag = thread_detail_etag(mock_thread)
+    
+    mock_service = MagicMock()
+    mock_service.get_thread = AsyncMock(return_value=mock_thread)
+    mock_service.get_thread_etag = AsyncMock(return_value=etag)
+    
+    with patch('app.routers.threads.ThreadService', return_value=mock_service):
+        response = client.get("/api/v1/threads/thr_01HX123456789ABCDEFGHJKMNP")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] == etag
+        assert response.headers["Cache-Control"] == "private, no-cache"
+        mock_service.get_thread_etag.assert_not_called()
+        
+        # Matching validator: 304 without building the detail
+        mock_service.get_thread.reset_mock()
+        response = client.get(
+            "/api/v1/threads/thr_01HX123456789ABCDEFGHJKMNP",
+            headers={"If-None-Match": f'"other", W/{etag}'}
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        mock_service.get_thread.assert_not_called()
+        
+        # Stale validator: full 200 response
+        response = client.get(
+            "/api/v1/threads/thr_01HX123456789ABCDEFGHJKMNP",
+            headers={"If-None-Match": '"stale"'}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["id"] == "thr_01HX123456789ABCDEFGHJKMNP"
+        mock_service.get_thread.assert_called_once()
+
+
+@patch('app.core.db.get_db_pool')
+def test_get_threads_batch(mock_get_db_pool):
+    """Test that :batch splits the comma-separated ids and returns the batch."""
+    from app.main import app
+    from app.schemas.threads import ThreadCardBatch
+    client = TestClient(app)
+    
+    mock_conn = AsyncMock()
+    mock_pool = MagicMock()
+    mock_pool.acquire.return_value = MockAcquire(mock_conn)
+    mock_get_db_pool.return_value = mock_pool
+    
+    mock_service = MagicMock()
+    mock_service.get_thread_cards = AsyncMock(
+        return_value=ThreadCardBatch(items=[], missing=["thr_01HX123456789ABCDEFGHJKMNQ"])
+    )
+    
+    with patch('app.routers.threads.ThreadService', return_value=mock_service):
+        response = client.get(
+            "/api/v1/threads:batch?ids=thr_01HX123456789ABCDEFGHJKMNP, thr_01HX123456789ABCDEFGHJKMNQ,"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"items": [], "missing": ["thr_01HX123456789ABCDEFGHJKMNQ"]}
+        assert mock_service.get_thread_cards.call_args.kwargs["thread_ids"] == [
+            "thr_01HX123456789ABCDEFGHJKMNP", "thr_01HX123456789ABCDEFGHJKMNQ"
+        ]
+        
+        response = client.get("/api/v1/threads:batch")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@patch('app.core.db.get_db_pool')
+def test_get_thread_view(mock_get_db_pool):
+    """Test the aggregate thread view returns detail, comments and reactions, or 404."""
+    from app.main import app
+    from app.schemas.comments import PaginatedComments
+    from app.schemas.threads import ThreadDetail, ThreadView, ViewerReactions
+    client = TestClient(app)
+    
+    mock_conn = AsyncMock()
+    mock_pool = MagicMock()
+    mock_pool.acquire.return_value = MockAcquire(mock_conn)
+    mock_get_db_pool.return_value = mock_pool
+    
+    view = ThreadView(
+        thread=ThreadDetail(
+            id="thr_01HX123456789ABCDEFGHJKMNP",
+            title="Test Thread",
+            body="Test body content",
+            tags=[],
+            upCount=5,
+            saveCount=2,
+            createdAt="2024-01-01T00:00:00Z",
+            lastActivityAt="2024-01-01T00:00:00Z",
+            hasImage=False,
+            isMine=False
+        ),
+        comments=PaginatedComments(items=[], nextCursor=None),
+        myReactions=ViewerReactions(up=True, save=False)
+    )
+    mock_service = MagicMock()
+    mock_service.get_thread_view = AsyncMock(return_value=view)
+    
+    with patch('app.routers.threads.ThreadService', return_value=mock_service):
+        response = client.get("/api/v1/threads/thr_01HX123456789ABCDEFGHJKMNP/view")
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["thread"]["id"] == "thr_01HX123456789ABCDEFGHJKMNP"
+        assert data["comments"] == {"items": [], "nextCursor": None}
+        assert data["pinnedComment"] is None
+        assert data["myReactions"] == {"up": True, "save": False}
+        assert response.headers["Cache-Control"] == "private, no-cache"
+        
+        mock_service.get_thread_view = AsyncMock(return_value=None)
+        response = client.get("/api/v1/threads/thr_01HX123456789ABCDEFGHJKMNP/view")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json()["error"]["code"] == "NOT_FOUND"
+
+
 @patch('app.core.db.get_db_pool')
 def test_get_thread_not_found(mock_get_db_pool):
     """Test getting non-existent thread returns 404."""
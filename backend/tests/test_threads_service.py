@@ -25,6 +25,7 @@ def test_create_thread_basic():
     """Test basic thread creation."""
     # Mock repository
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     mock_repo.create_thread = AsyncMock(return_value="thr_01HX123456789ABCDEFGHJKMNP")
     
     created_at = datetime.now(timezone.utc)
@@ -118,6 +119,7 @@ def test_create_thread_body_validation():
         # Actually, based on specs, empty body is allowed (default="")
         # So this test should pass
         mock_repo = AsyncMock()
+        mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
         mock_repo.create_thread = AsyncMock(return_value="thr_01HX123456789ABCDEFGHJKMNP")
         mock_repo.get_thread_by_id = AsyncMock(return_value={
             "id": "thr_01HX123456789ABCDEFGHJKMNP",
@@ -163,6 +165,7 @@ def test_create_thread_removes_control_characters():
         )
         
         mock_repo = AsyncMock()
+        mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
         mock_repo.create_thread = AsyncMock(return_value="thr_01HX123456789ABCDEFGHJKMNP")
         mock_repo.get_thread_by_id = AsyncMock(return_value={
             "id": "thr_01HX123456789ABCDEFGHJKMNP",
@@ -196,6 +199,7 @@ def test_create_thread_removes_control_characters():
 def test_create_thread_with_tags():
     """Test thread creation with tags."""
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     mock_repo.create_thread = AsyncMock(return_value="thr_01HX123456789ABCDEFGHJKMNP")
     mock_repo.get_thread_by_id = AsyncMock(return_value={
         "id": "thr_01HX123456789ABCDEFGHJKMNP",
@@ -239,6 +243,7 @@ def test_create_thread_with_tags():
 def test_create_thread_returns_thread_card():
     """Test that create_thread returns a properly formatted ThreadCard."""
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     thread_id = "thr_01HX123456789ABCDEFGHJKMNP"
     mock_repo.create_thread = AsyncMock(return_value=thread_id)
     
@@ -296,6 +301,7 @@ def test_create_thread_returns_thread_card():
 def test_create_thread_error_propagation():
     """Test that database errors are properly propagated."""
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     mock_repo.create_thread = AsyncMock(side_effect=Exception("Database error"))
     
     mock_conn = AsyncMock()
@@ -348,6 +354,7 @@ def test_create_thread_max_title_length():
 def test_get_thread_exists():
     """Test getting an existing thread."""
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     thread_id = "thr_01HX123456789ABCDEFGHJKMNP"
     author_id = "usr_01HX123456789ABCDEFGHJKMNP"
     created_at = datetime.now(timezone.utc)
@@ -399,6 +406,7 @@ def test_get_thread_exists():
 def test_get_thread_not_mine():
     """Test getting a thread that doesn't belong to current user."""
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     thread_id = "thr_01HX123456789ABCDEFGHJKMNP"
     author_id = "usr_01HX123456789ABCDEFGHJKMNP"
     current_user_id = "usr_01HX987654321ZYXWVUTSRQP"
@@ -439,6 +447,7 @@ def test_get_thread_not_mine():
 def test_get_thread_not_found():
     """Test getting a non-existent thread."""
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     thread_id = "thr_01HX123456789ABCDEFGHJKMNP"
     
     # Repository returns None for non-existent thread
@@ -466,6 +475,7 @@ def test_get_thread_not_found():
 def test_get_thread_deleted():
     """Test that deleted threads are not returned."""
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     thread_id = "thr_01HX123456789ABCDEFGHJKMNP"
     deleted_at = datetime.now(timezone.utc)
     
@@ -493,6 +503,7 @@ def test_get_thread_deleted():
 def test_get_thread_with_solved():
     """Test getting a solved thread."""
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     thread_id = "thr_01HX123456789ABCDEFGHJKMNP"
     created_at = datetime.now(timezone.utc)
     
@@ -550,6 +561,9 @@ def test_get_thread_id_validation():
 def test_list_threads_new_without_cursor():
     """Test listing threads without cursor (first page)."""
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={
+        "thr_01HX333333333333333333333": [{"key": "種別", "value": "question"}]
+    })
     created_at = datetime.now(timezone.utc)
     
     # Mock repository return value with multiple threads
@@ -603,10 +617,18 @@ def test_list_threads_new_without_cursor():
             assert result.items[1].id == "thr_01HX222222222222222222222"
             assert result.nextCursor == "eyJ2IjoxLCJjcmVhdGVkQXQiOiIyMDI0LTAxLTAxVDAwOjAwOjAwWiIsImlkIjoidGhyXzAxSFgyMjIyMjIyMjIyMjIyMjIyMjIyMjIifQ"
             
+            # Tags for the whole page come from one batched query
+            mock_repo.get_tags_by_thread_ids.assert_called_once_with(
+                thread_ids=["thr_01HX333333333333333333333", "thr_01HX222222222222222222222"]
+            )
+            assert result.items[0].tags == [Tag(key="種別", value="question")]
+            assert result.items[1].tags == []
+            
             # Verify repository was called correctly
             mock_repo.list_threads_new.assert_called_once_with(
                 cursor=None,
-                limit=20
+                limit=20,
+                kind=None
             )
     
     asyncio.run(run_test())
@@ -615,6 +637,7 @@ def test_list_threads_new_without_cursor():
 def test_list_threads_new_with_cursor():
     """Test listing threads with cursor (pagination)."""
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     created_at = datetime.now(timezone.utc)
     
     # Create a test cursor
@@ -663,7 +686,8 @@ def test_list_threads_new_with_cursor():
             # Verify repository was called with cursor
             mock_repo.list_threads_new.assert_called_once_with(
                 cursor=test_cursor,
-                limit=20
+                limit=20,
+                kind=None
             )
     
     asyncio.run(run_test())
@@ -672,6 +696,7 @@ def test_list_threads_new_with_cursor():
 def test_list_threads_new_empty_result():
     """Test listing threads with empty result."""
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     
     mock_repo.list_threads_new = AsyncMock(return_value={
         "items": [],
@@ -697,9 +722,33 @@ def test_list_threads_new_empty_result():
     asyncio.run(run_test())
 
 
+def test_thread_card_reads_denormalized_reply_stats():
+    """Test that cards take replies/lastReplyAt from the stored thread columns."""
+    service = ThreadService(db=None)
+    created_at = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    row = {
+        "id": "thr_01HX123456789ABCDEFGHJKMNP",
+        "author_id": "usr_01HX123456789ABCDEFGHJKMNP",
+        "title": "Thread",
+        "excerpt": "",
+        "created_at": created_at,
+        "comment_count": 7,
+        "last_reply_at": created_at + timedelta(hours=2),
+    }
+    
+    card = service._to_thread_card(row, None, [])
+    assert card.replies == 7
+    assert card.lastReplyAt == "2024-01-01T14:00:00Z"
+    
+    card = service._to_thread_card({**row, "comment_count": 0, "last_reply_at": None}, None, [])
+    assert card.replies == 0
+    assert card.lastReplyAt is None
+
+
 def test_list_threads_new_with_is_mine():
     """Test that threads correctly identify ownership."""
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     current_user_id = "usr_01HX123456789ABCDEFGHJKMNP"
     other_user_id = "usr_01HX987654321ZYXWVUTSRQP"
     created_at = datetime.now(timezone.utc)
@@ -776,6 +825,7 @@ def test_list_threads_new_invalid_cursor():
 def test_list_threads_new_cursor_generation():
     """Test that next cursor is generated correctly."""
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     created_at = datetime.now(timezone.utc)
     last_thread_created = created_at - timedelta(hours=2)
     
@@ -830,6 +880,7 @@ def test_list_threads_new_cursor_generation():
 def test_delete_thread_by_owner():
     """Test that owner can delete their thread."""
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     thread_id = "thr_01HX123456789ABCDEFGHJKMNP"
     owner_id = "usr_01HX123456789ABCDEFGHJKMNP"
     
@@ -875,6 +926,7 @@ def test_delete_thread_by_owner():
 def test_delete_thread_by_non_owner():
     """Test that non-owner cannot delete thread."""
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     thread_id = "thr_01HX123456789ABCDEFGHJKMNP"
     owner_id = "usr_01HX123456789ABCDEFGHJKMNP"
     other_user_id = "usr_01HX987654321ZYXWVUTSRQP"
@@ -918,6 +970,7 @@ def test_delete_thread_by_non_owner():
 def test_delete_thread_not_found():
     """Test deleting non-existent thread."""
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     thread_id = "thr_01HX123456789ABCDEFGHJKMNP"
     user_id = "usr_01HX123456789ABCDEFGHJKMNP"
     
@@ -949,6 +1002,7 @@ def test_delete_thread_not_found():
 def test_delete_thread_already_deleted():
     """Test deleting already deleted thread."""
     mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
     thread_id = "thr_01HX123456789ABCDEFGHJKMNP"
     owner_id = "usr_01HX123456789ABCDEFGHJKMNP"
     
@@ -1002,4 +1056,380 @@ def test_delete_thread_invalid_id():
         
         assert "Invalid thread ID" in str(exc_info.value)
     
-    asyncio.run(run_test())
\ No newline at end of file
+    asyncio.run(run_test())
+
+def test_list_threads_hot_requires_score_in_cursor():
+    """Test that a 'new' cursor is rejected for sort=hot."""
+    from app.util.cursor import encode_cursor
+    service = ThreadService(db=MagicMock())
+    cursor = encode_cursor({"v": 1, "createdAt": "2024-01-01T00:00:00Z", "id": "thr_01HX123456789ABCDEFGHJKMNP"})
+    
+    async def run_test():
+        with pytest.raises(ValidationException):
+            await service.list_threads_hot(cursor=cursor, current_user_id=None)
+    
+    asyncio.run(run_test())
+
+
+def _hot_row(thread_id: str, rank: float) -> dict:
+    return {
+        "id": thread_id,
+        "author_id": "usr_01HX123456789ABCDEFGHJKMNP",
+        "title": "Hot thread",
+        "excerpt": "",
+        "up_count": 1,
+        "save_count": 0,
+        "heat": 0,
+        "hot_rank": rank,
+        "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "solved_comment_id": None
+    }
+
+
+def test_list_threads_hot_pages_through_snapshot():
+    """Test that later pages slice the frozen snapshot by offset."""
+    from app.services.ranking_snapshots import ranking_snapshots
+    from app.util.cursor import decode_cursor
+    ranking_snapshots.reset()
+    
+    ids = [f"thr_{i:026d}" for i in range(25)]
+    mock_repo = MagicMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
+    mock_repo.list_hot_ids = AsyncMock(return_value=ids)
+    mock_repo.get_thread_cards_by_ids = AsyncMock(
+        side_effect=lambda ids: [_hot_row(thread_id, 100.0) for thread_id in ids]
+    )
+    service = ThreadService(db=MagicMock())
+    
+    async def run_test():
+        with patch("app.services.threads_service.ThreadRepository", return_value=mock_repo):
+            first, snapshot_at = await service.list_threads_hot(cursor=None, current_user_id=None)
+            second, snapshot_at2 = await service.list_threads_hot(cursor=first.nextCursor, current_user_id=None)
+        
+        assert [c.id for c in first.items] == ids[:20]
+        assert decode_cursor(first.nextCursor)["offset"] == 20
+        assert decode_cursor(first.nextCursor)["snapshotAt"] == snapshot_at
+        assert [c.id for c in second.items] == ids[20:]
+        assert second.nextCursor is None
+        assert snapshot_at2 == snapshot_at
+        mock_repo.list_hot_ids.assert_called_once()
+    
+    asyncio.run(run_test())
+    assert ranking_snapshots.stats()["hits"] == 1
+    ranking_snapshots.reset()
+
+
+def test_list_threads_hot_falls_back_to_keyset_when_snapshot_missing():
+    """Test that paging continues on the live ranking if the snapshot is gone."""
+    from app.services.ranking_snapshots import ranking_snapshots
+    from app.util.cursor import encode_cursor
+    ranking_snapshots.reset()
+    
+    snapshot_at = (datetime.now(timezone.utc) - timedelta(hours=1)).replace(microsecond=0)
+    cursor = encode_cursor({
+        "v": 1, "score": 40000.5, "createdAt": "2024-01-01T00:00:00Z", "id": "thr_01HX123456789ABCDEFGHJKMNP",
+        "snapshotAt": snapshot_at.isoformat().replace("+00:00", "Z"), "offset": 20
+    })
+    mock_repo = MagicMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
+    mock_repo.list_threads_hot = AsyncMock(return_value={"items": [_hot_row("thr_01HX123456789ABCDEFGHJKMNQ", 1.0)], "nextCursor": None})
+    service = ThreadService(db=MagicMock())
+    
+    async def run_test():
+        with patch("app.services.threads_service.ThreadRepository", return_value=mock_repo):
+            page, returned_snapshot_at = await service.list_threads_hot(cursor=cursor, current_user_id=None)
+        
+        assert [c.id for c in page.items] == ["thr_01HX123456789ABCDEFGHJKMNQ"]
+        assert returned_snapshot_at == snapshot_at.isoformat().replace("+00:00", "Z")
+        anchor = mock_repo.list_threads_hot.call_args.kwargs["anchor"]
+        assert anchor["score"] == 40000.5
+    
+    asyncio.run(run_test())
+
+
+def test_list_threads_hot_rejects_expired_snapshot():
+    """Test that a snapshot older than 24h is a 400."""
+    from app.util.cursor import encode_cursor
+    snapshot_at = datetime.now(timezone.utc) - timedelta(hours=25)
+    cursor = encode_cursor({
+        "v": 1, "score": 1.0, "createdAt": "2024-01-01T00:00:00Z", "id": "thr_01HX123456789ABCDEFGHJKMNP",
+        "snapshotAt": snapshot_at.isoformat().replace("+00:00", "Z"), "offset": 20
+    })
+    service = ThreadService(db=MagicMock())
+    
+    async def run_test():
+        with pytest.raises(ValidationException):
+            await service.list_threads_hot(cursor=cursor, current_user_id=None)
+    
+    asyncio.run(run_test())
+
+
+@pytest.mark.asyncio
+async def test_get_thread_etag_matches_detail_etag():
+    """Test the version probe yields the same ETag as the built detail, per caller."""
+    from app.services.threads_service import thread_detail_etag
+    
+    author = "usr_01HX123456789ABCDEFGHJKMNP"
+    row = {
+        "id": "thr_01HX123456789ABCDEFGHJKMNP",
+        "author_id": author,
+        "title": "Thread",
+        "body": "Body",
+        "up_count": 3,
+        "save_count": 1,
+        "solved_comment_id": None,
+        "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "last_activity_at": datetime(2024, 1, 2, tzinfo=timezone.utc),
+        "author_faculty": "理学部",
+        "author_year": 2,
+    }
+    version = {k: row[k] for k in ("id", "author_id", "up_count", "save_count", "last_activity_at", "solved_comment_id", "author_faculty", "author_year")}
+    mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
+    mock_repo.get_thread_by_id = AsyncMock(return_value=row)
+    mock_repo.get_thread_version = AsyncMock(return_value=version)
+    service = ThreadService(db=AsyncMock())
+    
+    with patch('app.services.threads_service.ThreadRepository', return_value=mock_repo):
+        for user_id in (author, None):
+            detail = await service.get_thread(thread_id=row["id"], current_user_id=user_id)
+            etag = await service.get_thread_etag(thread_id=row["id"], current_user_id=user_id)
+            assert etag == thread_detail_etag(detail)
+        
+        # isMine differs per caller, so does the ETag
+        assert await service.get_thread_etag(thread_id=row["id"], current_user_id=author) != etag
+        
+        # Any change to a versioned column changes the ETag
+        mock_repo.get_thread_version = AsyncMock(return_value={**version, "up_count": 4})
+        assert await service.get_thread_etag(thread_id=row["id"], current_user_id=None) != etag
+        
+        mock_repo.get_thread_version = AsyncMock(return_value=None)
+        assert await service.get_thread_etag(thread_id=row["id"], current_user_id=None) is None
+
+
+@pytest.mark.asyncio
+async def test_type_filtered_timelines_reject_cursor_of_other_filter():
+    """Test that a cursor is only accepted for the type filter it was issued for."""
+    from app.util.cursor import encode_cursor
+    
+    service = ThreadService(db=AsyncMock())
+    new_cursor = encode_cursor({"v": 1, "createdAt": "2024-01-01T00:00:00Z", "id": "thr_01HX123456789ABCDEFGHJKMNP", "type": "question"})
+    
+    with pytest.raises(ValidationException):
+        await service.list_threads_new(cursor=new_cursor, current_user_id=None, kind="chat")
+    with pytest.raises(ValidationException):
+        await service.list_threads_new(cursor=new_cursor, current_user_id=None)
+
+
+@pytest.mark.asyncio
+async def test_list_threads_hot_snapshots_each_type_filter_separately():
+    """Test that a type-filtered hot listing uses its own ranking snapshot."""
+    from app.services.ranking_snapshots import ranking_snapshots
+    from app.util.cursor import decode_cursor
+    
+    ranking_snapshots.reset()
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    ids = [f"thr_01HX123456789ABCDEFGHJKM{i:02d}" for i in range(25)]
+    mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
+    mock_repo.list_hot_ids = AsyncMock(return_value=ids)
+    mock_repo.get_thread_cards_by_ids = AsyncMock(side_effect=lambda ids: [
+        {"id": thread_id, "author_id": "usr_x", "title": "t", "excerpt": "", "created_at": created_at, "hot_rank": 1.0}
+        for thread_id in ids
+    ])
+    service = ThreadService(db=AsyncMock())
+    
+    with patch('app.services.threads_service.ThreadRepository', return_value=mock_repo):
+        page, snapshot_at = await service.list_threads_hot(current_user_id=None, kind="question")
+    
+    mock_repo.list_hot_ids.assert_called_once_with(limit=200, kind="question")
+    assert [key[0] for key in ranking_snapshots._snapshots] == ["hot:question"]
+    assert decode_cursor(page.nextCursor)["type"] == "question"
+    ranking_snapshots.reset()
+
+
+@pytest.mark.asyncio
+async def test_list_threads_new_custom_limit_bypasses_cache():
+    """Test that a non-default page size reaches the repository and is not cached."""
+    from app.services.timeline_cache import timeline_cache
+    
+    timeline_cache.reset()
+    mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
+    mock_repo.list_threads_new = AsyncMock(return_value={"items": [], "nextCursor": None})
+    service = ThreadService(db=AsyncMock())
+    
+    with patch('app.services.threads_service.ThreadRepository', return_value=mock_repo):
+        await service.list_threads_new(current_user_id=None, limit=5)
+        await service.list_threads_new(current_user_id=None, limit=5)
+    
+    assert mock_repo.list_threads_new.call_count == 2
+    mock_repo.list_threads_new.assert_called_with(cursor=None, limit=5, kind=None)
+    assert timeline_cache.stats()["pages"] == 0
+
+
+def _view_thread_row(**overrides):
+    row = {
+        "id": "thr_01HX123456789ABCDEFGHJKMNP",
+        "author_id": "usr_01HX123456789ABCDEFGHJKMNP",
+        "title": "Test Thread",
+        "body": "Test body",
+        "up_count": 3,
+        "save_count": 1,
+        "solved_comment_id": None,
+        "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "last_activity_at": datetime(2024, 1, 2, tzinfo=timezone.utc),
+    }
+    row.update(overrides)
+    return row
+
+
+def _view_comment_row(comment_id):
+    return {
+        "id": comment_id,
+        "body": "comment",
+        "up_count": 0,
+        "created_at": datetime(2024, 1, 1, 12, tzinfo=timezone.utc),
+        "author_faculty": None,
+        "author_year": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_thread_view_assembles_detail_comments_and_reactions():
+    """Test the thread view reuses the solved comment when it is on the first page."""
+    solved_id = "cmt_01HX123456789ABCDEFGHJKMNP"
+    mock_conn = AsyncMock()
+    mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
+    mock_repo.get_thread_by_id = AsyncMock(return_value=_view_thread_row(
+        solved_comment_id=solved_id, viewer_up=True, viewer_save=False
+    ))
+    mock_conn.fetch = AsyncMock(return_value=[_view_comment_row(solved_id)])
+    service = ThreadService(db=mock_conn)
+    
+    with patch('app.services.threads_service.ThreadRepository', return_value=mock_repo):
+        view = await service.get_thread_view(
+            thread_id="thr_01HX123456789ABCDEFGHJKMNP",
+            current_user_id="usr_01HX123456789ABCDEFGHJKMNQ"
+        )
+    
+    mock_repo.get_thread_by_id.assert_called_once_with(
+        thread_id="thr_01HX123456789ABCDEFGHJKMNP", viewer_id="usr_01HX123456789ABCDEFGHJKMNQ"
+    )
+    assert view.thread.upCount == 3
+    assert view.thread.isMine is False
+    assert [comment.id for comment in view.comments.items] == [solved_id]
+    assert view.pinnedComment.id == solved_id
+    assert view.myReactions.up is True and view.myReactions.save is False
+    # Comment page only; the pinned comment came from it
+    mock_conn.fetch.assert_called_once()
+    mock_conn.fetchrow.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_thread_view_fetches_solved_comment_beyond_first_page():
+    """Test an off-page solved comment is fetched by ID, and anonymous callers get no reactions."""
+    solved_id = "cmt_01HX123456789ABCDEFGHJKMZZ"
+    mock_conn = AsyncMock()
+    mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
+    mock_repo.get_thread_by_id = AsyncMock(return_value=_view_thread_row(solved_comment_id=solved_id))
+    mock_conn.fetch = AsyncMock(return_value=[_view_comment_row("cmt_01HX123456789ABCDEFGHJKMNP")])
+    mock_conn.fetchrow = AsyncMock(return_value=_view_comment_row(solved_id))
+    service = ThreadService(db=mock_conn)
+    
+    with patch('app.services.threads_service.ThreadRepository', return_value=mock_repo):
+        view = await service.get_thread_view(thread_id="thr_01HX123456789ABCDEFGHJKMNP", current_user_id=None)
+    
+    assert view.pinnedComment.id == solved_id
+    assert mock_conn.fetchrow.call_args[0][1:] == (solved_id, "thr_01HX123456789ABCDEFGHJKMNP")
+    assert view.myReactions is None
+
+
+@pytest.mark.asyncio
+async def test_get_thread_view_not_found():
+    """Test the thread view is None for a missing thread, without loading comments."""
+    mock_conn = AsyncMock()
+    mock_repo = AsyncMock()
+    mock_repo.get_thread_by_id = AsyncMock(return_value=None)
+    service = ThreadService(db=mock_conn)
+    
+    with patch('app.services.threads_service.ThreadRepository', return_value=mock_repo):
+        view = await service.get_thread_view(thread_id="thr_01HX123456789ABCDEFGHJKMNP", current_user_id=None)
+    
+    assert view is None
+    mock_conn.fetch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_thread_cards_batch_keeps_request_order_and_reports_missing():
+    """Test batch lookup fetches once, returns request order and lists missing IDs."""
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    ids = [f"thr_01HX123456789ABCDEFGHJKM{i:02d}" for i in range(3)]
+    mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
+    # Rows come back in request order without the deleted one
+    mock_repo.get_thread_cards_by_ids = AsyncMock(return_value=[
+        {"id": thread_id, "author_id": "usr_01HX123456789ABCDEFGHJKMNP", "title": "t", "excerpt": "", "created_at": created_at}
+        for thread_id in (ids[2], ids[0])
+    ])
+    service = ThreadService(db=AsyncMock())
+    
+    with patch('app.services.threads_service.ThreadRepository', return_value=mock_repo):
+        batch = await service.get_thread_cards(
+            thread_ids=[ids[2], ids[1], ids[0], ids[2]],
+            current_user_id="usr_01HX123456789ABCDEFGHJKMNP"
+        )
+    
+    mock_repo.get_thread_cards_by_ids.assert_called_once_with(ids=[ids[2], ids[1], ids[0]])
+    assert [card.id for card in batch.items] == [ids[2], ids[0]]
+    assert all(card.isMine for card in batch.items)
+    assert batch.missing == [ids[1]]
+
+
+@pytest.mark.asyncio
+async def test_get_thread_cards_batch_validation():
+    """Test batch lookup rejects empty, oversized and malformed ID lists before querying."""
+    service = ThreadService(db=AsyncMock())
+    
+    with pytest.raises(ValidationException):
+        await service.get_thread_cards(thread_ids=[], current_user_id=None)
+    with pytest.raises(ValidationException):
+        await service.get_thread_cards(
+            thread_ids=[f"thr_01HX123456789ABCDEFGHJK{i:03d}" for i in range(101)], current_user_id=None
+        )
+    with pytest.raises(ValidationException) as exc_info:
+        await service.get_thread_cards(
+            thread_ids=["thr_01HX123456789ABCDEFGHJKMNP", "bad", "cmt_01HX123456789ABCDEFGHJKMNP"],
+            current_user_id=None
+        )
+    assert [detail["field"] for detail in exc_info.value.details] == ["ids[1]", "ids[2]"]
+
+
+@pytest.mark.asyncio
+async def test_list_saved_threads_parses_cursor_anchor():
+    """Test the saved-threads cursor is decoded into a datetime anchor and other cursors are rejected."""
+    from app.util.cursor import encode_cursor
+    
+    mock_repo = AsyncMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
+    mock_repo.list_saved_threads = AsyncMock(return_value={"items": [], "nextCursor": None})
+    service = ThreadService(db=AsyncMock())
+    cursor = encode_cursor({"v": 1, "savedAt": "2024-01-02T00:00:00Z", "id": "rcn_01HX123456789ABCDEFGHJKMNP"})
+    
+    with patch('app.services.threads_service.ThreadRepository', return_value=mock_repo):
+        page = await service.list_saved_threads(user_id="usr_01HX123456789ABCDEFGHJKMNP", cursor=cursor, limit=5)
+        
+        mock_repo.list_saved_threads.assert_called_once_with(
+            user_id="usr_01HX123456789ABCDEFGHJKMNP",
+            anchor_saved_at=datetime(2024, 1, 2, tzinfo=timezone.utc),
+            anchor_id="rcn_01HX123456789ABCDEFGHJKMNP",
+            limit=5
+        )
+        assert page.items == [] and page.nextCursor is None
+        
+        # A timeline cursor is not a saved-threads cursor
+        timeline_cursor = encode_cursor({"v": 1, "createdAt": "2024-01-02T00:00:00Z", "id": "thr_01HX123456789ABCDEFGHJKMNP"})
+        with pytest.raises(ValidationException):
+            await service.list_saved_threads(user_id="usr_01HX123456789ABCDEFGHJKMNP", cursor=timeline_cursor)
@@ -0,0 +1,178 @@
+"""Test first-page timeline cache for sort=new."""
+import time
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.schemas.threads import CreateThreadRequest
+from app.services.threads_service import ThreadService
+from app.services.timeline_cache import TimelineCache, timeline_cache
+
+AUTHOR = "usr_01HX123456789ABCDEFGHJKMNP"
+OTHER = "usr_01HX123456789ABCDEFGHJKMNQ"
+
+
+def _row(i: int) -> dict:
+    return {
+        "id": f"thr_01HX123456789ABCDEFGHJKM{i:02d}",
+        "author_id": AUTHOR if i % 2 == 0 else OTHER,
+        "title": f"Thread {i}",
+        "excerpt": "",
+        "up_count": 0,
+        "save_count": 0,
+        "heat": 0,
+        "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "solved_comment_id": None
+    }
+
+
+def _repo(next_cursor=None):
+    mock_repo = MagicMock()
+    mock_repo.get_tags_by_thread_ids = AsyncMock(return_value={})
+    mock_repo.list_threads_new = AsyncMock(return_value={"items": [_row(0), _row(1)], "nextCursor": next_cursor})
+    return mock_repo
+
+
+@pytest.mark.asyncio
+async def test_first_page_is_shared_across_users_with_is_mine_applied():
+    """Test one cached page serving different callers."""
+    mock_repo = _repo()
+    service = ThreadService(db=MagicMock())
+
+    with patch("app.services.threads_service.ThreadRepository", return_value=mock_repo):
+        mine = await service.list_threads_new(cursor=None, current_user_id=AUTHOR)
+        theirs = await service.list_threads_new(cursor=None, current_user_id=OTHER)
+        anonymous = await service.list_threads_new(cursor=None, current_user_id=None)
+
+    mock_repo.list_threads_new.assert_called_once()
+    assert [c.isMine for c in mine.items] == [True, False]
+    assert [c.isMine for c in theirs.items] == [False, True]
+    assert [c.isMine for c in anonymous.items] == [False, False]
+    stats = timeline_cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["approxBytes"] > 0
+
+
+@pytest.mark.asyncio
+async def test_create_thread_invalidates_cached_pages():
+    """Test write-through invalidation on thread creation."""
+    mock_repo = _repo()
+    mock_repo.create_thread = AsyncMock(return_value="thr_01HX123456789ABCDEFGHJKM99")
+    mock_repo.get_thread_by_id = AsyncMock(return_value=_row(99))
+    service = ThreadService(db=MagicMock())
+
+    with patch("app.services.threads_service.ThreadRepository", return_value=mock_repo):
+        await service.list_threads_new(cursor=None, current_user_id=None)
+        await service.create_thread(
+            user_id=AUTHOR,
+            thread_create=CreateThreadRequest(title="New", body="Body", tags=[])
+        )
+        await service.list_threads_new(cursor=None, current_user_id=None)
+
+    assert mock_repo.list_threads_new.call_count == 2
+    assert timeline_cache.stats()["invalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_following_pages_cached_up_to_max_pages():
+    """Test that only cursors handed out by cached leading pages are cached."""
+    cache = TimelineCache(max_pages=2)
+
+    cache.put(None, [], [], "cursor-2", cache.generation)
+    cache.put("cursor-2", [], [], "cursor-3", cache.generation)
+    cache.put("cursor-3", [], [], None, cache.generation)
+    cache.put("foreign", [], [], None, cache.generation)
+
+    assert cache.get(None, None) is not None
+    assert cache.get("cursor-2", None) is not None
+    assert cache.get("cursor-3", None) is None
+    assert cache.get("foreign", None) is None
+
+
+def test_page_read_before_invalidation_is_not_stored():
+    """Test that a slow read racing a write cannot repopulate stale data."""
+    cache = TimelineCache()
+    generation = cache.generation
+    cache.invalidate()
+
+    cache.put(None, [], [], None, generation)
+
+    assert cache.get(None, None) is None
+
+
+def test_ttl_bounds_staleness():
+    """Test that pages older than the TTL are not served."""
+    cache = TimelineCache(ttl_seconds=10)
+    cache.put(None, [], [], None, cache.generation)
+
+    with patch("app.services.timeline_cache.time.monotonic", return_value=time.monotonic() + 11):
+        assert cache.get(None, None) is None
+    assert cache.stats()["pages"] == 0
+
+
+def test_type_filters_are_cached_separately():
+    """Test that each type filter has its own leading pages."""
+    cache = TimelineCache(max_pages=2)
+
+    cache.put(None, [], [], "q-2", cache.generation, "question")
+
+    assert cache.get(None, None, "question") is not None
+    assert cache.get(None, None) is None
+    assert cache.get(None, None, "chat") is None
+    # A cursor handed out by the question timeline is not a page of another filter
+    cache.put("q-2", [], [], None, cache.generation, "chat")
+    assert cache.get("q-2", None, "chat") is None
+
+    cache.invalidate()
+    assert cache.get(None, None, "question") is None
+
+
+def test_follow_up_cursors_are_capped():
+    """Test that remembered cursors stay bounded, dropping the oldest."""
+    cache = TimelineCache(max_pages=2, max_depths=2)
+
+    for i in range(3):
+        cache.put(None, [], [], f"cursor-{i}", cache.generation)
+
+    assert cache.stats()["cursors"] == 2
+    cache.put("cursor-0", [], [], None, cache.generation)
+    cache.put("cursor-2", [], [], None, cache.generation)
+    assert cache.get("cursor-0", None) is None
+    assert cache.get("cursor-2", None) is not None
+
+
+def test_replica_read_right_after_invalidation_is_not_stored():
+    """Test that a lagging replica cannot refill the cache after a local write."""
+    cache = TimelineCache(replica_lag_seconds=5)
+    cache.invalidate()
+
+    cache.put(None, [], [], None, cache.generation, from_replica=True)
+    assert cache.get(None, None) is None
+    assert cache.stats()["replicaFillsSkipped"] == 1
+
+    cache.put(None, [], [], None, cache.generation)
+    assert cache.get(None, None) is not None
+
+    cache.invalidate()
+    with patch("app.services.timeline_cache.time.monotonic", return_value=time.monotonic() + 6):
+        cache.put(None, [], [], None, cache.generation, from_replica=True)
+    assert cache.stats()["pages"] == 1
+
+
+@pytest.mark.asyncio
+async def test_service_marks_replica_reads_when_filling():
+    """Test that list_threads_new tells the cache a page came from the replica."""
+    mock_repo = _repo()
+    db = MagicMock()
+    db.role = "replica"
+    service = ThreadService(db=db)
+    timeline_cache.invalidate()
+
+    with patch("app.services.threads_service.ThreadRepository", return_value=mock_repo):
+        await service.list_threads_new(cursor=None, current_user_id=None)
+        await service.list_threads_new(cursor=None, current_user_id=None)
+
+    assert mock_repo.list_threads_new.call_count == 2
+    assert timeline_cache.stats()["replicaFillsSkipped"] == 2
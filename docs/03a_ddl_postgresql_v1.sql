@@ -50,10 +50,16 @@ CREATE TABLE threads (
   author_id         TEXT NOT NULL REFERENCES users(id),
   title             TEXT NOT NULL,
   body              TEXT NOT NULL,
+  excerpt           TEXT,                                  -- カード用抜粋（作成時に120字で生成、NULLはバックフィル待ち）
+  kind              TEXT CHECK (kind IN ('question','notice','recruit','chat')), -- 種別タグの非正規化（作成時に設定、TLの type= フィルタ用）
   up_count          INTEGER NOT NULL DEFAULT 0,
   save_count        INTEGER NOT NULL DEFAULT 0,
   solved_comment_id TEXT,                                  -- 物理FKなし（アプリで整合）
   heat              INTEGER NOT NULL DEFAULT 0,
+  comment_count     INTEGER NOT NULL DEFAULT 0,            -- 生存コメント数（コメント作成/削除と同一トランザクションで更新）
+  last_reply_at     TIMESTAMPTZ,                           -- 最新の生存コメント時刻（同上、NULL=返信なし）
+  hot_uniq3h        INTEGER NOT NULL DEFAULT 0,            -- 直近3hのユニークコメント者数（定期リフレッシュ）
+  hot_rank          DOUBLE PRECISION NOT NULL DEFAULT -1e9, -- Hot順キー ln(up+0.5*uniq3h)+epoch時間/12（時間減衰で不変）
   created_at        TIMESTAMPTZ NOT NULL DEFAULT now(),
   last_activity_at  TIMESTAMPTZ NOT NULL DEFAULT now(),
   deleted_at        TIMESTAMPTZ
@@ -124,6 +130,17 @@ CREATE TABLE reactions (
   UNIQUE (user_id, target_type, target_id, kind)
 );
 
+-- =========================
+-- ranking_snapshots（Hot/検索の並び固定。RANKING_SNAPSHOT_PERSIST=true 時のみ使用）
+-- =========================
+CREATE TABLE ranking_snapshots (
+  ranking      TEXT NOT NULL,                              -- 'hot' など
+  snapshot_at  TIMESTAMPTZ NOT NULL,                       -- X-Snapshot-At（24h で削除）
+  thread_ids   TEXT[] NOT NULL,                            -- 上位200件のID（順序どおり）
+  created_at   TIMESTAMPTZ NOT NULL DEFAULT now(),
+  PRIMARY KEY (ranking, snapshot_at)
+);
+
 -- =========================
 -- インデックス
 -- =========================
@@ -141,17 +158,49 @@ CREATE INDEX idx_threads_alive_last_activity
   ON threads (last_activity_at)
   WHERE deleted_at IS NULL;
 
+-- TL sort=hot：(hot_rank DESC, created_at DESC, id DESC) のキーセット
+CREATE INDEX idx_threads_alive_hot
+  ON threads (hot_rank DESC, created_at DESC, id DESC)
+  WHERE deleted_at IS NULL;
+
+-- TL type= フィルタ（種別ごとのキーセット、sort=new / sort=hot）
+CREATE INDEX idx_threads_alive_kind_created
+  ON threads (kind, created_at DESC, id DESC)
+  WHERE deleted_at IS NULL;
+
+CREATE INDEX idx_threads_alive_kind_hot
+  ON threads (kind, hot_rank DESC, created_at DESC, id DESC)
+  WHERE deleted_at IS NULL;
+
+-- Hot リフレッシュの対象抽出（uniq3h が残っているスレ）
+CREATE INDEX idx_threads_hot_commenters
+  ON threads (id)
+  WHERE hot_uniq3h > 0;
+
 -- コメント時系列のための部分インデックス
 CREATE INDEX idx_comments_alive_thread_created
   ON comments (thread_id, created_at ASC, id ASC)
   WHERE deleted_at IS NULL;
 
+-- 直近3hのコメント抽出（Hot リフレッシュ）
+CREATE INDEX idx_comments_alive_created
+  ON comments (created_at)
+  WHERE deleted_at IS NULL;
+
 -- タグJOIN/フィルタ軽量化
 CREATE INDEX idx_tags_key_value ON tags(key, value);
 
 -- 補助
 CREATE INDEX idx_threads_last_activity ON threads(last_activity_at);
 
+-- 保存一覧（GET /auth/me/saved）：ユーザーごとの保存時刻 DESC のキーセット
+CREATE INDEX idx_reactions_user_saves
+  ON reactions (user_id, created_at DESC, id DESC)
+  WHERE target_type = 'thread' AND kind = 'save';
+
+-- 期限切れセッションの定期削除（expires_at, id 順のバッチ）
+CREATE INDEX idx_sessions_expires_at ON sessions(expires_at, id);
+
 COMMIT;
 
 -- 備考:
@@ -159,3 +208,15 @@ COMMIT;
 -- - reactions.target_id: thread/comment 両対応のため物理FKなし（アプリで存在検証）
 -- - 文字数や本文長はAPI層で検証（DTO 04a 準拠）
 -- - soft delete: deleted_at IS NULL を基本条件にする（部分Indexが効く）
+-- - threads.excerpt: 既存DBは ALTER TABLE threads ADD COLUMN excerpt TEXT; の後、
+--   backend で python -m app.jobs.excerpt_backfill を1回実行（未バックフィル行は一覧で body から生成）
+-- - threads.hot_uniq3h/hot_rank: 既存DBは列追加後に一度だけ
+--   UPDATE threads SET hot_rank = ln(up_count) + extract(epoch FROM created_at)/43200 WHERE up_count > 0;
+--   （uniq3h は HotScoreRefresher が次回実行時に反映）
+-- - threads.comment_count/last_reply_at: 既存DBは
+--   ALTER TABLE threads ADD COLUMN comment_count INTEGER NOT NULL DEFAULT 0, ADD COLUMN last_reply_at TIMESTAMPTZ;
+--   の後、backend で python -m app.jobs.comment_stats を1回実行（以降のずれは CommentStatsReconciler が定期修復）
+-- - threads.kind: 既存DBは ALTER TABLE threads ADD COLUMN kind TEXT CHECK (kind IN ('question','notice','recruit','chat')); の後、一度だけ
+--   UPDATE threads t SET kind = tg.value FROM tags tg WHERE tg.thread_id = t.id AND tg.key = '種別';
+--   （以降は作成時に種別タグから設定。タグは作成後に変更されない）
+-- - idx_reactions_user_saves: 既存DBは CREATE INDEX CONCURRENTLY idx_reactions_user_saves ... で追加（ロックを避ける）